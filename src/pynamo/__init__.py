@@ -1,10 +1,14 @@
 from .attribute import Attribute
+from .expression import bindparam
 from .model import Model
 from .op import (
+    BatchGetItem,
+    BatchWriteItem,
     DeleteItem,
     GetItem,
     PutItem,
     Query,
+    Scan,
     TransactWriteItems,
     UpdateItem,
 )
@@ -18,14 +22,18 @@ from .table import (
 __all__ = [
     "Table",
     "PrimaryIndex",
+    "BatchGetItem",
+    "BatchWriteItem",
     "DeleteItem",
     "GetItem",
     "PutItem",
     "Query",
+    "Scan",
     "TransactWriteItems",
     "UpdateItem",
     "GlobalSecondaryIndex",
     "LocalSecondaryIndex",
     "Attribute",
+    "bindparam",
     "Model",
 ]
@@ -1,11 +1,11 @@
-from typing import TYPE_CHECKING, Any, Callable, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, Type, Union, cast
 
 if TYPE_CHECKING:
     from .fields import Field
     from .model import Model
 
 
-from .constants import DEFERRED_ATTRIBUTE_KEY, PRIMARY_INDEX
+from .constants import DEFERRED_ATTRIBUTE_KEY, NOT_LOADED, PRIMARY_INDEX
 from .expression import BindParameter, Expression
 
 
@@ -75,6 +75,9 @@ class Attribute:
         self.primary_key = primary_key
         self.nullable = nullable
         self.model_cls: Optional[Type["Model"]] = None
+        # The Python attribute name, which differs from `key` for renamed
+        # attributes. Set by the model's metaclass, like `model_cls`.
+        self.name: Optional[str] = None
 
         self.key = DEFERRED_ATTRIBUTE_KEY
 
@@ -104,26 +107,32 @@ class Attribute:
         if self.primary_key or self.partition_key or self.sort_key:
             self.index_name = index_name or PRIMARY_INDEX
 
+    @staticmethod
+    def _bind(other: Any) -> BindParameter:
+        if isinstance(other, BindParameter):
+            return other
+        return BindParameter(other)
+
     def __eq__(self, other: Any) -> "Expression":  # type: ignore
-        return Expression(self, "=", BindParameter(other))
+        return Expression(self, "=", self._bind(other))
 
     def __lt__(self, other: Any) -> "Expression":
-        return Expression(self, "<", BindParameter(other))
+        return Expression(self, "<", self._bind(other))
 
     def __lte__(self, other: Any) -> "Expression":
-        return Expression(self, "<=", BindParameter(other))
+        return Expression(self, "<=", self._bind(other))
 
     def __gt__(self, other: Any) -> "Expression":
-        return Expression(self, ">", BindParameter(other))
+        return Expression(self, ">", self._bind(other))
 
     def __gte__(self, other: Any) -> "Expression":
-        return Expression(self, ">=", BindParameter(other))
+        return Expression(self, ">=", self._bind(other))
 
     def __add__(self, other: Any) -> "Expression":
-        return Expression(self, "+", BindParameter(other))
+        return Expression(self, "+", self._bind(other))
 
     def __sub__(self, other: Any) -> "Expression":
-        return Expression(self, "-", BindParameter(other))
+        return Expression(self, "-", self._bind(other))
 
     def __repr__(self) -> str:
         return f"Attribute({self.attribute_type}, key={self.key})"
@@ -157,6 +166,18 @@ class InstrumentedAttribute:
 
     def __init__(self, attribute: "Attribute"):
         self.attribute = attribute
+        self.name: str = attribute.key
+        self.column: Optional[str] = None
+
+    def __set_name__(self, owner: Type["Model"], name: str) -> None:
+        self.name = name
+
+    @property
+    def storage_key(self) -> Any:
+        """
+        The key under which the value is stored in the instance storage.
+        """
+        return self.attribute.key
 
     def __get__(
         self,
@@ -167,6 +188,9 @@ class InstrumentedAttribute:
             return self.attribute
         value = instance.__dict__.get(self.attribute.key)
 
+        if value is NOT_LOADED:
+            value = instance.load_attribute(self)
+
         return value
 
     def __set__(
@@ -181,7 +205,67 @@ class InstrumentedAttribute:
                 else:
                     value = self.attribute.default
 
-        instance.__dict__[self.attribute.key] = value
+        vars(instance)[self.attribute.key] = value
+
+    def set_committed_value(self, instance: "Model", value: Any) -> None:
+        """
+        Stores a value loaded from DynamoDB, without applying defaults.
+        """
+        vars(instance)[self.attribute.key] = value
+
+
+class CompactInstrumentedAttribute(InstrumentedAttribute):
+    """
+    An `InstrumentedAttribute` for models declared with `__compact__ = True`.
+
+    Values are stored by position in the instance's `_values` list instead of
+    in the instance `__dict__`.
+
+    Args:
+        attribute (Attribute):
+            The `Attribute` instance being instrumented.
+        slot (int):
+            The position of the value in `_values`.
+    """
+
+    def __init__(self, attribute: "Attribute", slot: int):
+        super().__init__(attribute)
+        self.slot = slot
+
+    @property
+    def storage_key(self) -> Any:
+        return self.slot
+
+    def __get__(
+        self,
+        instance: Optional["Model"],
+        owner: Type["Model"],
+    ) -> Optional[Any]:
+        if instance is None:
+            return self.attribute
+        value = cast(Any, instance)._values[self.slot]
+
+        if value is NOT_LOADED:
+            value = instance.load_attribute(self)
+
+        return value
+
+    def __set__(
+        self,
+        instance: Optional["Model"],
+        value: Optional[Any],
+    ) -> None:
+        if value is None:
+            if self.attribute.default:
+                if callable(self.attribute.default):
+                    value = self.attribute.default()
+                else:
+                    value = self.attribute.default
+
+        instance._values[self.slot] = value  # type: ignore
+
+    def set_committed_value(self, instance: "Model", value: Any) -> None:
+        instance._values[self.slot] = value  # type: ignore
 
 
 __all__ = ["Expression", "BindParameter"]
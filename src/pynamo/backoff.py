@@ -0,0 +1,23 @@
+import random
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = 0.05,
+    cap: float = 5.0,
+) -> float:
+    """
+    Returns the number of seconds to wait before retry number `attempt`.
+
+    Uses exponential backoff with full jitter, which is what AWS recommends
+    for resubmitting unprocessed batch items.
+
+    Args:
+        attempt (int): The retry number, starting at 1.
+        base (float): The delay ceiling of the first retry.
+        cap (float): The maximum delay ceiling.
+
+    Returns:
+        float: A random delay between 0 and min(cap, base * 2 ** attempt).
+    """
+    return random.uniform(0, min(cap, base * 2**attempt))
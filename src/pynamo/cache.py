@@ -0,0 +1,193 @@
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .op.batch_get_item import key_identity
+
+# (value, expiry time, table generation when it was stored)
+CacheEntry = Tuple[Any, Optional[float], int]
+
+
+class _Shard:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.entries: "OrderedDict[Any, CacheEntry]" = OrderedDict()
+
+
+class ReadCache:
+    """
+    A read cache shared by every session of a `SessionMaker`, in the spirit
+    of a local DAX.
+
+    It holds the raw DynamoDB items read by `GetItem`, by table and key, and
+    by `Query`, by request. Each session hydrates its own instances from
+    them, so the cached items must not be modified.
+
+    A write of a key through any session of the maker (`save()`,
+    `execute(PutItem)`, `execute(BatchWriteItem)`) drops the cached item and
+    every cached query of its table.
+
+    Entries are spread over `shards` independently locked shards, each
+    evicting its least recently used entries, so readers of different keys
+    rarely wait for one another.
+
+    eg:
+        SessionMaker(client_factory, cache=ReadCache(max_size=10000, ttl=30))
+
+    Args:
+        max_size (int): The number of entries above which the least
+            recently used ones are evicted, spread evenly over the shards.
+        ttl (Optional[float]): The number of seconds an entry is served for.
+        shards (int): The number of independently locked shards.
+        clock (Callable[[], float]): The time source of `ttl`.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl: Optional[float] = 60.0,
+        shards: int = 16,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_size < shards:
+            raise ValueError("max_size must be at least the number of shards")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._shards = [_Shard() for _ in range(shards)]
+        self._shard_size = max_size // shards
+
+        # Bumped by every write of a table, which invalidates its queries and
+        # the reads that were in flight during the write.
+        self._generations: Dict[str, int] = {}
+        self._generations_lock = threading.Lock()
+
+        # The GetItem requests in progress in async sessions, by event loop
+        # and key, which concurrent reads of the same key wait for.
+        self.in_flight: Dict[Any, "asyncio.Future[Any]"] = {}
+
+    def _shard(self, cache_key: Any) -> _Shard:
+        return self._shards[hash(cache_key) % len(self._shards)]
+
+    def token(self, table_name: str) -> int:
+        """
+        Returns the write generation of a table. Take it before reading from
+        DynamoDB and pass it to `put_item` or `put_query`, so the result of a
+        read that raced with a write is not stored.
+        """
+        return self._generations.get(table_name, 0)
+
+    def _get(self, table_name: str, cache_key: Any, query: bool) -> Any:
+        shard = self._shard(cache_key)
+
+        with shard.lock:
+            entry = shard.entries.get(cache_key)
+            if entry is not None:
+                value, expires_at, generation = entry
+                if (expires_at is not None and self.clock() >= expires_at) or (
+                    query and generation != self.token(table_name)
+                ):
+                    del shard.entries[cache_key]
+                    self.evictions += 1
+                else:
+                    shard.entries.move_to_end(cache_key)
+                    self.hits += 1
+                    return value
+
+            self.misses += 1
+            return None
+
+    def _put(
+        self,
+        table_name: str,
+        cache_key: Any,
+        value: Any,
+        token: int,
+    ) -> None:
+        expires_at = None if self.ttl is None else self.clock() + self.ttl
+        shard = self._shard(cache_key)
+
+        # Checked under the lock `invalidate` takes to drop the key, so a
+        # write either refuses the value or drops it once stored.
+        with shard.lock:
+            if token != self.token(table_name):
+                return
+
+            shard.entries[cache_key] = (value, expires_at, token)
+            shard.entries.move_to_end(cache_key)
+
+            while len(shard.entries) > self._shard_size:
+                shard.entries.popitem(last=False)
+                self.evictions += 1
+
+    @staticmethod
+    def _query_key(request: Dict[str, Any]) -> Tuple[str, str]:
+        return ("query", json.dumps(request, sort_keys=True, default=str))
+
+    def get_item(
+        self,
+        table_name: str,
+        key: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        return self._get(table_name, key_identity(table_name, key), False)
+
+    def put_item(
+        self,
+        table_name: str,
+        key: Dict[str, Any],
+        item: Dict[str, Any],
+        token: int,
+    ) -> None:
+        self._put(table_name, key_identity(table_name, key), item, token)
+
+    def get_query(
+        self,
+        request: Dict[str, Any],
+    ) -> Optional[List[Dict[str, Any]]]:
+        return self._get(request["TableName"], self._query_key(request), True)
+
+    def put_query(
+        self,
+        request: Dict[str, Any],
+        items: List[Dict[str, Any]],
+        token: int,
+    ) -> None:
+        self._put(request["TableName"], self._query_key(request), items, token)
+
+    def invalidate(self, table_name: str, key: Dict[str, Any]) -> None:
+        """
+        Drops the cached item of a key, and every cached query of its table.
+        """
+        with self._generations_lock:
+            self._generations[table_name] = self.token(table_name) + 1
+
+        cache_key = key_identity(table_name, key)
+        shard = self._shard(cache_key)
+
+        with shard.lock:
+            shard.entries.pop(cache_key, None)
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the counters and the current size.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": sum(len(shard.entries) for shard in self._shards),
+        }
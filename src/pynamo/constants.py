@@ -1,2 +1,10 @@
 DEFERRED_ATTRIBUTE_KEY = "__deferred_attr_key_"
 PRIMARY_INDEX = "__primary_idx__"
+
+# Placeholder stored for attributes of lazily hydrated instances that have
+# not been deserialized yet.
+NOT_LOADED: object = object()
+
+# Placeholder in the snapshot of a constructed instance for attributes that
+# have not been assigned yet: their first assignment is not a change.
+NOT_ASSIGNED: object = object()
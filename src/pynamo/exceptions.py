@@ -0,0 +1,42 @@
+from typing import Any, Dict
+
+
+class UnprocessedItemsError(Exception):
+    """
+    Raised when DynamoDB keeps returning unprocessed items or keys for a batch
+    request after all retries have been used.
+
+    Args:
+        request_items (dict): The remaining `RequestItems` payload, which can
+            be resubmitted as is.
+    """
+
+    def __init__(self, request_items: Dict[str, Any]):
+        super().__init__(
+            "batch request still had unprocessed items after retrying"
+        )
+        self.request_items = request_items
+
+
+class RequestLimitError(Exception):
+    """
+    Raised when a request exceeds a DynamoDB limit on its number of items or
+    on its size, and cannot be split.
+    """
+
+
+class FlushError(Exception):
+    """
+    Raised by `save()` and `FlushReport.raise_for_errors` when writes of a
+    flush failed.
+
+    Args:
+        report (FlushReport): The report of the flush.
+    """
+
+    def __init__(self, report: Any):
+        errors = report.errors
+        super().__init__(
+            f"{len(errors)} of {len(report)} writes failed: {errors[0].error!r}"
+        )
+        self.report = report
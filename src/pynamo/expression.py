@@ -1,18 +1,32 @@
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
     from .attribute import Attribute
 
 
 class BindParameter:
-    def __init__(self, value: Any):
+    def __init__(self, value: Any = None, key: Optional[str] = None):
         self._value = value
+        self.key = key
 
     @property
     def value(self) -> Any:
         return self._value
 
 
+def bindparam(key: str) -> BindParameter:
+    """
+    A named placeholder whose value is supplied when the statement is
+    executed.
+
+    eg:
+        find_user = Query(User).where(User.id == bindparam("id"))
+
+        session.execute(find_user.params(id="123"))
+    """
+    return BindParameter(key=key)
+
+
 class Expression:
     def __init__(self, left: "Attribute", operator: str, right: BindParameter):
         self.left = left
@@ -0,0 +1,77 @@
+from typing import TYPE_CHECKING, Any, List, Optional, Union
+
+if TYPE_CHECKING:
+    from .op import DeleteItem, PutItem, UpdateItem
+
+from .exceptions import FlushError
+
+
+class WriteResult:
+    """
+    The outcome of one write of a flush.
+
+    Args:
+        op (Union[PutItem, UpdateItem, DeleteItem]): The write.
+        response (Any): The response of the request that sent the write, when
+            it succeeded.
+        error (Optional[Exception]): The exception raised by the request that
+            sent the write, when it failed.
+        superseded (bool): The write was not sent, because a later write of
+            the same key in the flush replaced it.
+    """
+
+    def __init__(
+        self,
+        op: Union["PutItem", "UpdateItem", "DeleteItem"],
+        response: Any = None,
+        error: Optional[Exception] = None,
+        superseded: bool = False,
+    ):
+        self.op = op
+        self.response = response
+        self.error = error
+        self.superseded = superseded
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        if self.superseded:
+            outcome = "superseded"
+        else:
+            outcome = "ok" if self.ok else repr(self.error)
+        return f"WriteResult({self.op.__class__.__name__}, {outcome})"
+
+
+class FlushReport:
+    """
+    The outcome of a flush with the "batch" strategy: one `WriteResult` per
+    pending change.
+
+    The requests of a flush are independent, so a failed request does not
+    stop the others. `save()` raises `FlushError` afterwards, unless it is
+    called with `raise_on_errors=False`, in which case check `ok` or call
+    `raise_for_errors()`.
+    """
+
+    def __init__(self, results: List[WriteResult]):
+        self.results = results
+
+    @property
+    def errors(self) -> List[WriteResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def ok(self) -> bool:
+        return all(result.ok for result in self.results)
+
+    def raise_for_errors(self) -> None:
+        """
+        Raises `FlushError` if any write failed.
+        """
+        if not self.ok:
+            raise FlushError(self)
+
+    def __len__(self) -> int:
+        return len(self.results)
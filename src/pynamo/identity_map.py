@@ -0,0 +1,262 @@
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from .model import Model
+
+
+class IdentityMap(MutableMapping[Any, "Model"]):
+    """
+    The objects loaded or added by a session, by `Model.ref`.
+
+    By default it grows without bounds, like a dict. With `max_size`, the
+    least recently used objects are evicted once it holds more than
+    `max_size` objects, and with `ttl`, objects are dropped when they are
+    looked up more than `ttl` seconds after they were stored. Objects for
+    which `pinned(obj)` is true are never evicted nor dropped; sessions pin
+    their pending and modified objects.
+
+    Evicted objects are no longer served, but the map keeps weak references
+    to them: as long as they are referenced elsewhere, `objects()` returns
+    them, so a session still saves the changes made to them afterwards.
+
+    Objects stored with `setdefault_weak`, such as the items of a streamed
+    query, are only held weakly: they are served while they are referenced
+    elsewhere, and do not count towards `max_size`.
+
+    A weakly held object is held strongly again from the first assignment
+    of one of its attributes, until `release()`, which sessions call once
+    they saved it, so its changes are saved even once nothing else
+    references it. Values changed in place are only
+    seen while the object is referenced elsewhere.
+
+    Lookups count `hits` and `misses`, and `evictions` counts the objects
+    evicted or dropped, so a session can be used as a bounded read-through
+    cache.
+
+    eg:
+        SessionMaker(
+            client_factory,
+            identity_map_factory=lambda: IdentityMap(max_size=10000, ttl=60),
+        )
+
+    Args:
+        max_size (Optional[int]): The number of objects above which the
+            least recently used ones are evicted.
+        ttl (Optional[float]): The number of seconds an object is served
+            for after it was stored.
+        clock (Callable[[], float]): The time source of `ttl`.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.pinned: Callable[["Model"], bool] = lambda obj: False
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # ref -> (object, expiry time), least recently used first.
+        self._entries: "OrderedDict[Any, Tuple[Model, Optional[float]]]" = (
+            OrderedDict()
+        )
+        # The evicted objects still referenced elsewhere, by id.
+        self._evicted: "weakref.WeakValueDictionary[int, Model]" = (
+            weakref.WeakValueDictionary()
+        )
+        # The objects stored with `setdefault_weak`, by ref.
+        self._weak: "weakref.WeakValueDictionary[Any, Model]" = (
+            weakref.WeakValueDictionary()
+        )
+        # The weakly held objects assigned since, by id.
+        self._assigned: Dict[int, "Model"] = {}
+        self._lock = threading.RLock()
+
+    def _expired(self, entry: Tuple["Model", Optional[float]]) -> bool:
+        obj, expires_at = entry
+        return (
+            expires_at is not None
+            and self.clock() >= expires_at
+            and not self.pinned(obj)
+        )
+
+    def _lookup(self, ref: Any) -> Optional["Model"]:
+        entry = self._entries.get(ref)
+        if entry is None:
+            return self._weak.get(ref)
+
+        if self._expired(entry):
+            self._drop(ref)
+            return None
+
+        self._entries.move_to_end(ref)
+        return entry[0]
+
+    def __getitem__(self, ref: Any) -> "Model":
+        with self._lock:
+            obj = self._lookup(ref)
+            if obj is None:
+                self.misses += 1
+                raise KeyError(ref)
+
+            self.hits += 1
+            return obj
+
+    def __contains__(self, ref: object) -> bool:
+        with self._lock:
+            return self._lookup(ref) is not None
+
+    def __setitem__(self, ref: Any, obj: "Model") -> None:
+        expires_at = None if self.ttl is None else self.clock() + self.ttl
+
+        with self._lock:
+            self._entries[ref] = (obj, expires_at)
+            self._entries.move_to_end(ref)
+            self._evicted.pop(id(obj), None)
+            self._assigned.pop(id(obj), None)
+
+            weak = self._weak.pop(ref, None)
+            if weak is not None and weak is not obj:
+                self._evicted[id(weak)] = weak
+
+            if self.max_size is not None and len(self._entries) > self.max_size:
+                self._evict(ref, self.max_size)
+
+    def setdefault_weak(self, ref: Any, obj: "Model") -> "Model":
+        """
+        Returns the object stored for `ref`, or stores `obj` with a weak
+        reference only and returns it.
+        """
+        with self._lock:
+            stored = self._lookup(ref)
+            if stored is not None:
+                return stored
+
+            self._weak[ref] = obj
+            self._watch(obj)
+            return obj
+
+    def _watch(self, obj: "Model") -> None:
+        object.__setattr__(obj, "_on_assign", self._hold)
+        if obj.maybe_modified:
+            self._hold(obj)
+
+    def _hold(self, obj: "Model") -> None:
+        with self._lock:
+            self._assigned[id(obj)] = obj
+
+    def release(self, obj: "Model") -> None:
+        """
+        Holds a saved object weakly again, if it was only held because it
+        was assigned, and evicts the objects above `max_size` that are no
+        longer pinned.
+        """
+        with self._lock:
+            self._assigned.pop(id(obj), None)
+
+            if self.max_size is not None and len(self._entries) > self.max_size:
+                self._evict(None, self.max_size)
+
+    def _drop(self, ref: Any) -> None:
+        obj, _ = self._entries.pop(ref)
+        self._evicted[id(obj)] = obj
+        self._watch(obj)
+        self.evictions += 1
+
+    def _evict(self, keep: Any, max_size: int) -> None:
+        for ref in list(self._entries):
+            if len(self._entries) <= max_size:
+                return
+
+            if ref == keep or self.pinned(self._entries[ref][0]):
+                continue
+
+            self._drop(ref)
+
+    def __delitem__(self, ref: Any) -> None:
+        with self._lock:
+            del self._entries[ref]
+
+    def discard(self, ref: Any) -> None:
+        """
+        Forgets the object of a deleted item, including its evicted copies,
+        so it is not updated afterwards.
+        """
+        with self._lock:
+            self._entries.pop(ref, None)
+            self._weak.pop(ref, None)
+            for key, obj in list(self._evicted.items()):
+                if obj.ref == ref:
+                    self._evicted.pop(key, None)
+            for key, obj in list(self._assigned.items()):
+                if obj.ref == ref:
+                    del self._assigned[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def objects(self) -> List["Model"]:
+        """
+        Returns the stored objects, and the evicted objects still referenced
+        elsewhere, without counting lookups nor refreshing their recency.
+        """
+        with self._lock:
+            objs = [obj for obj, _ in self._entries.values()]
+            objs.extend(self._weak.values())
+            stored = {id(obj) for obj in objs}
+            for key, obj in [
+                *self._evicted.items(),
+                *self._assigned.items(),
+            ]:
+                if key not in stored:
+                    stored.add(key)
+                    objs.append(obj)
+            return objs
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._evicted.clear()
+            self._weak.clear()
+            self._assigned.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the counters and the current size.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+        }
+
+    def __repr__(self) -> str:
+        return f"IdentityMap({self.stats()})"
@@ -1 +1,77 @@
+import json
+from typing import Any, Dict
+
+from .exceptions import RequestLimitError
+
 TRANSACT_WRITE_ITEMS = 100
+TRANSACT_WRITE_ITEMS_REQUEST_SIZE = 4 * 1024 * 1024
+BATCH_GET_ITEM = 100
+BATCH_WRITE_ITEM = 25
+BATCH_WRITE_ITEM_REQUEST_SIZE = 16 * 1024 * 1024
+
+
+def attribute_value_size(value: Dict[str, Any]) -> int:
+    """
+    Approximates the size in bytes DynamoDB bills for an attribute value
+    such as {"S": "blah"}.
+    """
+    descriptor, raw = next(iter(value.items()))
+
+    if descriptor in ("NULL", "BOOL"):
+        return 1
+    if descriptor == "S":
+        return len(raw.encode("utf-8"))
+    if descriptor == "N":
+        return len(str(raw))
+    if descriptor == "B":
+        return len(raw)
+    if descriptor in ("SS", "NS"):
+        return sum(len(str(v).encode("utf-8")) for v in raw)
+    if descriptor == "BS":
+        return sum(len(v) for v in raw)
+    if descriptor == "L":
+        return 3 + sum(attribute_value_size(v) + 1 for v in raw)
+    if descriptor == "M":
+        return 3 + item_size(raw) + len(raw)
+    raise TypeError(descriptor)
+
+
+def item_size(item: Dict[str, Any]) -> int:
+    """
+    Approximates the size in bytes of a DynamoDB item: the length of each
+    attribute name plus the size of its value.
+    """
+    return sum(
+        len(name.encode("utf-8")) + attribute_value_size(value)
+        for name, value in item.items()
+    )
+
+
+def request_size(request: Dict[str, Any]) -> int:
+    """
+    Returns the size in bytes of a request payload serialized to JSON, as it
+    is sent to DynamoDB.
+    """
+    return len(
+        json.dumps(request, separators=(",", ":"), default=str).encode("utf-8")
+    )
+
+
+def check_transact_write_items(request: Dict[str, Any]) -> None:
+    """
+    Raises `RequestLimitError` if a TransactWriteItems request has too many
+    items or is too large.
+    """
+    count = len(request["TransactItems"])
+    if count > TRANSACT_WRITE_ITEMS:
+        raise RequestLimitError(
+            f"TransactWriteItems request has {count} items, "
+            f"the limit is {TRANSACT_WRITE_ITEMS}"
+        )
+
+    size = request_size(request)
+    if size > TRANSACT_WRITE_ITEMS_REQUEST_SIZE:
+        raise RequestLimitError(
+            f"TransactWriteItems request is {size} bytes, "
+            f"the limit is {TRANSACT_WRITE_ITEMS_REQUEST_SIZE}"
+        )
@@ -1,6 +1,10 @@
 from typing import (
+    AbstractSet,
     Any,
+    Callable,
     Dict,
+    Iterable,
+    List,
     Optional,
     Set,
     Tuple,
@@ -8,19 +12,174 @@ from typing import (
     cast,
 )
 
-from .attribute import Attribute, InstrumentedAttribute
-from .constants import DEFERRED_ATTRIBUTE_KEY, PRIMARY_INDEX
+from .attribute import (
+    Attribute,
+    CompactInstrumentedAttribute,
+    InstrumentedAttribute,
+)
+from .constants import (
+    DEFERRED_ATTRIBUTE_KEY,
+    NOT_ASSIGNED,
+    NOT_LOADED,
+    PRIMARY_INDEX,
+)
 from .table import Table
 
 models: Dict[str, Any] = {}
 
+# Shared by read-only instances, which are never modified.
+NO_CHANGES: AbstractSet[str] = frozenset()
+
+# (attribute name, storage key, column names, serialize, dynamodb descriptor,
+#  prefix, nullable, is partition/sort key, index name)
+SerializerEntry = Tuple[
+    str,
+    str,
+    Tuple[str, ...],
+    Callable[[Any], Any],
+    str,
+    Optional[str],
+    Optional[bool],
+    bool,
+    Optional[str],
+]
+
+
+def _build_serializer_plan(model_cls: Any) -> Tuple[SerializerEntry, ...]:
+    """
+    Resolves, once per model, everything `Model.to_dynamodb_item` needs to
+    know about each attribute.
+    """
+    plan: List[SerializerEntry] = []
+
+    for key, attr in model_cls.__dict__.items():
+        if not isinstance(attr, InstrumentedAttribute):
+            continue
+
+        attribute = attr.attribute
+        columns = tuple(
+            col
+            for col in model_cls.forward_mapped_columns(attribute.key)
+            if col
+        )
+
+        plan.append(
+            (
+                key,
+                attr.storage_key,
+                columns,
+                attribute.attribute_type.serialize,
+                attribute.attribute_type.dynamodb_descriptor,
+                attribute.prefix,
+                attribute.nullable,
+                bool(attribute.partition_key or attribute.sort_key),
+                attribute.index_name,
+            )
+        )
+
+    return tuple(plan)
+
+
+# (position in __serializer_plan__, storage key, deserialize, prefix)
+DeserializerEntry = Tuple[int, Any, Callable[[Any], Any], Optional[str]]
+
+
+def _build_deserializer_plan(model_cls: Any) -> Dict[str, DeserializerEntry]:
+    """
+    Maps each DynamoDB column of a model to the attribute it hydrates.
+    """
+    plan: Dict[str, DeserializerEntry] = {}
+
+    attrs = [
+        attr
+        for attr in model_cls.__dict__.values()
+        if isinstance(attr, InstrumentedAttribute)
+    ]
+
+    for position, attr in enumerate(attrs):
+        attribute = attr.attribute
+        for col in model_cls.forward_mapped_columns(attribute.key):
+            if col:
+                plan[col] = (
+                    position,
+                    attr.storage_key,
+                    attribute.attribute_type.deserialize,
+                    attribute.prefix,
+                )
+
+    return plan
+
+
+# (attribute name, column name, deserialize, serialize, dynamodb descriptor,
+#  prefix)
+KeyEntry = Tuple[
+    str,
+    str,
+    Callable[[Any], Any],
+    Callable[[Any], Any],
+    str,
+    Optional[str],
+]
+
+# (model name, partition key value, sort key value), as in `Model.ref`
+Ref = Tuple[str, Any, Any]
+
+
+def _build_key_plan(model_cls: Any) -> Tuple[KeyEntry, ...]:
+    """
+    Resolves, once per model, the attributes of its primary key, partition
+    key first.
+    """
+    if model_cls.__table__ is None:
+        return ()
+
+    plan: List[KeyEntry] = []
+
+    # The reverse mapper gives attribute keys, which differ from the Python
+    # attribute names for renamed attributes.
+    names: Dict[str, str] = {
+        attr.attribute.key: name
+        for name, attr in model_cls.__dict__.items()
+        if isinstance(attr, InstrumentedAttribute)
+    }
+
+    for col in model_cls.__table__.indexes[PRIMARY_INDEX]:
+        if not col:
+            continue
+        key: Optional[str] = model_cls.__reverse_table_mapper__.get(col)
+        if key is None:
+            continue
+
+        name = names.get(key, key)
+        attribute = model_cls.__dict__[name].attribute
+        plan.append(
+            (
+                name,
+                col,
+                attribute.attribute_type.deserialize,
+                attribute.attribute_type.serialize,
+                attribute.attribute_type.dynamodb_descriptor,
+                attribute.prefix,
+            )
+        )
+
+    return tuple(plan)
+
 
 class BaseMeta(type):
     __table__: Optional[Table] = None
     __abstract__: bool = False
     __forward_table_mapper__: Dict[str, Tuple[Any]] = {}
     __reverse_table_mapper__: Dict[Any, str] = {}
+    __serializer_plan__: Tuple[SerializerEntry, ...] = ()
+    __deserializer_plan__: Dict[str, DeserializerEntry] = {}
+    __key_plan__: Tuple[KeyEntry, ...] = ()
+    # The expression templates compiled by the ops, by op and shape. Kept
+    # on the model, so they go away with it.
+    __templates__: Dict[Any, Any] = {}
     __index_name__: Optional[str] = None
+    __compact__: bool = False
+    __lazy__: bool = False
 
     def __new__(  # type: ignore
         cls,
@@ -33,6 +192,7 @@ class BaseMeta(type):
         if not dct.get("__table__"):
             dct["__forward_table_mapper__"] = {}
             dct["__reverse_table_mapper__"] = {}
+            dct["__templates__"] = {}
             return super().__new__(cls, name, bases, dct)
 
         dct["__abstract__"] = False
@@ -61,6 +221,8 @@ class BaseMeta(type):
 
         dct = {**inherited_attrs, **dct}
 
+        compact = bool(dct.get("__compact__"))
+
         new_attrs: Dict[str, InstrumentedAttribute] = {}
 
         for key, value in dct.items():
@@ -68,6 +230,7 @@ class BaseMeta(type):
                 continue
             if value.key == DEFERRED_ATTRIBUTE_KEY:
                 value.key = key
+            value.name = key
 
             if value.key in dupe_attr_checker:
                 raise TypeError(f"duplicate attribute key: {value.key}")
@@ -165,7 +328,12 @@ class BaseMeta(type):
                 forward_table_mapper[value.key] = (value.key, None)
                 reverse_table_mapper[value.key] = value.key
 
-            new_attrs[key] = InstrumentedAttribute(value)
+            if compact:
+                new_attrs[key] = CompactInstrumentedAttribute(
+                    value, len(new_attrs)
+                )
+            else:
+                new_attrs[key] = InstrumentedAttribute(value)
 
         if PRIMARY_INDEX not in index_map:
             raise ValueError("primary index could not be mapped")
@@ -193,43 +361,142 @@ class BaseMeta(type):
         dct["__table__"] = table
         dct["__forward_table_mapper__"] = forward_table_mapper
         dct["__reverse_table_mapper__"] = reverse_table_mapper
+        if compact and not any(hasattr(base, "_values") for base in bases):
+            dct["__slots__"] = (
+                "_values",
+                "_raw_item",
+                "_snapshot",
+                "_readonly",
+                "_assigned",
+                "_on_assign",
+                "__weakref__",
+            )
         model_class = super().__new__(cls, name, bases, dct)
 
         for _, value in model_class.__dict__.items():
             if isinstance(value, InstrumentedAttribute):
                 value.attribute.model_cls = cast(Type["Model"], model_class)
+                columns: Tuple[Optional[str], ...] = forward_table_mapper[
+                    value.attribute.key
+                ]
+                value.column = next(filter(None, columns), None)
+
+        model_class.__serializer_plan__ = _build_serializer_plan(model_class)
+        model_class.__deserializer_plan__ = _build_deserializer_plan(
+            model_class
+        )
+        model_class.__key_plan__ = _build_key_plan(model_class)
+        model_class.__templates__ = {}
 
         return model_class
 
 
 class Model(metaclass=BaseMeta):
+    """
+    Base class of all models.
+
+    Setting `__compact__ = True` on a model stores its values in a list held
+    in `__slots__` instead of in a per-instance `__dict__`, which uses much
+    less memory per instance. Compact instances cannot hold attributes that
+    are not declared on the model.
+
+    Setting `__lazy__ = True` makes `from_dynamodb_items` keep the raw
+    DynamoDB item and deserialize each attribute on first access only.
+
+    Instances hydrated with `readonly=True` carry no change tracking state
+    and cannot be modified until `track()` is called.
+    """
+
+    # Subclasses get a __dict__ unless they are compact.
+    __slots__ = ()
+
     __abstract__: Optional[bool] = False
     __table__: Optional[Table] = None
     __index_name__: Optional[str] = None
+    __compact__: bool = False
+    __lazy__: bool = False
+
+    # The raw DynamoDB item of a lazily hydrated instance.
+    _raw_item: Optional[Dict[str, Any]] = None
+    # The serialized values the instance was constructed or hydrated with,
+    # in `__serializer_plan__` order. Lazily hydrated instances have none:
+    # their original values are read from `_raw_item`.
+    _snapshot: Optional[Tuple[Any, ...]] = None
+    _readonly: bool = False
+    # Whether an attribute was assigned since the instance was constructed
+    # or hydrated.
+    _assigned: bool = False
+    # Called on that first assignment, set by the identity maps holding the
+    # instance weakly.
+    _on_assign: Optional[Callable[["Model"], None]] = None
 
     def __init__(self, **kwargs: Any):
-        self._original_state: Dict[str, Any] = {}
-        self.modified_attrs: Set[str] = set()
+        if self.__compact__:
+            object.__setattr__(
+                self, "_values", [None] * len(self.__serializer_plan__)
+            )
+            object.__setattr__(self, "_raw_item", None)
+            object.__setattr__(self, "_snapshot", None)
+            object.__setattr__(self, "_readonly", False)
+            object.__setattr__(self, "_assigned", False)
+            object.__setattr__(self, "_on_assign", None)
 
         for key, val in kwargs.items():
             self.__setattr__(key, val)
 
+        object.__setattr__(
+            self, "_snapshot", self._take_snapshot(kwargs.keys())
+        )
+        object.__setattr__(self, "_assigned", False)
+
     def __setattr__(self, name: str, val: Any) -> None:
+        if self._readonly:
+            raise AttributeError(
+                f"{self.__class__.__name__} instance is read-only"
+            )
+
         attr = self.__class__.__dict__.get(name, None)
 
         if isinstance(attr, InstrumentedAttribute):
-            deserialized = attr.attribute.attribute_type.deserialize(val)
-            if name in self._original_state:
-                if self._original_state[name] != deserialized:
-                    self.modified_attrs.add(name)
-            else:
-                self._original_state[name] = deserialized
-
-            object.__setattr__(self, name, deserialized)
-        else:
-            # Normal instance attributes should be set directly
+            val = attr.attribute.attribute_type.deserialize(val)
             object.__setattr__(self, name, val)
 
+            if not self._assigned and not self._assign_first(name):
+                object.__setattr__(self, "_assigned", True)
+                if self._on_assign is not None:
+                    self._on_assign(self)
+            return
+
+        object.__setattr__(self, name, val)
+
+    def _assign_first(self, name: str) -> bool:
+        """
+        Makes the first assignment of an attribute of a constructed instance
+        its original value, since it is not a change.
+
+        Returns:
+            bool: Whether it was the first assignment.
+        """
+        snapshot = self._snapshot
+        if snapshot is None or NOT_ASSIGNED not in snapshot:
+            return False
+
+        for position, entry in enumerate(self.__class__.__serializer_plan__):
+            if entry[0] != name:
+                continue
+            if snapshot[position] is not NOT_ASSIGNED:
+                return False
+
+            value = entry[3](self._value_getter()(entry[1]))
+            object.__setattr__(
+                self,
+                "_snapshot",
+                (*snapshot[:position], value, *snapshot[position + 1 :]),
+            )
+            return True
+
+        return False
+
     @staticmethod
     def extract_dynamodb_value(attr_dict: Dict[str, Any]) -> Optional[str]:
         """
@@ -250,37 +517,218 @@ class Model(metaclass=BaseMeta):
 
         return next(iter(attr_dict.values()), None)
 
-    @classmethod
-    def from_dynamodb_item(cls, item_dict: Dict[str, Any]) -> "Model":
-        if cls.__table__ is None:
-            raise TypeError("__table__ required")
+    def _value_getter(self) -> Callable[[Any], Any]:
+        if self.__compact__:
+            return self._values.__getitem__  # type: ignore
+        return self.__dict__.get
+
+    def _take_snapshot(
+        self,
+        assigned: Optional[AbstractSet[str]] = None,
+    ) -> Tuple[Any, ...]:
+        get_value = self._value_getter()
+        return tuple(
+            entry[3](get_value(entry[1]))
+            if assigned is None or entry[0] in assigned
+            else NOT_ASSIGNED
+            for entry in self.__class__.__serializer_plan__
+        )
 
-        instance = cls()
+    def _raw_value(
+        self,
+        column: Optional[str],
+        prefix: Optional[str],
+    ) -> Any:
+        raw_item = self._raw_item or {}
 
-        for key, value in item_dict.items():
-            mapped_key = cls.__reverse_table_mapper__.get(key, key)
+        value = self.extract_dynamodb_value(raw_item.get(column or "", {}))
+        if prefix and value and value.startswith(prefix):
+            value = value[len(prefix) :]
+        return value
 
-            if not hasattr(cls, mapped_key):
-                continue
+    def load_attribute(self, attr: InstrumentedAttribute) -> Any:
+        """
+        Deserializes an attribute of a lazily hydrated instance from its raw
+        DynamoDB item.
+        """
+        value = attr.attribute.attribute_type.deserialize(
+            self._raw_value(attr.column, attr.attribute.prefix)
+        )
+        attr.set_committed_value(self, value)
+        return value
+
+    def _set_state(
+        self,
+        values: Any,
+        raw_item: Optional[Dict[str, Any]],
+        snapshot: Optional[Tuple[Any, ...]],
+        readonly: bool,
+    ) -> None:
+        if self.__compact__:
+            object.__setattr__(self, "_values", values)
+            object.__setattr__(self, "_raw_item", raw_item)
+            object.__setattr__(self, "_snapshot", snapshot)
+            object.__setattr__(self, "_readonly", readonly)
+            object.__setattr__(self, "_assigned", False)
+            object.__setattr__(self, "_on_assign", None)
+        else:
+            state = vars(self)
+            state.update(values)
+            if raw_item is not None:
+                state["_raw_item"] = raw_item
+            if snapshot is not None:
+                state["_snapshot"] = snapshot
+            if readonly:
+                state["_readonly"] = True
 
-            inst_attribute = cls.__dict__[mapped_key]
+    @property
+    def is_readonly(self) -> bool:
+        return self._readonly
 
-            if not isinstance(inst_attribute, InstrumentedAttribute):
-                continue
+    @property
+    def maybe_modified(self) -> bool:
+        """
+        Whether an attribute was assigned since the instance was constructed
+        or hydrated.
+
+        It is much cheaper than `modified_attrs`, but does not see values
+        changed in place, and stays true when the original value is assigned
+        back.
+        """
+        return self._assigned
+
+    def track(self) -> "Model":
+        """
+        Turns a read-only instance into a tracked one, using its current
+        values as the original state, so it can be modified and added to a
+        session.
+        """
+        if self._readonly:
+            object.__setattr__(self, "_readonly", False)
+            if self._raw_item is None:
+                object.__setattr__(self, "_snapshot", self._take_snapshot())
+        return self
+
+    def mark_written(self, attrs: Optional[AbstractSet[str]] = None) -> None:
+        """
+        Makes the current values the original state, once they are written.
+
+        Args:
+            attrs (Optional[AbstractSet[str]]): The attributes written, when
+                not all of them were.
+        """
+        get_value = self._value_getter()
+        snapshot = self._snapshot
+
+        originals: List[Any] = []
+        for position, entry in enumerate(self.__class__.__serializer_plan__):
+            value = get_value(entry[1])
+            if value is not NOT_LOADED and (attrs is None or entry[0] in attrs):
+                originals.append(entry[3](value))
+            elif snapshot is not None:
+                originals.append(snapshot[position])
+            else:
+                columns = entry[2]
+                originals.append(
+                    self._raw_value(columns[0] if columns else None, entry[5])
+                )
+
+        object.__setattr__(self, "_snapshot", tuple(originals))
+        object.__setattr__(
+            self,
+            "_assigned",
+            attrs is not None and bool(self.modified_attrs),
+        )
 
-            value = instance.extract_dynamodb_value(value)
+    @classmethod
+    def from_dynamodb_item(
+        cls,
+        item_dict: Dict[str, Any],
+        lazy: Optional[bool] = None,
+        readonly: bool = False,
+    ) -> "Model":
+        return cls.from_dynamodb_items(
+            [item_dict], lazy=lazy, readonly=readonly
+        )[0]
+
+    @classmethod
+    def from_dynamodb_items(
+        cls,
+        items: Iterable[Dict[str, Any]],
+        lazy: Optional[bool] = None,
+        readonly: bool = False,
+    ) -> List["Model"]:
+        """
+        Hydrates DynamoDB items into model instances.
+
+        Values are written straight into instance storage using the model's
+        precomputed deserializer plan. Attributes missing from an item are set
+        to None; defaults are only applied to newly constructed objects.
+
+        Args:
+            items (Iterable[dict]): The DynamoDB items.
+            lazy (Optional[bool]): Keep the raw items and deserialize each
+                attribute on first access. Defaults to the model's `__lazy__`.
+            readonly (bool): Return read-only instances, without change
+                tracking state.
+        """
+        if cls.__table__ is None:
+            raise TypeError("__table__ required")
 
-            if inst_attribute.attribute.prefix:
-                if value and value.startswith(inst_attribute.attribute.prefix):
-                    value = value[len(inst_attribute.attribute.prefix) :]
+        if lazy is None:
+            lazy = cls.__lazy__
 
-            instance.__setattr__(mapped_key, value)
+        plan = cls.__deserializer_plan__
+        storage_keys = [entry[1] for entry in cls.__serializer_plan__]
+        size = len(storage_keys)
+        compact = cls.__compact__
 
-        for key in cls.__reverse_table_mapper__:
-            if key not in item_dict:
-                instance.__setattr__(key, None)
+        instances: List["Model"] = []
 
-        return instance
+        for item in items:
+            values: Any
+            snapshot: Optional[List[Any]] = None
+
+            if lazy:
+                if compact:
+                    values = [NOT_LOADED] * size
+                else:
+                    values = dict.fromkeys(storage_keys, NOT_LOADED)
+                raw_item = item
+            else:
+                if compact:
+                    values = [None] * size
+                else:
+                    values = dict.fromkeys(storage_keys)
+                if not readonly:
+                    snapshot = [None] * size
+                raw_item = None
+
+                for col_name, attr_dict in item.items():
+                    entry = plan.get(col_name)
+                    if entry is None:
+                        continue
+
+                    position, storage_key, deserialize, prefix = entry
+
+                    value = cls.extract_dynamodb_value(attr_dict)
+                    if prefix and value and value.startswith(prefix):
+                        value = value[len(prefix) :]
+
+                    if snapshot is not None:
+                        snapshot[position] = value
+                    values[storage_key] = deserialize(value)
+
+            instance = cls.__new__(cls)
+            instance._set_state(
+                values,
+                raw_item,
+                tuple(snapshot) if snapshot is not None else None,
+                readonly,
+            )
+            instances.append(instance)
+
+        return instances
 
     def to_dynamodb_item(self) -> Dict[str, Any]:
         """
@@ -309,37 +757,44 @@ class Model(metaclass=BaseMeta):
             raise TypeError("__table__ required")
 
         item_data: Dict[str, Any] = {}
+        get_value = self._value_getter()
 
-        for key, attr in self.__class__.__dict__.items():
-            if isinstance(attr, InstrumentedAttribute):
-                value = getattr(self, key, None)
-
-                value = attr.attribute.attribute_type.serialize(value)
-                if value and attr.attribute.prefix:
-                    value = f"{attr.attribute.prefix}{value}"
-
-                if value is None or not value:
-                    if attr.attribute.partition_key or attr.attribute.sort_key:
-                        raise ValueError(
-                            f"{key} (index: {attr.attribute.index_name}) "
-                            "cannot be empty",
-                        )
-                    if not attr.attribute.nullable:
-                        raise TypeError(f"{key} is empty and nullable=False")
-
-                mapped_columns: Tuple[Optional[str]] = (
-                    self.forward_mapped_columns(attr.attribute.key)
-                )
-
-                for col_name in filter(None, mapped_columns):
-                    if value is None:
-                        item_data[col_name] = {
-                            "NULL": True,
-                        }
-                    else:
-                        item_data[col_name] = {
-                            attr.attribute.attribute_type.dynamodb_descriptor: value  # noqa
-                        }
+        for (
+            key,
+            storage_key,
+            columns,
+            serialize,
+            descriptor,
+            prefix,
+            nullable,
+            is_key,
+            index_name,
+        ) in self.__class__.__serializer_plan__:
+            value = get_value(storage_key)
+            if value is NOT_LOADED:
+                value = getattr(self, key)
+
+            value = serialize(value)
+            if value and prefix:
+                value = f"{prefix}{value}"
+
+            if value is None or not value:
+                if is_key:
+                    raise ValueError(
+                        f"{key} (index: {index_name}) cannot be empty",
+                    )
+                if not nullable:
+                    raise TypeError(f"{key} is empty and nullable=False")
+
+            for col_name in columns:
+                if value is None:
+                    item_data[col_name] = {
+                        "NULL": True,
+                    }
+                else:
+                    item_data[col_name] = {
+                        descriptor: value,
+                    }
 
         return item_data
 
@@ -350,12 +805,12 @@ class Model(metaclass=BaseMeta):
 
         pk_cols = self.__class__.__table__.indexes[PRIMARY_INDEX]
 
-        pk_attr: str = self.__class__.__reverse_table_mapper__[pk_cols[0]]
-        pk_partition_key_val: Any = getattr(self, pk_attr)
+        key_plan = self.__class__.__key_plan__
+
+        pk_partition_key_val: Any = getattr(self, key_plan[0][0])
 
         if pk_cols[1]:
-            sk_attr: str = self.__class__.__reverse_table_mapper__[pk_cols[1]]
-            pk_sort_key_val: Any = getattr(self, sk_attr)
+            pk_sort_key_val: Any = getattr(self, key_plan[1][0])
         else:
             pk_sort_key_val = None
 
@@ -365,6 +820,58 @@ class Model(metaclass=BaseMeta):
             pk_sort_key_val,
         )
 
+    @property
+    def modified_attrs(self) -> AbstractSet[str]:
+        """
+        The names of the attributes whose value differs from the value the
+        instance was constructed or hydrated with, or first assigned for the
+        attributes of a constructed instance that were not passed to it.
+
+        It is computed by comparing serialized values with the snapshot, so
+        values changed in place are detected too. Primary key attributes are
+        never reported: an item cannot change its key.
+        """
+        if self._readonly:
+            return NO_CHANGES
+
+        get_value = self._value_getter()
+        snapshot = self._snapshot
+
+        modified: Set[str] = set()
+
+        for position, entry in enumerate(self.__class__.__serializer_plan__):
+            key, storage_key, columns, serialize = entry[:4]
+            if entry[8] == PRIMARY_INDEX:
+                continue
+
+            value = get_value(storage_key)
+            if value is NOT_LOADED:
+                continue
+
+            if snapshot is not None:
+                original = snapshot[position]
+                if original is NOT_ASSIGNED:
+                    continue
+            else:
+                original = self._raw_value(
+                    columns[0] if columns else None, entry[5]
+                )
+
+            if serialize(value) == original:
+                continue
+
+            # The stored representation may differ from ours for an equal
+            # value, eg: "2025-01-01T00:00:00Z" for a DateTime.
+            attr = self.__class__.__dict__[key]
+            if original is not None and (
+                attr.attribute.attribute_type.deserialize(original) == value
+            ):
+                continue
+
+            modified.add(key)
+
+        return modified
+
     def modified_attributes(self) -> Dict[str, Any]:
         """Returns a dictionary of only modified attributes."""
         return {attr: getattr(self, attr) for attr in self.modified_attrs}
@@ -382,6 +889,79 @@ class Model(metaclass=BaseMeta):
             key,
         )
 
+    @classmethod
+    def dynamodb_key(cls, values: Dict[str, Any]) -> Tuple[Ref, Dict[str, Any]]:
+        """
+        Builds the `ref` and the DynamoDB `Key` of the item whose primary key
+        attributes have `values`, without instantiating the model.
+
+        eg:
+            User.dynamodb_key({"id": "123"})
+            # (("User", "123", None), {"PK": {"S": "USER#123"}})
+        """
+        if cls.__table__ is None:
+            raise TypeError("__table__ required")
+
+        ref_values: List[Any] = []
+        key: Dict[str, Any] = {}
+
+        for position, (
+            attr_name,
+            col,
+            deserialize,
+            serialize,
+            descriptor,
+            prefix,
+        ) in enumerate(cls.__key_plan__):
+            value = deserialize(values.get(attr_name))
+            if not value:
+                kind = "Sort" if position else "Partition"
+                raise ValueError(f"{kind} key {attr_name} cannot be empty")
+
+            ref_values.append(value)
+
+            serialized = serialize(value)
+            if prefix:
+                serialized = f"{prefix}{serialized}"
+            key[col] = {descriptor: serialized}
+
+        if len(ref_values) < 2:
+            ref_values.append(None)
+
+        return (cls.__name__, ref_values[0], ref_values[1]), key
+
+    @classmethod
+    def dynamodb_keys(
+        cls,
+        ids: Iterable[Any],
+    ) -> List[Tuple[Ref, Dict[str, Any]]]:
+        """
+        The bulk form of `dynamodb_key`. Each id is either the partition key
+        value, or a (partition key, sort key) tuple.
+
+        eg:
+            User.dynamodb_keys(["1", "2", "3"])
+        """
+        return [cls.dynamodb_key(cls.key_values(key_id)) for key_id in ids]
+
+    @classmethod
+    def key_values(cls, key_id: Any) -> Dict[str, Any]:
+        """
+        Maps a partition key value, or a (partition key, sort key) tuple, to
+        the primary key attributes.
+
+        eg:
+            Membership.key_values(("user1", "group1"))
+            # {"user_id": "user1", "group_id": "group1"}
+        """
+        if not isinstance(key_id, tuple):
+            key_id = (key_id,)
+
+        values = cast(Tuple[Any, ...], key_id)
+        return {
+            entry[0]: value for entry, value in zip(cls.__key_plan__, values)
+        }
+
     @property
     def primary_key(self) -> Dict[Any, Any]:
         """
@@ -392,7 +972,9 @@ class Model(metaclass=BaseMeta):
 
         pk_cols = self.__class__.__table__.indexes[PRIMARY_INDEX]
 
-        pk_attr_name: str = self.__class__.__reverse_table_mapper__[pk_cols[0]]
+        key_plan = self.__class__.__key_plan__
+
+        pk_attr_name = key_plan[0][0]
         pk_val: Any = getattr(self, pk_attr_name)
 
         if not pk_val:
@@ -413,9 +995,7 @@ class Model(metaclass=BaseMeta):
         }
 
         if pk_cols[1]:
-            sk_attr_name: str = self.__class__.__reverse_table_mapper__[
-                pk_cols[1]
-            ]
+            sk_attr_name = key_plan[1][0]
             sk_val: Any = getattr(self, sk_attr_name)
             if not sk_val:
                 raise ValueError(f"Sort key {sk_attr_name} cannot be empty")
@@ -1,15 +1,21 @@
+from .batch_get_item import BatchGetItem
+from .batch_write_item import BatchWriteItem
 from .delete_item import DeleteItem
 from .get_item import GetItem
 from .put_item import PutItem
 from .query import Query
+from .scan import Scan
 from .transact_write_items import TransactWriteItems
 from .update_item import UpdateItem
 
 __all__ = [
+    "BatchGetItem",
+    "BatchWriteItem",
     "GetItem",
     "PutItem",
     "UpdateItem",
     "TransactWriteItems",
     "Query",
+    "Scan",
     "DeleteItem",
 ]
@@ -0,0 +1,118 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Type
+
+if TYPE_CHECKING:
+    from pynamo.model import Model
+
+    from .get_item import GetItem
+
+from pynamo import limits
+from pynamo.constants import PRIMARY_INDEX
+
+
+def key_identity(table_name: str, key: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Returns a hashable identity for a serialized DynamoDB `Key`.
+
+    eg:
+        key_identity("mytable", {"PK": {"S": "123"}})
+        # ("mytable", ("PK", ("S", "123")))
+    """
+    return (
+        table_name,
+        *sorted((col, next(iter(val.items()))) for col, val in key.items()),
+    )
+
+
+class BatchGetItem:
+    """
+    Reads many items, from one or more tables and models, in as few
+    BatchGetItem requests as possible.
+
+    Duplicate keys are only requested once, and `chunks()` splits the keys
+    into requests of at most `limits.BATCH_GET_ITEM` keys.
+
+    eg:
+        BatchGetItem(
+            GetItem(User).where(id="1"),
+            GetItem(User).where(id="2"),
+            GetItem(Group).where(id="1"),
+        )
+    """
+
+    def __init__(self, *args: "GetItem"):
+        self.operations = [arg for arg in args]
+
+        self._keys: Dict[str, List[Dict[str, Any]]] = {}
+        self._key_columns: Dict[str, List[str]] = {}
+        self._models: Dict[Tuple[Any, ...], Type["Model"]] = {}
+
+        for operation in self.operations:
+            model_cls = operation.model_cls
+            if model_cls.__table__ is None:
+                raise TypeError("__table__ required")
+
+            request = operation.to_dynamodb()
+            table_name: str = request["TableName"]
+
+            identity = key_identity(table_name, request["Key"])
+            if identity in self._models:
+                continue
+
+            self._models[identity] = model_cls
+            self._keys.setdefault(table_name, []).append(request["Key"])
+            self._key_columns.setdefault(
+                table_name,
+                [
+                    col
+                    for col in model_cls.__table__.indexes[PRIMARY_INDEX]
+                    if col
+                ],
+            )
+
+    @staticmethod
+    def _request(keys: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+        return {
+            "RequestItems": {
+                table_name: {"Keys": table_keys}
+                for table_name, table_keys in keys.items()
+            }
+        }
+
+    def to_dynamodb(self) -> Dict[str, Any]:
+        return self._request(self._keys)
+
+    def chunks(self, size: int = limits.BATCH_GET_ITEM) -> List[Dict[str, Any]]:
+        """
+        Splits the keys into BatchGetItem requests of at most `size` keys.
+        """
+        requests: List[Dict[str, Any]] = []
+        current: Dict[str, List[Dict[str, Any]]] = {}
+        count = 0
+
+        for table_name, keys in self._keys.items():
+            for key in keys:
+                if count == size:
+                    requests.append(self._request(current))
+                    current = {}
+                    count = 0
+                current.setdefault(table_name, []).append(key)
+                count += 1
+
+        if current:
+            requests.append(self._request(current))
+
+        return requests
+
+    def from_dynamodb_item(
+        self,
+        table_name: str,
+        item: Dict[str, Any],
+        readonly: bool = False,
+    ) -> "Model":
+        """
+        Hydrates an item from a BatchGetItem response with the model class
+        that requested its key.
+        """
+        key = {col: item[col] for col in self._key_columns[table_name]}
+        model_cls = self._models[key_identity(table_name, key)]
+        return model_cls.from_dynamodb_item(item, readonly=readonly)
@@ -0,0 +1,144 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union, cast
+
+if TYPE_CHECKING:
+    from pynamo.table import Table
+
+    from .delete_item import DeleteItem
+    from .put_item import PutItem
+
+from pynamo import limits
+from pynamo.constants import PRIMARY_INDEX
+
+from .batch_get_item import key_identity
+
+# (table name, write request, operation)
+WriteRequest = Tuple[str, Dict[str, Any], Union["PutItem", "DeleteItem"]]
+
+# (BatchWriteItem request, operations written by the request)
+OperationChunk = Tuple[Dict[str, Any], List[Union["PutItem", "DeleteItem"]]]
+
+
+class BatchWriteItem:
+    """
+    Writes many PutItem and DeleteItem operations, across one or more tables,
+    in as few BatchWriteItem requests as possible.
+
+    DynamoDB rejects a batch that touches the same key twice, so only the
+    last operation for each key is kept: a put followed by a delete of the
+    same item becomes a delete, and a delete followed by a put becomes a put.
+
+    eg:
+        BatchWriteItem(
+            PutItem(User(id="1")),
+            DeleteItem(User(id="2")),
+        )
+    """
+
+    def __init__(self, *args: Union["PutItem", "DeleteItem"]):
+        self.operations = [arg for arg in args]
+
+    def write_requests(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Returns the deduplicated (table name, write request) pairs.
+        """
+        return [
+            (table_name, write_request)
+            for table_name, write_request, _ in self._write_requests()
+        ]
+
+    def _write_requests(self) -> List[WriteRequest]:
+        requests: Dict[Tuple[Any, ...], WriteRequest] = {}
+
+        for operation in self.operations:
+            if operation.__class__.__name__ == "PutItem":
+                put_item = cast("PutItem", operation)
+                request = put_item.to_dynamodb()
+                table_name: str = request["TableName"]
+                item = request["Item"]
+
+                table = cast("Table", put_item.instance.__table__)
+                key_columns = table.indexes[PRIMARY_INDEX]
+                key = {col: item[col] for col in key_columns if col}
+                write_request = {"PutRequest": {"Item": item}}
+
+            elif operation.__class__.__name__ == "DeleteItem":
+                request = operation.to_dynamodb()
+                table_name = request["TableName"]
+                key = request["Key"]
+                write_request = {"DeleteRequest": {"Key": key}}
+
+            else:
+                raise NotImplementedError(operation.__class__.__name__)
+
+            identity = key_identity(table_name, key)
+            requests.pop(identity, None)
+            requests[identity] = (table_name, write_request, operation)
+
+        return list(requests.values())
+
+    @staticmethod
+    def _request(
+        write_requests: List[Tuple[str, Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        request_items: Dict[str, List[Dict[str, Any]]] = {}
+        for table_name, write_request in write_requests:
+            request_items.setdefault(table_name, []).append(write_request)
+        return {"RequestItems": request_items}
+
+    def to_dynamodb(self) -> Dict[str, Any]:
+        return self._request(self.write_requests())
+
+    def chunks(
+        self,
+        size: int = limits.BATCH_WRITE_ITEM,
+        max_bytes: int = limits.BATCH_WRITE_ITEM_REQUEST_SIZE,
+    ) -> List[Dict[str, Any]]:
+        """
+        Splits the write requests into BatchWriteItem requests of at most
+        `size` items and approximately `max_bytes` bytes.
+        """
+        return [
+            request for request, _ in self.operation_chunks(size, max_bytes)
+        ]
+
+    def operation_chunks(
+        self,
+        size: int = limits.BATCH_WRITE_ITEM,
+        max_bytes: int = limits.BATCH_WRITE_ITEM_REQUEST_SIZE,
+    ) -> List[OperationChunk]:
+        """
+        Same as `chunks`, with the operations written by each request.
+        """
+        chunks: List[OperationChunk] = []
+        current: List[Tuple[str, Dict[str, Any]]] = []
+        current_ops: List[Union["PutItem", "DeleteItem"]] = []
+        current_bytes = 0
+
+        for table_name, write_request, operation in self._write_requests():
+            if "PutRequest" in write_request:
+                request_bytes = limits.item_size(
+                    write_request["PutRequest"]["Item"]
+                )
+            else:
+                request_bytes = limits.item_size(
+                    write_request["DeleteRequest"]["Key"]
+                )
+            request_bytes += len(table_name)
+
+            if current and (
+                len(current) == size
+                or current_bytes + request_bytes > max_bytes
+            ):
+                chunks.append((self._request(current), current_ops))
+                current = []
+                current_ops = []
+                current_bytes = 0
+
+            current.append((table_name, write_request))
+            current_ops.append(operation)
+            current_bytes += request_bytes
+
+        if current:
+            chunks.append((self._request(current), current_ops))
+
+        return chunks
@@ -1,39 +1,120 @@
-from typing import TYPE_CHECKING, Any, Dict, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+)
 
 if TYPE_CHECKING:
     from pynamo.attribute import Expression
-    from pynamo.model import Model
+    from pynamo.model import Model, Ref
 
 
 class DeleteItem:
+    """
+    Deletes one item by its primary key.
+
+    `where` and `many` build the `Key` straight from the key values with the
+    model's key plan; no model instance is created.
+
+    eg:
+        DeleteItem(user)
+        DeleteItem.where(User.id == "123")
+        DeleteItem.many(User, ["1", "2", "3"])
+    """
+
     def __init__(self, obj: "Model"):
-        self.obj = obj
+        self._obj: Optional["Model"] = obj
+        self.model_cls: Type["Model"] = obj.__class__
+        self._values: Dict[str, Any] = {}
+        self._key: Optional[Dict[str, Any]] = None
+        self._ref: Optional["Ref"] = None
+
+    @classmethod
+    def for_key(
+        cls,
+        model_cls: Type["Model"],
+        values: Dict[str, Any],
+    ) -> "DeleteItem":
+        """
+        Deletes the item whose primary key attributes have `values`.
+
+        eg:
+            DeleteItem.for_key(User, {"id": "123"})
+        """
+        op = cls.__new__(cls)
+        op._obj = None
+        op.model_cls = model_cls
+        op._values = values
+        op._ref, op._key = model_cls.dynamodb_key(values)
+        return op
 
     @classmethod
     def where(cls, *args: "Expression") -> "DeleteItem":
-        instance = None
+        model_cls: Optional[Type["Model"]] = None
+        values: Dict[str, Any] = {}
 
         for exp in args:
             attr = exp.left
             if attr.model_cls is None:
                 raise Exception("model_cls is None")
 
-            model_cls: Type["Model"] = attr.model_cls
-            if instance is None:
-                instance = model_cls()
+            if model_cls is None:
+                model_cls = attr.model_cls
 
-            attr = exp.left
             value: Any = exp.right.value
-            setattr(instance, attr.key, value)
+            values[attr.name or attr.key] = value
 
-        if instance:
-            return cls(instance)
+        if model_cls:
+            return cls.for_key(model_cls, values)
         raise NotImplementedError()
 
+    @classmethod
+    def many(
+        cls,
+        model_cls: Type["Model"],
+        ids: Iterable[Any],
+    ) -> List["DeleteItem"]:
+        """
+        Builds one DeleteItem per id. Each id is either the partition key
+        value, or a (partition key, sort key) tuple.
+        """
+        return [
+            cls.for_key(model_cls, model_cls.key_values(key_id))
+            for key_id in ids
+        ]
+
+    @property
+    def obj(self) -> "Model":
+        """
+        The deleted model instance. For key-only deletes, an instance holding
+        the key values is only created when asked for.
+        """
+        if self._obj is None:
+            self._obj = self.model_cls(**self._values)
+        return self._obj
+
+    @property
+    def ref(self) -> Optional["Ref"]:
+        if self._ref is not None:
+            return self._ref
+        return self.obj.ref
+
+    @property
+    def key(self) -> Dict[str, Any]:
+        if self._key is not None:
+            return self._key
+        return self.obj.primary_key
+
     def to_dynamodb(self) -> Dict[str, Any]:
-        table_name = self.obj.__table__.name if self.obj.__table__ else None
+        table_name = (
+            self.model_cls.__table__.name if self.model_cls.__table__ else None
+        )
 
         return {
             "TableName": table_name,
-            "Key": self.obj.primary_key,
+            "Key": self.key,
         }
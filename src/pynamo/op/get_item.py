@@ -1,32 +1,70 @@
-from typing import TYPE_CHECKING, Any, Dict, Type
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Type
 
 if TYPE_CHECKING:
     from pynamo.attribute import Expression
-    from pynamo.model import Model
+    from pynamo.model import Model, Ref
 
 
 class GetItem:
+    """
+    Reads one item by its primary key.
+
+    The `Key` is built straight from the key values with the model's key
+    plan; no model instance is created.
+
+    eg:
+        GetItem(User).where(User.id == "123")
+        GetItem.many(User, ["1", "2", "3"])
+    """
+
+    ref: "Ref"
+    key: Dict[str, Any]
+
     def __init__(self, model_cls: Type["Model"]):
         self.model_cls = model_cls
+        self._values: Dict[str, Any] = {}
+        self._instance: Optional["Model"] = None
 
     def where(self, *args: "Expression", **kwargs: Any) -> "GetItem":
-        instance = self.model_cls()
-
         for exp in args:
             attr = exp.left
             if attr.model_cls is None:
                 raise Exception("model_cls is None")
 
-            attr = exp.left
             value: Any = exp.right.value
-            setattr(instance, attr.key, value)
+            self._values[attr.name or attr.key] = value
 
-        for k, v in kwargs.items():
-            setattr(instance, k, v)
+        self._values.update(kwargs)
 
-        self.instance = instance
+        self.ref, self.key = self.model_cls.dynamodb_key(self._values)
+        self._instance = None
         return self
 
+    @classmethod
+    def many(
+        cls,
+        model_cls: Type["Model"],
+        ids: Iterable[Any],
+    ) -> List["GetItem"]:
+        """
+        Builds one GetItem per id. Each id is either the partition key value,
+        or a (partition key, sort key) tuple.
+        """
+        return [
+            cls(model_cls).where(**model_cls.key_values(key_id))
+            for key_id in ids
+        ]
+
+    @property
+    def instance(self) -> "Model":
+        """
+        A model instance holding the requested key values, only created when
+        asked for.
+        """
+        if self._instance is None:
+            self._instance = self.model_cls(**self._values)
+        return self._instance
+
     def to_dynamodb(self) -> Dict[str, Any]:
         table_name = (
             self.model_cls.__table__.name if self.model_cls.__table__ else None
@@ -34,5 +72,5 @@ class GetItem:
 
         return {
             "TableName": table_name,
-            "Key": self.instance.primary_key,
+            "Key": self.key,
         }
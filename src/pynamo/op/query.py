@@ -1,3 +1,4 @@
+import copy
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -14,14 +15,79 @@ if TYPE_CHECKING:
 
 from pynamo.constants import PRIMARY_INDEX
 
+CompiledKeyCondition = Tuple[
+    str,
+    Dict[str, str],
+    Tuple[Tuple[str, int, str], ...],
+]
+
+
+def _compile_key_condition(
+    model: Type["Model"],
+    shape: Tuple[Tuple[str, str, str], ...],
+) -> CompiledKeyCondition:
+    """
+    Builds the KeyConditionExpression and the ExpressionAttributeNames of a
+    query shape, the (attribute key, operator, descriptor) of each condition.
+
+    The model determines the index queried, so the result is cached on the
+    model, by shape. Only the values are left to fill in per query, as
+    (placeholder, condition position, descriptor).
+    """
+    cached: Optional[CompiledKeyCondition] = model.__templates__.get(
+        ("query", shape)
+    )
+    if cached is not None:
+        return cached
+
+    expression_attribute_names: Dict[str, str] = {}
+    placeholders: List[Tuple[str, int, str]] = []
+
+    expressions: list[str] = []
+
+    substitued_counter = 0
+
+    for position, (key, operator, descriptor) in enumerate(shape):
+        for col_name in filter(None, model.forward_mapped_columns(key)):
+            substitued = f"ATTR{substitued_counter}"
+
+            expressions.append(f"#{substitued} {operator} :{substitued}")
+            expression_attribute_names[f"#{substitued}"] = col_name
+            placeholders.append((f":{substitued}", position, descriptor))
+
+            substitued_counter += 1
+
+    compiled = (
+        " AND ".join(expressions),
+        expression_attribute_names,
+        tuple(placeholders),
+    )
+    model.__templates__[("query", shape)] = compiled
+    return compiled
+
 
 class Query:
     def __init__(
         self,
         model: Type["Model"],
+        limit: Optional[int] = None,
+        readonly: Optional[bool] = None,
     ):
+        """
+        Args:
+            model (Type[Model]): The model class to query.
+            limit (Optional[int]): The maximum number of items to read. It is
+                sent to DynamoDB as `Limit` so no more items than needed are
+                read.
+            readonly (Optional[bool]): Hydrate read-only instances. Defaults
+                to the session's setting.
+        """
         self.model = model
+        self.limit = limit
+        self.readonly = readonly
         self._conditions: List[Tuple["Attribute", str, "BindParameter"]] = []
+        self._shape: Tuple[Tuple[str, str, str], ...] = ()
+        self._params: Dict[str, Any] = {}
 
         self.partition_key: Optional[str] = None
         self.sort_key: Optional[str] = None
@@ -88,43 +154,74 @@ class Query:
             operator = exp.operator
             bind_param = exp.right
             self._conditions.append((column, operator, bind_param))
+            self._shape += (
+                (
+                    column.key,
+                    operator,
+                    column.attribute_type.dynamodb_descriptor,
+                ),
+            )
 
         return self
 
-    def to_dynamodb(self, start_key: Any = None) -> Dict[str, Any]:
+    def params(self, **values: Any) -> "Query":
+        """
+        Returns a copy of the query with values for its `bindparam`
+        placeholders. The copy shares the compiled key condition, so only
+        the values are built when it is executed.
+
+        eg:
+            find_user = Query(User).where(User.id == bindparam("id"))
+
+            session.execute(find_user.params(id="123"))
+        """
+        query = copy.copy(self)
+        query._conditions = list(self._conditions)
+        query._params = {**self._params, **values}
+        return query
+
+    def _bound_value(self, bind_param: "BindParameter") -> Any:
+        if bind_param.key is None:
+            return bind_param.value
+        try:
+            return self._params[bind_param.key]
+        except KeyError:
+            raise ValueError(
+                f"No value bound for parameter '{bind_param.key}'"
+            ) from None
+
+    def to_dynamodb(
+        self,
+        start_key: Any = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
         if self.model.__table__ is None:
             raise TypeError("table required")
 
-        expression_attribute_names: Dict[Any, Any] = {}
-        expression_attribute_values: Dict[Any, Any] = {}
-
-        expressions: list[str] = []
-
-        substitued_counter = 0
+        exp, expression_attribute_names, placeholders = _compile_key_condition(
+            self.model, self._shape
+        )
 
-        for column, operator, bind_param in self._conditions:
-            cols = self.model.forward_mapped_columns(column.key)
-
-            col_name: str
-
-            for col_name in filter(None, cols):
-                substitued = f"ATTR{substitued_counter}"
-
-                expressions.append(f"#{substitued} {operator} :{substitued}")
-                expression_attribute_names[f"#{substitued}"] = col_name
-                expression_attribute_values[f":{substitued}"] = {
-                    column.attribute_type.dynamodb_descriptor: bind_param.value
-                }
+        conditions = self._conditions
+        expression_attribute_values: Dict[str, Any] = {
+            placeholder: {
+                descriptor: self._bound_value(conditions[position][2]),
+            }
+            for placeholder, position, descriptor in placeholders
+        }
 
-                substitued_counter += 1
-        exp = " AND ".join(expressions)
-        query_params = {
+        query_params: Dict[str, Any] = {
             "TableName": self.model.__table__.name,
             "KeyConditionExpression": exp,
-            "ExpressionAttributeNames": expression_attribute_names,
+            "ExpressionAttributeNames": dict(expression_attribute_names),
             "ExpressionAttributeValues": expression_attribute_values,
         }
         if start_key:
             query_params["ExclusiveStartKey"] = start_key
 
+        if limit is None:
+            limit = self.limit
+        if limit is not None:
+            query_params["Limit"] = limit
+
         return query_params
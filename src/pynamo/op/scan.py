@@ -0,0 +1,69 @@
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type
+
+if TYPE_CHECKING:
+    from pynamo.model import Model
+
+
+class Scan:
+    """
+    Reads every item of a model's table.
+
+    A scan can be split into `total_segments` segments, which sessions read
+    in parallel.
+
+    eg:
+        Scan(User, total_segments=4)
+    """
+
+    def __init__(
+        self,
+        model: Type["Model"],
+        total_segments: int = 1,
+        page_size: Optional[int] = None,
+        readonly: Optional[bool] = None,
+    ):
+        """
+        Args:
+            model (Type[Model]): The model class to scan.
+            total_segments (int): The number of segments to split the scan
+                into.
+            page_size (Optional[int]): The maximum number of items read per
+                request, sent as `Limit`.
+            readonly (Optional[bool]): Hydrate read-only instances. Defaults
+                to the session's setting.
+        """
+        if total_segments < 1:
+            raise ValueError("total_segments must be at least 1")
+
+        self.model = model
+        self.total_segments = total_segments
+        self.page_size = page_size
+        self.readonly = readonly
+
+    def to_dynamodb(
+        self,
+        segment: Optional[int] = None,
+        start_key: Any = None,
+    ) -> Dict[str, Any]:
+        if self.model.__table__ is None:
+            raise TypeError("table required")
+
+        scan_params: Dict[str, Any] = {
+            "TableName": self.model.__table__.name,
+        }
+
+        if segment is not None:
+            if not 0 <= segment < self.total_segments:
+                raise ValueError(
+                    f"segment must be between 0 and {self.total_segments - 1}"
+                )
+            scan_params["Segment"] = segment
+            scan_params["TotalSegments"] = self.total_segments
+
+        if start_key:
+            scan_params["ExclusiveStartKey"] = start_key
+
+        if self.page_size is not None:
+            scan_params["Limit"] = self.page_size
+
+        return scan_params
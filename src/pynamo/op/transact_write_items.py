@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union
 
 if TYPE_CHECKING:
     from .delete_item import DeleteItem
@@ -6,6 +6,18 @@ if TYPE_CHECKING:
     from .put_item import PutItem
     from .update_item import UpdateItem
 
+from pynamo import limits
+from pynamo.exceptions import RequestLimitError
+
+# The bytes of `{"TransactItems":[]}` around the items of a request.
+_REQUEST_OVERHEAD = limits.request_size({"TransactItems": []})
+
+# (request, operations written by the request)
+OperationChunk = Tuple[
+    Dict[str, Any],
+    List[Union["GetItem", "PutItem", "UpdateItem", "DeleteItem"]],
+]
+
 
 class TransactWriteItems:
     def __init__(
@@ -13,7 +25,7 @@ class TransactWriteItems:
     ):
         self.operations = [arg for arg in args]
 
-    def to_dynamodb(self) -> Dict[str, Any]:
+    def transact_items(self) -> List[Dict[str, Any]]:
         operations_to_dynamodb: List[Dict[str, Any]] = []
 
         for operation in self.operations:
@@ -37,4 +49,67 @@ class TransactWriteItems:
                 )
             else:
                 raise NotImplementedError(operation.__class__.__name__)
-        return {"TransactItems": operations_to_dynamodb}
+        return operations_to_dynamodb
+
+    def to_dynamodb(self) -> Dict[str, Any]:
+        return {"TransactItems": self.transact_items()}
+
+    def chunks(
+        self,
+        size: int = limits.TRANSACT_WRITE_ITEMS,
+        max_bytes: int = limits.TRANSACT_WRITE_ITEMS_REQUEST_SIZE,
+    ) -> List[Dict[str, Any]]:
+        """
+        Splits the operations into TransactWriteItems requests of at most
+        `size` items and `max_bytes` bytes of serialized payload.
+
+        Each request is atomic on its own, but the requests are not atomic
+        with one another.
+        """
+        return [
+            request for request, _ in self.operation_chunks(size, max_bytes)
+        ]
+
+    def operation_chunks(
+        self,
+        size: int = limits.TRANSACT_WRITE_ITEMS,
+        max_bytes: int = limits.TRANSACT_WRITE_ITEMS_REQUEST_SIZE,
+    ) -> List[OperationChunk]:
+        """
+        Same as `chunks`, with the operations written by each request.
+        """
+        chunks: List[OperationChunk] = []
+        current: List[Dict[str, Any]] = []
+        current_ops: List[
+            Union["GetItem", "PutItem", "UpdateItem", "DeleteItem"]
+        ] = []
+        current_bytes = _REQUEST_OVERHEAD
+
+        for transact_item, operation in zip(
+            self.transact_items(), self.operations
+        ):
+            # The item and the comma separating it from the previous one.
+            item_bytes = limits.request_size(transact_item) + 1
+
+            if item_bytes + _REQUEST_OVERHEAD > max_bytes:
+                raise RequestLimitError(
+                    f"TransactWriteItems item is {item_bytes} bytes, "
+                    f"the limit is {max_bytes}"
+                )
+
+            if current and (
+                len(current) == size or current_bytes + item_bytes > max_bytes
+            ):
+                chunks.append(({"TransactItems": current}, current_ops))
+                current = []
+                current_ops = []
+                current_bytes = _REQUEST_OVERHEAD
+
+            current.append(transact_item)
+            current_ops.append(operation)
+            current_bytes += item_bytes
+
+        if current:
+            chunks.append(({"TransactItems": current}, current_ops))
+
+        return chunks
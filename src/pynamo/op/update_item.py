@@ -1,19 +1,118 @@
-from typing import TYPE_CHECKING, Any, Dict, Literal, Type
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+from pynamo.constants import PRIMARY_INDEX
 
 if TYPE_CHECKING:
     from pynamo.attribute import Expression
     from pynamo.model import Model
 
+# (attribute name, serialize, descriptor, prefix, nullable, placeholders)
+UpdateEntry = Tuple[
+    str,
+    Callable[[Any], Any],
+    str,
+    Optional[str],
+    bool,
+    Tuple[str, ...],
+]
+
+UpdateTemplate = Tuple[str, Dict[str, str], Tuple[UpdateEntry, ...]]
+
+
+def _compile_update(
+    model: Type["Model"],
+    modified_attrs: FrozenSet[str],
+) -> UpdateTemplate:
+    """
+    Builds the UpdateExpression and the ExpressionAttributeNames setting
+    `modified_attrs`, cached on the model by set of attributes, with the
+    serialization details of each attribute.
+
+    Attributes are numbered in name order, so a set of attributes always
+    compiles to the same template. Primary key attributes are left out, as
+    DynamoDB does not update them.
+    """
+    cached: Optional[UpdateTemplate] = model.__templates__.get(
+        ("update", modified_attrs)
+    )
+    if cached is not None:
+        return cached
+
+    expression_attribute_names: Dict[str, str] = {}
+    entries: List[UpdateEntry] = []
+
+    expressions: list[str] = []
+
+    substitued_counter = 0
+
+    for attr_name in sorted(modified_attrs):
+        attr = model.__dict__[attr_name].attribute
+        if attr.index_name == PRIMARY_INDEX:
+            continue
+
+        placeholders: List[str] = []
+
+        col_name: str
+
+        for col_name in filter(None, model.forward_mapped_columns(attr.key)):
+            substitued = f"ATTR{substitued_counter}"
+
+            expressions.append(f"#{substitued} = :{substitued}")
+            expression_attribute_names[f"#{substitued}"] = col_name
+            placeholders.append(f":{substitued}")
+
+            substitued_counter += 1
+
+        entries.append(
+            (
+                attr_name,
+                attr.attribute_type.serialize,
+                attr.attribute_type.dynamodb_descriptor,
+                attr.prefix,
+                bool(attr.nullable),
+                tuple(placeholders),
+            )
+        )
+
+    template = (
+        f"SET {', '.join(expressions)}",
+        expression_attribute_names,
+        tuple(entries),
+    )
+    model.__templates__[("update", modified_attrs)] = template
+    return template
+
 
 class UpdateItem:
-    def __init__(self, obj: "Model"):
+    def __init__(
+        self,
+        obj: "Model",
+        modified_attrs: Optional[AbstractSet[str]] = None,
+    ):
         """
-        Initializes a PutItem instance.
+        Initializes an UpdateItem instance.
 
         Args:
             obj (Model): The model instance to be serialized for DynamoDB.
+            modified_attrs (Optional[AbstractSet[str]]): The attributes to
+                update, when already computed. Defaults to
+                `obj.modified_attrs`.
         """
         self.obj = obj
+        self.modified_attrs = modified_attrs
         self.condition = None
 
     @classmethod
@@ -21,11 +120,15 @@ class UpdateItem:
         """
         Initialize an UpdateItem instance
 
+        The primary key attributes select the item, and the other attributes
+        are set.
+
         eg:
-            UpdateItem.where(User.id = 123)
+            UpdateItem.where(User.id == 123, User.name == "name")
         """
 
         instance = None
+        modified_attrs: Set[str] = set()
 
         for exp in args:
             attr = exp.left
@@ -38,10 +141,13 @@ class UpdateItem:
 
             attr = exp.left
             value: Any = exp.right.value
-            setattr(instance, attr.key, value)
+            name = attr.name or attr.key
+            setattr(instance, name, value)
+            if attr.index_name != PRIMARY_INDEX:
+                modified_attrs.add(name)
 
         if instance:
-            return cls(instance)
+            return cls(instance, modified_attrs)
         raise NotImplementedError()
 
     def to_dynamodb(
@@ -59,54 +165,40 @@ class UpdateItem:
 
         table_name = self.obj.__class__.__table__.name
 
-        expression_attribute_names: Dict[Any, Any] = {}
-        expression_attribute_values: Dict[Any, Any] = {}
+        modified_attrs = self.modified_attrs
+        if modified_attrs is None:
+            modified_attrs = self.obj.modified_attrs
 
-        expressions: list[str] = []
+        update_expression, expression_attribute_names, entries = (
+            _compile_update(self.obj.__class__, frozenset(modified_attrs))
+        )
 
-        substitued_counter = 0
-
-        for attr_name in self.obj.modified_attrs:
-            attr = self.obj.__class__.__dict__[attr_name]
+        expression_attribute_values: Dict[str, Any] = {}
 
+        for entry in entries:
+            attr_name, serialize, descriptor, prefix, nullable, placeholders = (
+                entry
+            )
             value = getattr(self.obj, attr_name, None)
 
             if value is None or not value:
-                if not attr.attribute.nullable:
+                if not nullable:
                     raise ValueError(f"{attr_name} cannot be empty")
 
-            value = attr.attribute.attribute_type.serialize(value)
-            if value and attr.attribute.prefix:
-                value = f"{attr.attribute.prefix}{value}"
-
-            mapped_columns = self.obj.forward_mapped_columns(attr.attribute.key)
-
-            col_name: str
-
-            for col_name in filter(None, mapped_columns):
-                substitued = f"ATTR{substitued_counter}"
-
-                expressions.append(f"#{substitued} = :{substitued}")
-                expression_attribute_names[f"#{substitued}"] = col_name
-
-                if value:
-                    expression_attribute_values[f":{substitued}"] = {
-                        attr.attribute.attribute_type.dynamodb_descriptor: value
-                    }
-                else:
-                    expression_attribute_values[f":{substitued}"] = {
-                        "NULL": True,
-                    }
+            value = serialize(value)
+            if value and prefix:
+                value = f"{prefix}{value}"
 
-                substitued_counter += 1
+            serialized = {descriptor: value} if value else {"NULL": True}
 
-        update_expression = f"SET {', '.join(expressions)}"
+            for placeholder in placeholders:
+                expression_attribute_values[placeholder] = serialized
 
         dynamodb_request: Dict[str, Any] = {
             "TableName": table_name,
             "Key": self.obj.primary_key,
             "UpdateExpression": update_expression,
-            "ExpressionAttributeNames": expression_attribute_names,
+            "ExpressionAttributeNames": dict(expression_attribute_names),
             "ExpressionAttributeValues": expression_attribute_values,
             "ReturnValues": return_values,
         }
@@ -0,0 +1,97 @@
+import itertools
+import os
+import threading
+from typing import Any, Callable, List, Optional
+
+
+class ClientPool:
+    """
+    A bounded pool of reusable clients shared by the sessions of a maker.
+
+    Clients are created on first use, up to `size`, and then handed out in
+    turn, so sessions reuse their HTTP connections instead of building a
+    client each. `warm_up()` creates them all at once, eg: at startup.
+
+    The pool is fork-aware: in a process forked after clients were created
+    (gunicorn or multiprocessing workers), it builds new clients instead of
+    sharing the parent's sockets.
+
+    eg:
+        ClientPool(lambda: boto3.client("dynamodb"), size=4)
+
+    Args:
+        client_factory (Callable[[], Any]): Creates a client.
+        size (int): The maximum number of clients.
+        ping (Optional[Callable[[Any], Any]]): Called by `warm_up()` with
+            each client to open its connections, eg:
+            `lambda client: client.describe_limits()`.
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[], Any],
+        size: int = 1,
+        ping: Optional[Callable[[Any], Any]] = None,
+    ):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+
+        self.client_factory = client_factory
+        self.size = size
+        self.ping = ping
+
+        self._clients: List[Any] = []
+        self._turns = itertools.count()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def _check_pid(self) -> None:
+        if self._pid != os.getpid():
+            self._clients = []
+            self._pid = os.getpid()
+
+    def get(self) -> Any:
+        """
+        Returns the next client, creating it if the pool is not full yet.
+        """
+        self._check_pid()
+
+        turn = next(self._turns) % self.size
+        clients = self._clients
+        if turn < len(clients):
+            return clients[turn]
+
+        with self._lock:
+            self._check_pid()
+            if len(self._clients) < self.size:
+                self._clients.append(self.client_factory())
+            return self._clients[turn % len(self._clients)]
+
+    def warm_up(self) -> List[Any]:
+        """
+        Creates the missing clients, and pings every client.
+
+        Returns:
+            list: What `ping` returned for each client, which async makers
+            await.
+        """
+        with self._lock:
+            self._check_pid()
+            while len(self._clients) < self.size:
+                self._clients.append(self.client_factory())
+            clients = list(self._clients)
+
+        if self.ping is None:
+            return []
+        return [self.ping(client) for client in clients]
+
+    def clear(self) -> None:
+        """
+        Drops the clients, which are created again on next use.
+        """
+        with self._lock:
+            self._clients = []
+
+    def __len__(self) -> int:
+        self._check_pid()
+        return len(self._clients)
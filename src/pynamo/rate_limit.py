@@ -0,0 +1,326 @@
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
+
+# (table name, index name or None, "read" or "write")
+BucketKey = Tuple[str, Optional[str], str]
+
+# (client method, units reserved from each bucket)
+Reservation = Tuple[str, List[Tuple[BucketKey, float]]]
+
+READ_METHODS = ("get_item", "batch_get_item", "query", "scan")
+WRITE_METHODS = (
+    "put_item",
+    "update_item",
+    "delete_item",
+    "batch_write_item",
+    "transact_write_items",
+)
+
+THROTTLING_ERRORS = (
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+)
+
+# The weight of the last request in the estimated cost of the next ones.
+ESTIMATE_WEIGHT = 0.2
+
+
+def is_throttling_error(error: Exception) -> bool:
+    """
+    Tells whether a client error is DynamoDB throttling the request.
+    """
+    response = getattr(error, "response", None)
+    if not isinstance(response, dict):
+        return False
+
+    details: Dict[str, Any] = cast(Dict[str, Any], response).get("Error") or {}
+    return details.get("Code") in THROTTLING_ERRORS
+
+
+class TokenBucket:
+    """
+    Hands out `rate` capacity units per second, with bursts of up to
+    `burst` seconds worth of units.
+
+    Units are taken before a request is sent, on an estimate, and the
+    difference with the capacity actually consumed is settled afterwards,
+    so the balance may go negative: later callers then wait for it to
+    refill.
+
+    After `throttled()` the rate is halved, then recovers linearly to
+    `target_rate` over `1 / recovery` seconds.
+
+    Args:
+        rate (float): The capacity units per second.
+        burst (float): The number of seconds of unused capacity that can be
+            saved up.
+        recovery (float): The fraction of `target_rate` recovered per
+            second after throttling.
+        clock (Callable[[], float]): The time source.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1.0,
+        recovery: float = 0.05,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.target_rate = rate
+        self.rate = rate
+        self.capacity = rate * burst
+        self.recovery = recovery
+        self.clock = clock
+
+        self.tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        elapsed = now - self._updated
+        self._updated = now
+
+        if self.rate < self.target_rate:
+            self.rate = min(
+                self.target_rate,
+                self.rate + self.target_rate * self.recovery * elapsed,
+            )
+        self.tokens = min(self.capacity, self.tokens + self.rate * elapsed)
+
+    def take(self, units: float) -> float:
+        """
+        Takes `units` from the bucket.
+
+        Returns:
+            float: The number of seconds to wait before sending the request.
+        """
+        with self._lock:
+            self._refill()
+            self.tokens -= units
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def settle(self, units: float) -> None:
+        """
+        Takes `units` more, or gives them back if negative, once the
+        consumed capacity is known.
+        """
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens - units)
+
+    def throttled(self) -> None:
+        with self._lock:
+            self._refill()
+            self.rate = max(self.target_rate * 0.01, self.rate / 2)
+
+
+class RateLimiter:
+    """
+    A client-side rate limiter, which keeps the sessions sharing it under
+    a fraction of the capacity of each table and index.
+
+    Every request to a configured table asks for `ReturnConsumedCapacity`.
+    Before it is sent, the estimated cost of the request is taken from the
+    token buckets of the table (or of the index it queries or scans), and
+    the caller waits while they are in debt. The consumed capacity returned
+    by DynamoDB then settles the buckets, including those of the global
+    secondary indexes the writes updated, and refines the estimates.
+    Throttling errors and unprocessed batch items halve the rate of the
+    buckets involved for a while.
+
+    Sessions share a limiter through their maker. Give background jobs a
+    maker with their own limiter and a low `target_utilization`, so online
+    traffic keeps the rest of the capacity.
+
+    eg:
+        SessionMaker(
+            client_factory,
+            rate_limiter=RateLimiter(
+                {"mytable": (100, 50), ("mytable", "gsi1"): (40, 50)},
+                target_utilization=0.3,
+            ),
+        )
+
+    Args:
+        capacity (Dict[Union[str, Tuple[str, str]], Tuple[Optional[float],
+            Optional[float]]]): The (read, write) capacity units per second
+            of each table, or (table, index); None leaves it unlimited.
+        target_utilization (float): The fraction of `capacity` to use.
+        burst (float): The number of seconds of unused capacity that can be
+            saved up.
+        clock (Callable[[], float]): The time source.
+    """
+
+    def __init__(
+        self,
+        capacity: Dict[
+            Union[str, Tuple[str, str]],
+            Tuple[Optional[float], Optional[float]],
+        ],
+        target_utilization: float = 1.0,
+        burst: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < target_utilization <= 1:
+            raise ValueError("target_utilization must be between 0 and 1")
+
+        self.target_utilization = target_utilization
+        self.buckets: Dict[BucketKey, TokenBucket] = {}
+
+        for name, units in capacity.items():
+            table_name, index_name = (
+                (name, None) if isinstance(name, str) else name
+            )
+            for kind, rate in zip(("read", "write"), units):
+                if rate is not None:
+                    self.buckets[(table_name, index_name, kind)] = TokenBucket(
+                        rate * target_utilization, burst, clock=clock
+                    )
+
+        self.tables = {key[0] for key in self.buckets}
+        # The estimated cost of a request, by client method and bucket.
+        self._estimates: Dict[Tuple[str, BucketKey], float] = {}
+
+    @staticmethod
+    def _request_tables(method: str, request: Dict[str, Any]) -> List[str]:
+        if method == "transact_write_items":
+            return list(
+                {
+                    next(iter(item.values()))["TableName"]: None
+                    for item in request.get("TransactItems", [])
+                }
+            )
+        if method in ("batch_get_item", "batch_write_item"):
+            return list(request.get("RequestItems", {}))
+        return [request["TableName"]]
+
+    def reserve(
+        self,
+        method: str,
+        request: Dict[str, Any],
+    ) -> Tuple[Optional[Reservation], float]:
+        """
+        Takes the estimated cost of a request from the buckets it uses.
+
+        Returns:
+            tuple: The reservation to pass to `record()`, or None when the
+            request does not touch a configured table, and the number of
+            seconds to wait before sending it.
+        """
+        if method in READ_METHODS:
+            kind = "read"
+        elif method in WRITE_METHODS:
+            kind = "write"
+        else:
+            return None, 0.0
+
+        tables = self._request_tables(method, request)
+        if not self.tables.intersection(tables):
+            return None, 0.0
+
+        index_name = request.get("IndexName")
+
+        reserved: List[Tuple[BucketKey, float]] = []
+        delay = 0.0
+
+        for table_name in tables:
+            key = (table_name, index_name, kind)
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                continue
+
+            units = self._estimates.get((method, key), 1.0)
+            reserved.append((key, units))
+            delay = max(delay, bucket.take(units))
+
+        return (method, reserved), delay
+
+    @staticmethod
+    def _consumed(
+        kind: str,
+        response: Dict[str, Any],
+    ) -> Dict[BucketKey, float]:
+        consumed: Dict[BucketKey, float] = {}
+
+        # A dict for single item requests, a list of them for the others.
+        capacity: Any = response.get("ConsumedCapacity") or []
+        entries = cast(
+            List[Dict[str, Any]],
+            [capacity] if isinstance(capacity, dict) else capacity,
+        )
+
+        for entry in entries:
+            table_name: str = entry["TableName"]
+
+            table: Dict[str, Any] = entry.get("Table") or entry
+            units: float = table.get("CapacityUnits", 0.0)
+            # Local secondary indexes use the capacity of their table.
+            local_indexes: Dict[str, Dict[str, Any]] = entry.get(
+                "LocalSecondaryIndexes", {}
+            )
+            for index in local_indexes.values():
+                units += index.get("CapacityUnits", 0.0)
+
+            key: BucketKey = (table_name, None, kind)
+            consumed[key] = consumed.get(key, 0.0) + units
+
+            indexes: Dict[str, Dict[str, Any]] = entry.get(
+                "GlobalSecondaryIndexes", {}
+            )
+            for index_name, index in indexes.items():
+                key = (table_name, index_name, kind)
+                consumed[key] = consumed.get(key, 0.0) + index.get(
+                    "CapacityUnits", 0.0
+                )
+
+        return consumed
+
+    def record(self, reservation: Reservation, response: Any) -> None:
+        """
+        Settles the buckets with the capacity a request consumed.
+        """
+        method, reserved = reservation
+        kind = "read" if method in READ_METHODS else "write"
+
+        if not isinstance(response, dict):
+            return
+        res = cast(Dict[str, Any], response)
+
+        if res.get("UnprocessedItems") or res.get("UnprocessedKeys"):
+            self.throttled(reservation)
+
+        consumed = self._consumed(kind, res)
+        if not consumed:
+            return
+
+        for key, units in reserved:
+            actual = consumed.pop(key, 0.0)
+            self.buckets[key].settle(actual - units)
+
+            estimate = self._estimates.get((method, key), 1.0)
+            self._estimates[(method, key)] = (
+                estimate * (1 - ESTIMATE_WEIGHT) + actual * ESTIMATE_WEIGHT
+            )
+
+        # Capacity consumed where nothing was reserved, eg: the global
+        # secondary indexes updated by a write.
+        for key, units in consumed.items():
+            bucket = self.buckets.get(key)
+            if bucket is not None:
+                bucket.settle(units)
+
+    def throttled(self, reservation: Reservation) -> None:
+        """
+        Slows down the buckets of a request DynamoDB throttled.
+        """
+        _, reserved = reservation
+        for key, _ in reserved:
+            self.buckets[key].throttled()
@@ -1,30 +1,75 @@
+import asyncio
+import contextlib
+import inspect
+import queue
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
     Awaitable,
     Callable,
     Dict,
+    Iterable,
+    Iterator,
     List,
+    Literal,
     Optional,
     Set,
+    Tuple,
     Union,
     cast,
 )
 
 from . import limits
+from .backoff import backoff_delay
+from .cache import ReadCache
+from .exceptions import UnprocessedItemsError
+from .flush import FlushReport, WriteResult
+from .identity_map import IdentityMap
+from .op.batch_get_item import key_identity
+from .op.transact_write_items import OperationChunk
+from .pool import ClientPool
+from .rate_limit import RateLimiter, is_throttling_error
 
 if TYPE_CHECKING:
     from .model import Model
     from .op import (
+        BatchWriteItem,
         DeleteItem,
         GetItem,
         PutItem,
         Query,
+        Scan,
         UpdateItem,
     )
 
-from .op import DeleteItem, PutItem, TransactWriteItems, UpdateItem
+from .op import (
+    BatchGetItem,
+    BatchWriteItem,
+    DeleteItem,
+    PutItem,
+    TransactWriteItems,
+    UpdateItem,
+)
+
+WriteOp = Union[DeleteItem, PutItem, UpdateItem]
+
+# "transaction" writes every change in TransactWriteItems requests. "batch"
+# writes adds and deletes with BatchWriteItem and modified objects with one
+# UpdateItem each, which costs half the write capacity; only the groups
+# declared with `atomic()` are written in transactions.
+FlushStrategy = Literal["transaction", "batch"]
+FLUSH_STRATEGIES = ("transaction", "batch")
+
+# (client method, request, writes sent by the request)
+FlushTask = Tuple[str, Dict[str, Any], List[WriteOp]]
+
+# ("put" or "delete", object, whether the item may already exist in
+#  DynamoDB)
+PendingOp = Tuple[str, "Model", bool]
 
 
 class _ThreadLocalRegistry:
@@ -133,50 +178,403 @@ class _AsyncScopedRegistry:
 
 
 class SessionBase:
-    def __init__(self, raise_on_item_limits: Optional[bool] = False):
-        self.object_registry: Dict[Any, "Model"] = {}
-        self.objects_to_add: Set["Model"] = set()
-        self.objects_to_delete: Dict[Any, "Model"] = {}
+    def __init__(
+        self,
+        raise_on_item_limits: Optional[bool] = False,
+        max_batch_retries: int = 10,
+        readonly: bool = False,
+        max_concurrency: int = 8,
+        flush_strategy: FlushStrategy = "transaction",
+        identity_map_factory: Callable[[], IdentityMap] = IdentityMap,
+        cache: Optional[ReadCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        if flush_strategy not in FLUSH_STRATEGIES:
+            raise ValueError(
+                f"flush_strategy must be one of {', '.join(FLUSH_STRATEGIES)}"
+            )
+
+        self.object_registry = identity_map_factory()
+        self.object_registry.pinned = self._is_pinned
+        # The pending add or delete of each item, by `Model.ref`.
+        self.pending: Dict[Any, PendingOp] = {}
+        self.atomic_groups: List[List["Model"]] = []
         self.raise_on_item_limits = raise_on_item_limits
+        self.max_batch_retries = max_batch_retries
+        self.readonly = readonly
+        self.max_concurrency = max_concurrency
+        self.flush_strategy = flush_strategy
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+
+    @property
+    def objects_to_add(self) -> List["Model"]:
+        return [obj for kind, obj, _ in self.pending.values() if kind == "put"]
+
+    @property
+    def objects_to_delete(self) -> List["Model"]:
+        return [
+            obj for kind, obj, _ in self.pending.values() if kind == "delete"
+        ]
 
     def add(self, obj: "Model") -> None:
-        if not obj.ref:
+        """
+        Adds an object, which is put when the session is saved.
+
+        Each item has one pending operation, so adding an object replaces
+        an earlier add or delete of the same item. Adding an object that was
+        loaded by the session does nothing: its changes are saved anyway.
+        """
+        ref = obj.ref
+        if not ref:
             raise Exception("no ref")
 
-        if obj.ref not in self.object_registry:
-            self.object_registry[obj.ref] = obj
-            self.objects_to_add.add(obj)
+        if obj.is_readonly:
+            raise TypeError(
+                "read-only instances cannot be added to a session, "
+                "call track() first"
+            )
+
+        pending = self.pending.get(ref)
+        registered = self.object_registry.get(ref)
+
+        if pending is None:
+            if registered is obj:
+                return
+            self.pending[ref] = ("put", obj, registered is not None)
+        else:
+            replaces = pending[2] or pending[0] == "delete"
+            self.pending[ref] = ("put", obj, replaces)
+
+        self.object_registry[ref] = obj
+
+    def _is_pinned(self, obj: "Model") -> bool:
+        # Pending and modified objects must stay in the identity map until
+        # they are saved. Objects only changed in place may be evicted, but
+        # remain visible to `_pending_writes` while they are referenced.
+        return obj.maybe_modified or obj.ref in self.pending
 
     def delete(self, obj: "Model") -> None:
-        if not obj.ref:
+        """
+        Deletes an object when the session is saved.
+
+        Deleting an object added to the session since it was last saved
+        discards the add, unless it replaced an item the session loaded or
+        deleted, in which case the item is deleted.
+        """
+        ref = obj.ref
+        if not ref:
             raise Exception("no ref")
-        self.objects_to_delete[obj] = obj
+
+        pending = self.pending.get(ref)
+
+        if pending is not None and pending[0] == "put" and not pending[2]:
+            del self.pending[ref]
+            self.object_registry.discard(ref)
+            return
+
+        self.pending[ref] = ("delete", obj, True)
+
+    def atomic(self, *objs: "Model") -> None:
+        """
+        Declares that the pending changes of `objs` must be written in the
+        same transaction when the session is saved with `chunked=True`.
+
+        eg:
+            session.atomic(order, invoice)
+        """
+        self.atomic_groups.append(list(objs))
+
+    def _pending_writes(self) -> List[Tuple["Model", WriteOp]]:
+        writes: List[Tuple["Model", WriteOp]] = []
+
+        # A put writes the current state of an object, its modifications
+        # included.
+        for kind, obj, _ in self.pending.values():
+            if kind == "delete":
+                writes.append((obj, DeleteItem(obj)))
+            else:
+                writes.append((obj, PutItem(obj)))
+
+        for obj in self.object_registry.objects():
+            if obj.ref in self.pending:
+                continue
+            modified_attrs = obj.modified_attrs
+            if modified_attrs:
+                writes.append((obj, UpdateItem(obj, modified_attrs)))
+
+        return writes
 
     def as_transaction(self) -> TransactWriteItems:
-        items: List[Union[DeleteItem, PutItem, UpdateItem]] = []
+        transaction = TransactWriteItems(
+            *[op for _, op in self._pending_writes()]
+        )
 
-        for obj in self.objects_to_delete:
-            items.append(DeleteItem(obj))
+        if self.raise_on_item_limits:
+            limits.check_transact_write_items(transaction.to_dynamodb())
 
-        for obj in self.objects_to_add:
-            if obj not in self.objects_to_delete:
-                items.append(PutItem(obj))
+        return transaction
 
-        for _, obj in self.object_registry.items():
-            if obj not in self.objects_to_delete and obj.modified_attributes():
-                items.append(UpdateItem(obj))
+    def as_transaction_chunks(self) -> List[Dict[str, Any]]:
+        """
+        Splits the pending changes into TransactWriteItems requests that
+        respect the DynamoDB limits.
 
-        if (
-            self.raise_on_item_limits
-            and len(items) > limits.TRANSACT_WRITE_ITEMS
-        ):
-            raise Exception("limit")
+        The changes of each group declared with `atomic()` are kept in one
+        request, which raises `RequestLimitError` if it is too large; the
+        other changes are packed into as few requests as possible.
+        """
+        return [request for request, _ in self._transaction_chunks()]
 
-        return TransactWriteItems(*items)
+    def _transaction_chunks(self) -> List[OperationChunk]:
+        """
+        Returns the requests of `as_transaction_chunks`, with the operations
+        written by each request.
+        """
+        grouped, ungrouped = self._split_atomic_groups()
+
+        chunks = self._atomic_group_requests(grouped)
+        chunks.extend(TransactWriteItems(*ungrouped).operation_chunks())
+
+        return chunks
+
+    def _chunk_responses(
+        self,
+        chunks: List[OperationChunk],
+        outcomes: List[Any],
+    ) -> List[Any]:
+        """
+        Registers the writes of the chunked requests that succeeded, then
+        raises the error of the first request that failed, if any.
+
+        Args:
+            chunks (List[OperationChunk]): The requests sent.
+            outcomes (List[Any]): The response, or the exception raised, of
+                each request.
+        """
+        for (_, ops), outcome in zip(chunks, outcomes):
+            if not isinstance(outcome, BaseException):
+                self._register_writes(ops)
+
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+        return outcomes
+
+    def as_batch(self) -> List[FlushTask]:
+        """
+        Splits the pending changes into the independent requests of the
+        "batch" flush strategy: a TransactWriteItems request per group
+        declared with `atomic()`, BatchWriteItem requests for the other adds
+        and deletes, and an UpdateItem request per other modified object.
+        """
+        return self._plan_batch()[0]
+
+    def _plan_batch(self) -> Tuple[List[FlushTask], List[WriteResult]]:
+        """
+        Returns the tasks of `as_batch`, and a result for each add or
+        delete that BatchWriteItem dropped because a later write of the same
+        key supersedes it.
+        """
+        grouped, ungrouped = self._split_atomic_groups()
+
+        tasks: List[FlushTask] = []
+
+        for ops in grouped:
+            if ops:
+                request = TransactWriteItems(*ops).to_dynamodb()
+                limits.check_transact_write_items(request)
+                tasks.append(("transact_write_items", request, ops))
+
+        writes: List[Union[PutItem, DeleteItem]] = []
+        updates: List[FlushTask] = []
+
+        for op in ungrouped:
+            if op.__class__.__name__ == "UpdateItem":
+                request = cast(UpdateItem, op).to_dynamodb(return_values="NONE")
+                updates.append(("update_item", request, [op]))
+            else:
+                writes.append(cast(Union[PutItem, DeleteItem], op))
+
+        written: Set[int] = set()
+        for request, batch_ops in BatchWriteItem(*writes).operation_chunks():
+            tasks.append(("batch_write_item", request, list(batch_ops)))
+            written.update(id(op) for op in batch_ops)
+
+        tasks.extend(updates)
+
+        superseded = [
+            WriteResult(op, superseded=True)
+            for op in writes
+            if id(op) not in written
+        ]
+
+        return tasks, superseded
+
+    @staticmethod
+    def _flush_report(
+        outcomes: List[List[WriteResult]],
+        superseded: List[WriteResult],
+        raise_on_errors: bool,
+    ) -> FlushReport:
+        report = FlushReport(
+            [result for outcome in outcomes for result in outcome] + superseded
+        )
+        if raise_on_errors:
+            report.raise_for_errors()
+        return report
+
+    def _flush_results(
+        self,
+        task: FlushTask,
+        response: Any = None,
+        error: Optional[Exception] = None,
+    ) -> List[WriteResult]:
+        _, _, ops = task
+        self._invalidate(ops)
+        if error is None:
+            self._register_writes(ops)
+        return [WriteResult(op, response, error) for op in ops]
+
+    def _split_atomic_groups(
+        self,
+    ) -> Tuple[List[List[WriteOp]], List[WriteOp]]:
+        group_of: Dict["Model", int] = {}
+        for position, group in enumerate(self.atomic_groups):
+            for obj in group:
+                group_of[obj] = position
+
+        grouped: List[List[WriteOp]] = [[] for _ in self.atomic_groups]
+        ungrouped: List[WriteOp] = []
+
+        for obj, op in self._pending_writes():
+            position = group_of.get(obj)
+            if position is None:
+                ungrouped.append(op)
+            else:
+                grouped[position].append(op)
+
+        return grouped, ungrouped
+
+    @staticmethod
+    def _atomic_group_requests(
+        grouped: List[List[WriteOp]],
+    ) -> List[OperationChunk]:
+        chunks: List[OperationChunk] = []
+
+        for ops in grouped:
+            if ops:
+                transaction = TransactWriteItems(*ops)
+                request = transaction.to_dynamodb()
+                limits.check_transact_write_items(request)
+                chunks.append((request, transaction.operations))
+
+        return chunks
+
+    def _batch_get_item(self, ops: List["GetItem"]) -> BatchGetItem:
+        return BatchGetItem(
+            *[op for op in ops if op.ref not in self.object_registry]
+        )
+
+    def _store_batch_get_response(
+        self,
+        batch: BatchGetItem,
+        res: Dict[str, Any],
+        results: Dict[Any, "Model"],
+    ) -> Dict[str, Any]:
+        for table_name, items in res.get("Responses", {}).items():
+            for item in items:
+                instance = batch.from_dynamodb_item(
+                    table_name, item, readonly=self.readonly
+                )
+                results[instance.ref] = instance
+                if not self.readonly:
+                    self.object_registry[instance.ref] = instance
+
+        return res.get("UnprocessedKeys") or {}
+
+    def _store_page(
+        self,
+        op: Union["Query", "Scan"],
+        items: List[Dict[str, Any]],
+    ) -> List["Model"]:
+        readonly = self.readonly if op.readonly is None else op.readonly
+        if readonly:
+            return op.model.from_dynamodb_items(items, readonly=True)
+
+        # Streamed items are only held weakly, so that reading a large query
+        # or scan keeps no more than the pages the caller holds in memory.
+        return [
+            self.object_registry.setdefault_weak(instance.ref, instance)
+            for instance in op.model.from_dynamodb_items(items)
+        ]
+
+    def _register_batch_write(self, op: "BatchWriteItem") -> None:
+        self._register_writes(op.operations)
+
+    def _invalidate(self, operations: Iterable[Any]) -> None:
+        """
+        Drops the items written by `operations` from the shared read cache.
+        """
+        if self.cache is None:
+            return
+
+        for operation in operations:
+            if operation.__class__.__name__ == "PutItem":
+                obj = cast("PutItem", operation).instance
+                model_cls, key = obj.__class__, obj.primary_key
+            elif operation.__class__.__name__ == "UpdateItem":
+                obj = cast("UpdateItem", operation).obj
+                model_cls, key = obj.__class__, obj.primary_key
+            else:
+                delete_item = cast("DeleteItem", operation)
+                model_cls, key = delete_item.model_cls, delete_item.key
+
+            if model_cls.__table__ is not None:
+                self.cache.invalidate(model_cls.__table__.name, key)
+
+    def _register_writes(self, operations: Iterable[Any]) -> None:
+        """
+        Records writes that succeeded: the pending add or delete each one
+        sent is done, and the values written are the original state of the
+        objects, which may be evicted again.
+        """
+        for operation in operations:
+            if operation.__class__.__name__ == "PutItem":
+                instance = cast("PutItem", operation).instance
+                instance.mark_written()
+                self._release_pending(instance.ref, "put", instance)
+                self.object_registry[instance.ref] = instance
+                self.object_registry.release(instance)
+            elif operation.__class__.__name__ == "UpdateItem":
+                update = cast("UpdateItem", operation)
+                update.obj.mark_written(update.modified_attrs)
+                self.object_registry.release(update.obj)
+            elif operation.__class__.__name__ == "DeleteItem":
+                ref = cast("DeleteItem", operation).ref
+                self.object_registry.discard(ref)
+                self._release_pending(ref, "delete")
+
+    def _release_pending(
+        self,
+        ref: Any,
+        kind: str,
+        obj: Optional["Model"] = None,
+    ) -> None:
+        # The slot may hold a newer add or delete, made while the write was
+        # in flight, which is still to be saved.
+        pending = self.pending.get(ref)
+        if pending is None or pending[0] != kind:
+            return
+        if obj is not None and pending[1] is not obj:
+            return
+        del self.pending[ref]
 
     def clear(self) -> None:
-        self.objects_to_add.clear()
-        self.objects_to_delete.clear()
+        self.object_registry.clear()
+        self.pending.clear()
+        self.atomic_groups.clear()
 
 
 class Session(SessionBase):
@@ -184,95 +582,1118 @@ class Session(SessionBase):
         super().__init__(**kwargs)
         self.client = client
 
+    def _call(self, method: str, **request: Any) -> Any:
+        """
+        Sends a request with the client, within the budget of the rate
+        limiter when there is one.
+        """
+        limiter = self.rate_limiter
+        if limiter is None:
+            return getattr(self.client, method)(**request)
+
+        reservation, delay = limiter.reserve(method, request)
+        if reservation is None:
+            return getattr(self.client, method)(**request)
+
+        if delay:
+            time.sleep(delay)
+
+        try:
+            res = getattr(self.client, method)(
+                **{**request, "ReturnConsumedCapacity": "INDEXES"}
+            )
+        except Exception as e:
+            if is_throttling_error(e):
+                limiter.throttled(reservation)
+            raise
+
+        limiter.record(reservation, res)
+        return res
+
     def _get_item(self, op: "GetItem") -> "Model":
-        if op.instance.ref in self.object_registry:
-            return op.instance
+        registered = self.object_registry.get(op.ref)
+        if registered is not None:
+            return registered
+
+        request = op.to_dynamodb()
+        table_name, key = request["TableName"], request["Key"]
+        cache = self.cache
 
-        client_func = self.client.get_item
+        item = None
+        if cache is not None:
+            item = cache.get_item(table_name, key)
 
-        res = client_func(**op.to_dynamodb())
+        if item is None:
+            token = cache.token(table_name) if cache else 0
+            res = self._call("get_item", **request)
+            item = res["Item"]
+            if cache is not None:
+                cache.put_item(table_name, key, item, token)
 
         model_cls = op.model_cls
 
-        instance = model_cls.from_dynamodb_item(res["Item"])
+        instance = model_cls.from_dynamodb_item(item, readonly=self.readonly)
 
-        self.object_registry[op.instance.ref] = instance
+        if not self.readonly:
+            self.object_registry[op.ref] = instance
         return instance
 
     def _put_item(self, op: "PutItem") -> "Model":
-        client_func = self.client.put_item
-
-        client_func(**op.to_dynamodb())
+        try:
+            self._call("put_item", **op.to_dynamodb())
+        finally:
+            self._invalidate([op])
 
-        self.object_registry[op.instance.ref] = op.instance
+        self._register_writes([op])
         return op.instance
 
-    def execute(self, op: Union["GetItem", "PutItem", "Query"]) -> Any:
+    def get_many(self, ops: Iterable["GetItem"]) -> List[Optional["Model"]]:
+        """
+        Loads many items through BatchGetItem.
+
+        Keys are sent 100 at a time and `UnprocessedKeys` are resubmitted with
+        backoff. Items already in the object registry are not requested again.
+
+        Returns:
+            list: One model (or None if the item does not exist) per op, in
+            the same order as `ops`.
+        """
+        ops = list(ops)
+        batch = self._batch_get_item(ops)
+        results: Dict[Any, "Model"] = {}
+
+        for request in batch.chunks():
+            attempt = 0
+            while True:
+                res = self._call("batch_get_item", **request)
+                unprocessed = self._store_batch_get_response(
+                    batch, res, results
+                )
+                if not unprocessed:
+                    break
+
+                attempt += 1
+                if attempt > self.max_batch_retries:
+                    raise UnprocessedItemsError(unprocessed)
+                time.sleep(backoff_delay(attempt))
+                request = {"RequestItems": unprocessed}
+
+        return [
+            results.get(op.ref) or self.object_registry.get(op.ref)
+            for op in ops
+        ]
+
+    def _batch_write_request(self, request: Dict[str, Any]) -> Any:
+        attempt = 0
+        while True:
+            res = self._call("batch_write_item", **request)
+            unprocessed = res.get("UnprocessedItems")
+            if not unprocessed:
+                return res
+
+            attempt += 1
+            if attempt > self.max_batch_retries:
+                raise UnprocessedItemsError(unprocessed)
+            time.sleep(backoff_delay(attempt))
+            request = {"RequestItems": unprocessed}
+
+    def _batch_write_item(self, op: "BatchWriteItem") -> None:
+        try:
+            for request in op.chunks():
+                self._batch_write_request(request)
+        finally:
+            self._invalidate(op.operations)
+
+        self._register_batch_write(op)
+
+    def _query(self, op: "Query") -> Iterator["Model"]:
+        cache = self.cache
+        if cache is None:
+            yield from self._query_pages(op, None)
+            return
+
+        request = op.to_dynamodb()
+
+        cached = cache.get_query(request)
+        if cached is not None:
+            yield from self._store_page(op, cached)
+            return
+
+        # Only a query read to the end is cached.
+        token = cache.token(request["TableName"])
+        items: List[Dict[str, Any]] = []
+        yield from self._query_pages(op, items)
+        cache.put_query(request, items, token)
+
+    def _query_pages(
+        self,
+        op: "Query",
+        items: Optional[List[Dict[str, Any]]],
+    ) -> Iterator["Model"]:
+        remaining = op.limit
+        start_key = None
+
+        while True:
+            res = self._call(
+                "query", **op.to_dynamodb(start_key=start_key, limit=remaining)
+            )
+            page_items = res.get("Items", [])
+            if items is not None:
+                items.extend(page_items)
+
+            page = self._store_page(op, page_items)
+
+            yield from page
+
+            if remaining is not None:
+                remaining -= len(page)
+                if remaining <= 0:
+                    return
+
+            start_key = res.get("LastEvaluatedKey")
+            if not start_key:
+                return
+
+    def _scan_pages(
+        self,
+        op: "Scan",
+        segment: int,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        start_key = None
+
+        while True:
+            res = self._call(
+                "scan", **op.to_dynamodb(segment=segment, start_key=start_key)
+            )
+            yield res.get("Items", [])
+
+            start_key = res.get("LastEvaluatedKey")
+            if not start_key:
+                return
+
+    def _scan_segment(self, op: "Scan", segment: int) -> Iterator["Model"]:
+        for items in self._scan_pages(op, segment):
+            yield from self._store_page(op, items)
+
+    def scan_segments(self, op: "Scan") -> List[Iterator["Model"]]:
+        """
+        Returns one lazy iterator per segment of a scan, for callers that
+        want to process segments separately.
+        """
+        return [
+            self._scan_segment(op, segment)
+            for segment in range(op.total_segments)
+        ]
+
+    def _scan(self, op: "Scan") -> Iterator["Model"]:
+        if op.total_segments == 1:
+            yield from self._scan_segment(op, 0)
+            return
+
+        pages: "queue.Queue[Any]" = queue.Queue(maxsize=op.total_segments)
+        stop = threading.Event()
+
+        def fetch_segment(segment: int) -> None:
+            try:
+                for items in self._scan_pages(op, segment):
+                    if stop.is_set():
+                        break
+                    pages.put(items)
+            except Exception as e:
+                pages.put(e)
+            else:
+                pages.put(None)
+
+        executor = ThreadPoolExecutor(max_workers=op.total_segments)
+        for segment in range(op.total_segments):
+            executor.submit(fetch_segment, segment)
+
+        finished = 0
+        try:
+            while finished < op.total_segments:
+                items = pages.get()
+                if items is None or isinstance(items, Exception):
+                    finished += 1
+                    if items is not None:
+                        raise items
+                    continue
+
+                yield from self._store_page(op, items)
+        finally:
+            stop.set()
+            # Unblock the segments still waiting to hand over a page.
+            while finished < op.total_segments:
+                items = pages.get()
+                if items is None or isinstance(items, Exception):
+                    finished += 1
+            executor.shutdown()
+
+    def execute(
+        self,
+        op: Union["GetItem", "PutItem", "Query", "Scan", "BatchWriteItem"],
+    ) -> Any:
         if op.__class__.__name__ == "GetItem":
             return self._get_item(cast("GetItem", op))
 
+        if op.__class__.__name__ == "Query":
+            return self._query(cast("Query", op))
+
+        if op.__class__.__name__ == "Scan":
+            return self._scan(cast("Scan", op))
+
         if op.__class__.__name__ == "PutItem":
             return self._put_item(cast("PutItem", op))
 
+        if op.__class__.__name__ == "BatchWriteItem":
+            return self._batch_write_item(cast("BatchWriteItem", op))
+
         raise NotImplementedError()
 
-    def save(self) -> Any:
-        transaction = self.as_transaction()
+    def _flush_task(self, task: FlushTask) -> List[WriteResult]:
+        method, request, _ = task
+        try:
+            if method == "batch_write_item":
+                response = self._batch_write_request(request)
+            else:
+                response = self._call(method, **request)
+        except Exception as e:
+            return self._flush_results(task, error=e)
+        return self._flush_results(task, response)
+
+    def _save_batch(self, raise_on_errors: bool) -> FlushReport:
+        tasks, superseded = self._plan_batch()
+
+        if len(tasks) <= 1:
+            outcomes = [self._flush_task(task) for task in tasks]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(tasks))
+            ) as executor:
+                outcomes = list(executor.map(self._flush_task, tasks))
 
-        client = self.client
-        return client.transact_write_items(transaction.to_dynamodb())
+        return self._flush_report(outcomes, superseded, raise_on_errors)
+
+    def save(
+        self,
+        chunked: bool = False,
+        flush_strategy: Optional[FlushStrategy] = None,
+        raise_on_errors: bool = True,
+    ) -> Any:
+        """
+        Writes the pending changes in one TransactWriteItems request.
+
+        With the "batch" flush strategy (by default the session's
+        `flush_strategy`), the changes are split by `as_batch` and written
+        with BatchWriteItem and UpdateItem requests instead, and `chunked`
+        does not apply. The requests are sent concurrently, up to
+        `max_concurrency` at a time, and a `FlushReport` is returned. A
+        failed request does not stop the others, but `FlushError`, which
+        holds the report, is raised once they are all done, unless
+        `raise_on_errors` is False.
+
+        With `chunked=True`, the changes are split by `as_transaction_chunks`
+        and the requests are submitted concurrently, up to `max_concurrency`
+        at a time. Each request is atomic, but a failed request does not roll
+        back the others.
+
+        Returns:
+            The TransactWriteItems response, with `chunked=True` the list of
+            responses in request order, or with the "batch" flush strategy a
+            `FlushReport`.
+        """
+        if (flush_strategy or self.flush_strategy) == "batch":
+            return self._save_batch(raise_on_errors)
+
+        def client_func(request: Dict[str, Any]) -> Any:
+            return self._call("transact_write_items", **request)
+
+        if not chunked:
+            transaction = self.as_transaction()
+            try:
+                res = client_func(transaction.to_dynamodb())
+            finally:
+                self._invalidate(transaction.operations)
+
+            self._register_writes(transaction.operations)
+            return res
+
+        chunks = self._transaction_chunks()
+        try:
+            if len(chunks) <= 1:
+                responses = [client_func(request) for request, _ in chunks]
+                for _, ops in chunks:
+                    self._register_writes(ops)
+                return responses
+
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(chunks))
+            ) as executor:
+                futures = [
+                    executor.submit(client_func, request)
+                    for request, _ in chunks
+                ]
+
+            return self._chunk_responses(
+                chunks,
+                [future.exception() or future.result() for future in futures],
+            )
+        finally:
+            self._invalidate(op for _, ops in chunks for op in ops)
 
 
 class AsyncSession(SessionBase):
-    def __init__(self, client: Any, **kwargs: Any):
+    def __init__(
+        self,
+        client: Any,
+        batch_window: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+        limiter: Optional[Callable[[], Optional[asyncio.Semaphore]]] = None,
+        **kwargs: Any,
+    ):
+        """
+        Args:
+            client (Any): The async DynamoDB client.
+            batch_window (Optional[float]): When set, the `get_item` calls
+                made within `batch_window` seconds of one another (0: within
+                the same event loop iteration) are sent together as
+                BatchGetItem requests.
+            max_in_flight (Optional[int]): The maximum number of requests
+                the session sends at the same time. Further requests wait
+                for a slot.
+            limiter (Optional[Callable[[], Optional[asyncio.Semaphore]]]):
+                Returns a limit on the requests in flight shared with other
+                sessions, eg: `AsyncSessionMaker.limiter`.
+            **kwargs: Passed to `SessionBase`.
+        """
         super().__init__(**kwargs)
         self.client = client
+        self.batch_window = batch_window
+        self.max_in_flight = max_in_flight
+
+        self.limiter = limiter
+        # Created by the first request, see `_limiters()`.
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # The GetItem requests in progress, when there is no shared cache.
+        self._in_flight: Dict[Any, "asyncio.Future[Any]"] = {}
+        # The reads waiting for the next BatchGetItem, with the futures of
+        # their callers.
+        self._batched_reads: List[
+            Tuple[str, Dict[str, Any], "asyncio.Future[Any]"]
+        ] = []
+        self._batch_tasks: Set["asyncio.Task[None]"] = set()
+
+    def _limiters(self) -> List[asyncio.Semaphore]:
+        """
+        Returns the limits on requests in flight a request waits for.
+
+        The semaphores are created inside the running event loop: on Python
+        3.9, a semaphore is bound to the loop current when it is created.
+        """
+        limiters: List[asyncio.Semaphore] = []
+        if self.max_in_flight is not None:
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.max_in_flight)
+            limiters.append(self._semaphore)
+        if self.limiter is not None:
+            shared = self.limiter()
+            if shared is not None:
+                limiters.append(shared)
+        return limiters
+
+    async def _call(self, method: str, **request: Any) -> Any:
+        """
+        Sends a request with the client, once the session's and the maker's
+        limits on requests in flight allow it, and within the budget of the
+        rate limiter when there is one.
+        """
+        limiter = self.rate_limiter
+        reservation = None
+
+        if limiter is not None:
+            reservation, delay = limiter.reserve(method, request)
+            if reservation is not None:
+                request = {**request, "ReturnConsumedCapacity": "INDEXES"}
+                if delay:
+                    await asyncio.sleep(delay)
+
+        limiters = self._limiters()
+        try:
+            if not limiters:
+                res = await getattr(self.client, method)(**request)
+            else:
+                async with contextlib.AsyncExitStack() as stack:
+                    for semaphore in limiters:
+                        await stack.enter_async_context(semaphore)
+                    res = await getattr(self.client, method)(**request)
+        except Exception as e:
+            if reservation is not None and is_throttling_error(e):
+                cast(RateLimiter, limiter).throttled(reservation)
+            raise
+
+        if reservation is not None:
+            cast(RateLimiter, limiter).record(reservation, res)
+        return res
 
     async def get_item(self, op: "GetItem") -> Optional["Model"]:
-        if op.instance.ref in self.object_registry:
-            return op.instance
-
-        client_func = self.client.get_item
-
-        res = await client_func(op.to_dynamodb())
+        registered = self.object_registry.get(op.ref)
+        if registered is not None:
+            return registered
 
-        if "Item" not in res:
+        item = await self._fetch_item(op.to_dynamodb())
+        if item is None:
             return None
 
+        # A concurrent call for the same item may have registered it first.
+        if op.ref in self.object_registry:
+            return self.object_registry[op.ref]
+
         model_cls = op.model_cls
 
-        instance = model_cls.from_dynamodb_item(res["Item"])
+        instance = model_cls.from_dynamodb_item(item, readonly=self.readonly)
+
+        if not self.readonly:
+            self.object_registry[op.ref] = instance
+        return instance
+
+    async def _fetch_item(
+        self,
+        request: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Reads a raw item, from the shared cache when there is one.
+
+        Concurrent reads of the same key share a single GetItem request,
+        sent by a task of its own: every caller awaits its result, so
+        cancelling one of them, even the first, leaves the others waiting.
+        With a shared cache, this spans every session of the maker running
+        on the event loop.
+        """
+        table_name, key = request["TableName"], request["Key"]
+        cache = self.cache
+
+        if cache is not None:
+            item = cache.get_item(table_name, key)
+            if item is not None:
+                return item
+
+        loop = asyncio.get_running_loop()
+        in_flight = self._in_flight if cache is None else cache.in_flight
+        flight_key = (loop, key_identity(table_name, key))
+
+        task = in_flight.get(flight_key)
+        if task is None:
+            task = loop.create_task(self._read_item(request))
+            in_flight[flight_key] = task
+
+            def done(task: "asyncio.Future[Any]") -> None:
+                del in_flight[flight_key]
+                if not task.cancelled():
+                    # Mark it retrieved: the callers, if any, raise it too.
+                    task.exception()
+
+            task.add_done_callback(done)
+
+        return await asyncio.shield(task)
+
+    async def _read_item(
+        self,
+        request: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        table_name, key = request["TableName"], request["Key"]
+        cache = self.cache
+
+        token = cache.token(table_name) if cache else 0
+        if self.batch_window is None:
+            res = await self._call("get_item", **request)
+            item = res.get("Item")
+        else:
+            item = await self._batched_read(table_name, key)
+
+        if item is not None and cache is not None:
+            cache.put_item(table_name, key, item, token)
+        return item
+
+    async def _batched_read(
+        self,
+        table_name: str,
+        key: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Any]" = loop.create_future()
+
+        self._batched_reads.append((table_name, key, future))
+        if len(self._batched_reads) == 1:
+            if self.batch_window:
+                loop.call_later(self.batch_window, self._dispatch_reads)
+            else:
+                loop.call_soon(self._dispatch_reads)
+
+        return await future
+
+    def _dispatch_reads(self) -> None:
+        reads, self._batched_reads = self._batched_reads, []
+
+        task = asyncio.get_running_loop().create_task(self._load_reads(reads))
+        # The loop only keeps weak references to tasks.
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _load_reads(
+        self,
+        reads: List[Tuple[str, Dict[str, Any], "asyncio.Future[Any]"]],
+    ) -> None:
+        waiting: Dict[Any, List["asyncio.Future[Any]"]] = {}
+        key_columns: Dict[str, List[str]] = {}
+        keys: List[Tuple[str, Dict[str, Any]]] = []
+
+        for table_name, key, future in reads:
+            identity = key_identity(table_name, key)
+            if identity not in waiting:
+                waiting[identity] = []
+                key_columns.setdefault(table_name, list(key))
+                keys.append((table_name, key))
+            waiting[identity].append(future)
+
+        try:
+            for start in range(0, len(keys), limits.BATCH_GET_ITEM):
+                chunk = keys[start : start + limits.BATCH_GET_ITEM]
+
+                request_items: Dict[str, Any] = {}
+                for table_name, key in chunk:
+                    request_items.setdefault(table_name, {"Keys": []})
+                    request_items[table_name]["Keys"].append(key)
+
+                attempt = 0
+                while True:
+                    res = await self._call(
+                        "batch_get_item", RequestItems=request_items
+                    )
+
+                    for table_name, items in res.get("Responses", {}).items():
+                        for item in items:
+                            identity = key_identity(
+                                table_name,
+                                {
+                                    col: item[col]
+                                    for col in key_columns[table_name]
+                                },
+                            )
+                            for future in waiting.pop(identity, []):
+                                if not future.done():
+                                    future.set_result(item)
+
+                    request_items = res.get("UnprocessedKeys") or {}
+                    if not request_items:
+                        break
+
+                    attempt += 1
+                    if attempt > self.max_batch_retries:
+                        raise UnprocessedItemsError(request_items)
+                    await asyncio.sleep(backoff_delay(attempt))
+        except asyncio.CancelledError:
+            for futures in waiting.values():
+                for future in futures:
+                    future.cancel()
+            raise
+        except Exception as e:
+            for futures in waiting.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        # The keys left were not found.
+        for futures in waiting.values():
+            for future in futures:
+                if not future.done():
+                    future.set_result(None)
+
+    async def get_many(
+        self,
+        ops: Iterable["GetItem"],
+    ) -> List[Optional["Model"]]:
+        """
+        Async version of `Session.get_many`.
+        """
+        ops = list(ops)
+        batch = self._batch_get_item(ops)
+        results: Dict[Any, "Model"] = {}
+
+        for request in batch.chunks():
+            attempt = 0
+            while True:
+                res = await self._call("batch_get_item", **request)
+                unprocessed = self._store_batch_get_response(
+                    batch, res, results
+                )
+                if not unprocessed:
+                    break
+
+                attempt += 1
+                if attempt > self.max_batch_retries:
+                    raise UnprocessedItemsError(unprocessed)
+                await asyncio.sleep(backoff_delay(attempt))
+                request = {"RequestItems": unprocessed}
+
+        return [
+            results.get(op.ref) or self.object_registry.get(op.ref)
+            for op in ops
+        ]
+
+    def stream(
+        self,
+        op: Union["Query", "Scan"],
+        prefetch: int = 1,
+    ) -> AsyncIterator["Model"]:
+        """
+        Iterates over the results of a query or a scan, one page at a time.
+
+        While the consumer works through a page of a query, up to `prefetch`
+        following pages are already being fetched in the background. The
+        segments of a scan are all read concurrently and merged.
+
+        eg:
+            async for user in session.stream(Query(User).where(...)):
+                ...
+        """
+        if op.__class__.__name__ == "Scan":
+            return self._scan(cast("Scan", op))
+        return self._stream_query(cast("Query", op), prefetch)
+
+    async def _stream_query(
+        self,
+        op: "Query",
+        prefetch: int,
+    ) -> AsyncIterator["Model"]:
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")
+
+        pages: "asyncio.Queue[Any]" = asyncio.Queue()
+        slots = asyncio.Semaphore(prefetch)
+
+        async def fetch_pages() -> None:
+            remaining = op.limit
+            start_key = None
+
+            try:
+                while True:
+                    await slots.acquire()
+                    res = await self._call(
+                        "query",
+                        **op.to_dynamodb(start_key=start_key, limit=remaining),
+                    )
+                    items = res.get("Items", [])
+                    pages.put_nowait(items)
+
+                    if remaining is not None:
+                        remaining -= len(items)
+                        if remaining <= 0:
+                            break
+
+                    start_key = res.get("LastEvaluatedKey")
+                    if not start_key:
+                        break
+            except Exception as e:
+                pages.put_nowait(e)
+            else:
+                pages.put_nowait(None)
+
+        task = asyncio.ensure_future(fetch_pages())
+
+        try:
+            while True:
+                items = await pages.get()
+                if items is None:
+                    return
+                if isinstance(items, Exception):
+                    raise items
+
+                slots.release()
+
+                for instance in self._store_page(op, items):
+                    yield instance
+        finally:
+            task.cancel()
+
+    async def _scan_pages(
+        self,
+        op: "Scan",
+        segment: int,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        start_key = None
+
+        while True:
+            res = await self._call(
+                "scan", **op.to_dynamodb(segment=segment, start_key=start_key)
+            )
+            yield res.get("Items", [])
+
+            start_key = res.get("LastEvaluatedKey")
+            if not start_key:
+                return
+
+    async def _scan_segment(
+        self,
+        op: "Scan",
+        segment: int,
+    ) -> AsyncIterator["Model"]:
+        async for items in self._scan_pages(op, segment):
+            for instance in self._store_page(op, items):
+                yield instance
+
+    def scan_segments(self, op: "Scan") -> List[AsyncIterator["Model"]]:
+        """
+        Async version of `Session.scan_segments`.
+        """
+        return [
+            self._scan_segment(op, segment)
+            for segment in range(op.total_segments)
+        ]
+
+    async def _scan(self, op: "Scan") -> AsyncIterator["Model"]:
+        pages: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=op.total_segments)
+
+        async def fetch_segment(segment: int) -> None:
+            try:
+                async for items in self._scan_pages(op, segment):
+                    await pages.put(items)
+            except Exception as e:
+                await pages.put(e)
+            else:
+                await pages.put(None)
+
+        tasks = [
+            asyncio.ensure_future(fetch_segment(segment))
+            for segment in range(op.total_segments)
+        ]
+
+        finished = 0
+        try:
+            while finished < op.total_segments:
+                items = await pages.get()
+                if items is None:
+                    finished += 1
+                    continue
+                if isinstance(items, Exception):
+                    raise items
+
+                for instance in self._store_page(op, items):
+                    yield instance
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _batch_write_request(self, request: Dict[str, Any]) -> Any:
+        attempt = 0
+        while True:
+            res = await self._call("batch_write_item", **request)
+            unprocessed = res.get("UnprocessedItems")
+            if not unprocessed:
+                return res
+
+            attempt += 1
+            if attempt > self.max_batch_retries:
+                raise UnprocessedItemsError(unprocessed)
+            await asyncio.sleep(backoff_delay(attempt))
+            request = {"RequestItems": unprocessed}
+
+    async def _batch_write_item(self, op: "BatchWriteItem") -> None:
+        try:
+            for request in op.chunks():
+                await self._batch_write_request(request)
+        finally:
+            self._invalidate(op.operations)
 
-        self.object_registry[op.instance.ref] = instance
+        self._register_batch_write(op)
+
+    async def _put_item(self, op: "PutItem") -> "Model":
+        try:
+            await self._call("put_item", **op.to_dynamodb())
+        finally:
+            self._invalidate([op])
+
+        self._register_writes([op])
+        return op.instance
+
+    async def _update_item(self, op: "UpdateItem") -> "Model":
+        try:
+            res = await self._call("update_item", **op.to_dynamodb())
+        finally:
+            self._invalidate([op])
+
+        self._register_writes([op])
+
+        # `op.obj` may only hold the key and the updated values, eg: from
+        # `UpdateItem.where`, so it is not served for the item unless the
+        # session already did; the updated item is read from the response.
+        registered = self.object_registry.get(op.obj.ref)
+        if registered is op.obj:
+            return op.obj
+
+        attributes = res.get("Attributes")
+        if not attributes:
+            return op.obj
+
+        instance = op.obj.__class__.from_dynamodb_item(
+            attributes, readonly=self.readonly
+        )
+        if registered is None and not self.readonly:
+            self.object_registry[instance.ref] = instance
         return instance
 
-    async def execute(self, op: Union["GetItem", "PutItem", "Query"]) -> Any:
+    async def _delete_item(self, op: "DeleteItem") -> None:
+        try:
+            await self._call("delete_item", **op.to_dynamodb())
+        finally:
+            self._invalidate([op])
+
+        self._register_writes([op])
+
+    async def _transact_write_items(self, op: TransactWriteItems) -> Any:
+        try:
+            res = await self._call("transact_write_items", **op.to_dynamodb())
+        finally:
+            self._invalidate(op.operations)
+
+        self._register_writes(op.operations)
+        return res
+
+    async def execute(
+        self,
+        op: Union[
+            "GetItem",
+            "PutItem",
+            "UpdateItem",
+            "DeleteItem",
+            "Query",
+            "Scan",
+            "BatchGetItem",
+            "BatchWriteItem",
+            "TransactWriteItems",
+        ],
+    ) -> Any:
+        """
+        Async version of `Session.execute`, for every op of `pynamo.op`.
+
+        Queries and scans are read to the end and return a list; use
+        `stream()` to iterate over their pages as they arrive.
+        """
         if op.__class__.__name__ == "GetItem":
             return await self.get_item(cast("GetItem", op))
+
+        if op.__class__.__name__ == "Query":
+            stream = self.stream(cast("Query", op))
+            return [instance async for instance in stream]
+
+        if op.__class__.__name__ == "Scan":
+            stream = self.stream(cast("Scan", op))
+            return [instance async for instance in stream]
+
+        if op.__class__.__name__ == "PutItem":
+            return await self._put_item(cast("PutItem", op))
+
+        if op.__class__.__name__ == "UpdateItem":
+            return await self._update_item(cast("UpdateItem", op))
+
+        if op.__class__.__name__ == "DeleteItem":
+            return await self._delete_item(cast("DeleteItem", op))
+
+        if op.__class__.__name__ == "BatchGetItem":
+            return await self.get_many(cast("BatchGetItem", op).operations)
+
+        if op.__class__.__name__ == "BatchWriteItem":
+            return await self._batch_write_item(cast("BatchWriteItem", op))
+
+        if op.__class__.__name__ == "TransactWriteItems":
+            return await self._transact_write_items(
+                cast("TransactWriteItems", op)
+            )
+
         raise NotImplementedError()
 
-    async def save(self):
-        transaction = self.as_transaction()
+    async def _flush_task(self, task: FlushTask) -> List[WriteResult]:
+        method, request, _ = task
+        try:
+            if method == "batch_write_item":
+                response = await self._batch_write_request(request)
+            else:
+                response = await self._call(method, **request)
+        except Exception as e:
+            return self._flush_results(task, error=e)
+        return self._flush_results(task, response)
 
-        client = self.client
-        return await client.transact_write_items(transaction.to_dynamodb())
+    async def _save_batch(self, raise_on_errors: bool) -> FlushReport:
+        tasks, superseded = self._plan_batch()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def flush_task(task: FlushTask) -> List[WriteResult]:
+            async with semaphore:
+                return await self._flush_task(task)
+
+        outcomes = await asyncio.gather(*[flush_task(task) for task in tasks])
+
+        return self._flush_report(outcomes, superseded, raise_on_errors)
+
+    async def save(
+        self,
+        chunked: bool = False,
+        flush_strategy: Optional[FlushStrategy] = None,
+        raise_on_errors: bool = True,
+    ) -> Any:
+        """
+        Async version of `Session.save`.
+        """
+        if (flush_strategy or self.flush_strategy) == "batch":
+            return await self._save_batch(raise_on_errors)
+
+        if not chunked:
+            transaction = self.as_transaction()
+            try:
+                res = await self._call(
+                    "transact_write_items", **transaction.to_dynamodb()
+                )
+            finally:
+                self._invalidate(transaction.operations)
+
+            self._register_writes(transaction.operations)
+            return res
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def submit(request: Dict[str, Any]) -> Any:
+            async with semaphore:
+                return await self._call("transact_write_items", **request)
+
+        chunks = self._transaction_chunks()
+        try:
+            outcomes = await asyncio.gather(
+                *[submit(request) for request, _ in chunks],
+                return_exceptions=True,
+            )
+        finally:
+            self._invalidate(op for _, ops in chunks for op in ops)
+
+        return self._chunk_responses(chunks, list(outcomes))
 
 
 class SessionMaker:
-    def __init__(self, client_factory: Callable[[], Any]):
+    def __init__(
+        self,
+        client_factory: Callable[[], Any],
+        cache: Optional[ReadCache] = None,
+        pool_size: Optional[int] = 1,
+        warm_up: Optional[Callable[[Any], Any]] = None,
+        **kwargs: Any,
+    ):
+        """
+        Args:
+            client_factory (Callable[[], Any]): Creates the clients of the
+                sessions.
+            cache (Optional[ReadCache]): A read cache shared by the sessions.
+            pool_size (Optional[int]): The number of clients reused by the
+                sessions in turn. None creates a client per session.
+            warm_up (Optional[Callable[[Any], Any]]): When set, the pool is
+                filled at once and each client is passed to `warm_up`, eg:
+                `lambda client: client.describe_limits()`.
+            **kwargs: Passed to each `Session`, eg:
+                `flush_strategy="batch"`, or a `rate_limiter` shared by the
+                sessions.
+        """
         self.client_factory = client_factory
+        self.cache = cache
+        self.kwargs = kwargs
+
+        self.pool: Optional[ClientPool] = None
+        if pool_size is not None:
+            self.pool = ClientPool(client_factory, pool_size, ping=warm_up)
+            if warm_up is not None:
+                self.pool.warm_up()
 
     def __call__(self) -> Session:
-        return Session(client=self.client_factory())
+        if self.pool is not None:
+            client = self.pool.get()
+        else:
+            client = self.client_factory()
+        return Session(client=client, cache=self.cache, **self.kwargs)
 
 
 class AsyncSessionMaker:
-    def __init__(self, client: Any = None, **kwargs: Any):
+    def __init__(
+        self,
+        client: Any = None,
+        client_factory: Optional[Callable[[], Any]] = None,
+        cache: Optional[ReadCache] = None,
+        pool_size: int = 1,
+        warm_up: Optional[Callable[[Any], Any]] = None,
+        max_in_flight: Optional[int] = None,
+        max_in_flight_per_session: Optional[int] = None,
+        **kwargs: Any,
+    ):
+        """
+        Args:
+            client (Any): The async client shared by every session.
+            client_factory (Optional[Callable[[], Any]]): Creates the clients
+                of the sessions, when `client` is not given.
+            cache (Optional[ReadCache]): A read cache shared by the sessions.
+            pool_size (int): The number of clients reused by the sessions in
+                turn.
+            warm_up (Optional[Callable[[Any], Any]]): Passed each client by
+                `await maker.warm_up()`; awaitable results are awaited.
+            max_in_flight (Optional[int]): The maximum number of requests
+                the sessions, together, send at the same time. The sessions
+                must then run on a single event loop.
+            max_in_flight_per_session (Optional[int]): The `max_in_flight`
+                of each session.
+            **kwargs: Passed to each `AsyncSession`, eg: `batch_window=0`,
+                or a `rate_limiter` shared by the sessions.
+        """
         self.client = client
+        self.cache = cache
         self.kwargs = kwargs
+        self.max_in_flight = max_in_flight
+        self.max_in_flight_per_session = max_in_flight_per_session
+
+        # Created by the first request, see `limiter()`.
+        self._limiter: Optional[asyncio.Semaphore] = None
+
+        self.pool: Optional[ClientPool] = None
+        if client is None and client_factory is not None:
+            self.pool = ClientPool(client_factory, pool_size, ping=warm_up)
+
+    async def warm_up(self) -> None:
+        """
+        Creates the pooled clients and opens their connections.
+        """
+        if self.pool is None:
+            return
+
+        pending = [
+            result
+            for result in self.pool.warm_up()
+            if inspect.isawaitable(result)
+        ]
+        await asyncio.gather(*pending)
+
+    def limiter(self) -> Optional[asyncio.Semaphore]:
+        """
+        Returns the limit on the requests the sessions send at the same
+        time, created on first use inside the running event loop.
+        """
+        if self._limiter is None and self.max_in_flight is not None:
+            self._limiter = asyncio.Semaphore(self.max_in_flight)
+        return self._limiter
 
     def __call__(self) -> AsyncSession:
-        return AsyncSession(client=self.client)
+        client = self.client
+        if self.pool is not None:
+            client = self.pool.get()
+        return AsyncSession(
+            client=client,
+            cache=self.cache,
+            max_in_flight=self.max_in_flight_per_session,
+            limiter=self.limiter,
+            **self.kwargs,
+        )
 
 
 class ScopedSession:
@@ -0,0 +1,90 @@
+from pynamo import Attribute, BatchGetItem, GetItem, Model, PrimaryIndex, Table
+from pynamo.fields import String
+
+
+def test_batch_get_item():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True, prefix="USER#")
+
+    request = BatchGetItem(
+        GetItem(User).where(id="1"),
+        GetItem(User).where(id="2"),
+        GetItem(User).where(id="1"),
+    )
+
+    assert request.to_dynamodb() == {
+        "RequestItems": {
+            "mytable": {
+                "Keys": [
+                    {"PK": {"S": "USER#1"}},
+                    {"PK": {"S": "USER#2"}},
+                ],
+            },
+        },
+    }
+
+
+def test_batch_get_item_chunks():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+    othertable = Table(
+        "othertable",
+        PrimaryIndex(Attribute("PK", String), Attribute("SK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    class Group(Model):
+        __table__ = othertable
+        id = Attribute(String, partition_key=True)
+        name = Attribute(String, sort_key=True)
+
+    request = BatchGetItem(
+        *[GetItem(User).where(id=str(i)) for i in range(150)],
+        *[GetItem(Group).where(id=str(i), name="g") for i in range(100)],
+    )
+
+    chunks = request.chunks()
+
+    assert len(chunks) == 3
+    assert len(chunks[0]["RequestItems"]["mytable"]["Keys"]) == 100
+    assert len(chunks[1]["RequestItems"]["mytable"]["Keys"]) == 50
+    assert len(chunks[1]["RequestItems"]["othertable"]["Keys"]) == 50
+    assert len(chunks[2]["RequestItems"]["othertable"]["Keys"]) == 50
+
+
+def test_batch_get_item_from_dynamodb_item():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True, prefix="USER#")
+
+    class Group(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True, prefix="GROUP#")
+
+    request = BatchGetItem(
+        GetItem(User).where(id="1"),
+        GetItem(Group).where(id="1"),
+    )
+
+    user = request.from_dynamodb_item("mytable", {"PK": {"S": "USER#1"}})
+    group = request.from_dynamodb_item("mytable", {"PK": {"S": "GROUP#1"}})
+
+    assert isinstance(user, User)
+    assert isinstance(group, Group)
+    assert group.id == "1"
@@ -0,0 +1,97 @@
+from pynamo import Attribute, Model, PrimaryIndex, Table
+from pynamo.fields import String
+from pynamo.op import BatchWriteItem, DeleteItem, PutItem
+
+
+def test_batch_write_item():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+        email = Attribute(String)
+
+    request = BatchWriteItem(
+        PutItem(User(id="1", email="user@example.org")),
+        DeleteItem(User(id="2")),
+    )
+
+    assert request.to_dynamodb() == {
+        "RequestItems": {
+            "mytable": [
+                {
+                    "PutRequest": {
+                        "Item": {
+                            "PK": {"S": "1"},
+                            "email": {"S": "user@example.org"},
+                        },
+                    },
+                },
+                {"DeleteRequest": {"Key": {"PK": {"S": "2"}}}},
+            ],
+        },
+    }
+
+
+def test_batch_write_item_duplicate_keys():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+        email = Attribute(String)
+
+    request = BatchWriteItem(
+        PutItem(User(id="1", email="first@example.org")),
+        PutItem(User(id="2", email="user@example.org")),
+        PutItem(User(id="1", email="second@example.org")),
+        DeleteItem(User(id="2")),
+    )
+
+    assert request.to_dynamodb() == {
+        "RequestItems": {
+            "mytable": [
+                {
+                    "PutRequest": {
+                        "Item": {
+                            "PK": {"S": "1"},
+                            "email": {"S": "second@example.org"},
+                        },
+                    },
+                },
+                {"DeleteRequest": {"Key": {"PK": {"S": "2"}}}},
+            ],
+        },
+    }
+
+
+def test_batch_write_item_chunks():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+        email = Attribute(String)
+
+    request = BatchWriteItem(
+        *[PutItem(User(id=str(i), email="a" * 100)) for i in range(60)],
+    )
+
+    assert [len(c["RequestItems"]["mytable"]) for c in request.chunks()] == [
+        25,
+        25,
+        10,
+    ]
+    assert [
+        len(c["RequestItems"]["mytable"])
+        for c in request.chunks(max_bytes=1000)
+    ] == [8] * 7 + [4]
@@ -0,0 +1,120 @@
+from typing import Any
+
+from pynamo import Attribute, GetItem, Model, PrimaryIndex, PutItem, Table
+from pynamo.cache import ReadCache
+from pynamo.fields import String
+from pynamo.op import Query
+from pynamo.session import SessionMaker
+
+
+def test_read_cache():
+    now = 0.0
+    cache = ReadCache(max_size=2, ttl=10, shards=1, clock=lambda: now)
+
+    key = {"PK": {"S": "1"}}
+    item = {"PK": {"S": "1"}, "name": {"S": "a"}}
+
+    cache.put_item("mytable", key, item, cache.token("mytable"))
+    assert cache.get_item("mytable", key) is item
+
+    now = 10.0
+    assert cache.get_item("mytable", key) is None
+
+    for i in range(3):
+        cache.put_item(
+            "mytable", {"PK": {"S": str(i)}}, item, cache.token("mytable")
+        )
+    assert cache.get_item("mytable", {"PK": {"S": "0"}}) is None
+    assert cache.stats()["size"] == 2
+
+
+def test_read_cache_invalidate():
+    cache = ReadCache()
+
+    key = {"PK": {"S": "1"}}
+    request = {"TableName": "mytable", "KeyConditionExpression": "..."}
+
+    token = cache.token("mytable")
+    cache.put_item("mytable", key, {"PK": {"S": "1"}}, token)
+    cache.put_query(request, [{"PK": {"S": "1"}}], token)
+
+    cache.invalidate("mytable", {"PK": {"S": "2"}})
+
+    assert cache.get_item("mytable", key) is not None
+    assert cache.get_query(request) is None
+
+    # A read that started before a write is not stored.
+    cache.put_item("mytable", {"PK": {"S": "3"}}, {}, token)
+    assert cache.get_item("mytable", {"PK": {"S": "3"}}) is None
+
+    cache.invalidate("mytable", key)
+    assert cache.get_item("mytable", key) is None
+
+
+def test_read_cache_invalidate_during_put():
+    import threading
+
+    key = {"PK": {"S": "1"}}
+    writes: list[threading.Thread] = []
+
+    def clock() -> float:
+        # A write of the key lands while the read result is being stored.
+        if not writes:
+            writes.append(
+                threading.Thread(target=cache.invalidate, args=("mytable", key))
+            )
+            writes[0].start()
+            writes[0].join(timeout=0.1)
+        return 0.0
+
+    cache = ReadCache(clock=clock)
+    cache.put_item("mytable", key, {"PK": {"S": "1"}}, cache.token("mytable"))
+    writes[0].join()
+
+    assert cache.get_item("mytable", key) is None
+
+
+def test_session_maker_shared_cache():
+    calls: list[str] = []
+
+    class TestClient:
+        def get_item(self, **kwargs: Any):
+            calls.append("get_item")
+            return {"Item": {**kwargs["Key"], "name": {"S": "cached"}}}
+
+        def put_item(self, **kwargs: Any):
+            calls.append("put_item")
+            return {}
+
+        def query(self, **kwargs: Any):
+            calls.append("query")
+            return {"Items": [{"PK": {"S": "1"}, "name": {"S": "a"}}]}
+
+    maker = SessionMaker(lambda: TestClient(), cache=ReadCache())
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+        name = Attribute(String)
+
+    first = maker().execute(GetItem(User).where(id="1"))
+    second = maker().execute(GetItem(User).where(id="1"))
+
+    assert first is not second
+    assert second.name == "cached"
+    assert calls == ["get_item"]
+
+    assert len(list(maker().execute(Query(User).where(User.id == "1")))) == 1
+    assert len(list(maker().execute(Query(User).where(User.id == "1")))) == 1
+    assert calls == ["get_item", "query"]
+
+    maker().execute(PutItem(User(id="1", name="changed")))
+
+    maker().execute(GetItem(User).where(id="1"))
+    list(maker().execute(Query(User).where(User.id == "1")))
+    assert calls == ["get_item", "query", "put_item", "get_item", "query"]
@@ -45,3 +45,31 @@ def test_delete_item_using_class_method():
         "TableName": "mytable",
         "Key": {"PK": {"S": "123"}},
     }
+
+
+def test_delete_item_many():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String), Attribute("SK", String)),
+    )
+
+    class Membership(Model):
+        __table__ = mytable
+
+        user_id = Attribute(String, partition_key=True)
+        group_id = Attribute(String, sort_key=True, prefix="GROUP#")
+
+    requests = DeleteItem.many(Membership, [("u1", "g1"), ("u2", "g2")])
+
+    assert [request.to_dynamodb() for request in requests] == [
+        {
+            "TableName": "mytable",
+            "Key": {"PK": {"S": "u1"}, "SK": {"S": "GROUP#g1"}},
+        },
+        {
+            "TableName": "mytable",
+            "Key": {"PK": {"S": "u2"}, "SK": {"S": "GROUP#g2"}},
+        },
+    ]
+    assert requests[0].ref == ("Membership", "u1", "g1")
+    assert requests[0].obj.group_id == "g1"
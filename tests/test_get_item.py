@@ -1,5 +1,7 @@
+import pytest
+
 from pynamo import Attribute, GetItem, Model, PrimaryIndex, Table
-from pynamo.fields import String
+from pynamo.fields import Integer, String
 
 
 def test_get_item_from_model_instance():
@@ -71,3 +73,56 @@ def test_get_item_using_class_method():
         "Key": {"PK": {"S": "123"}},
     }
 """
+
+
+def test_get_item_key_plan():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String), Attribute("SK", String)),
+    )
+
+    class Membership(Model):
+        __table__ = mytable
+
+        user_id = Attribute(String, partition_key=True, prefix="USER#")
+        rank = Attribute(Integer, sort_key=True)
+
+    request = GetItem(Membership).where(
+        Membership.user_id == "1", Membership.rank == 2
+    )
+
+    assert request.ref == ("Membership", "1", 2)
+    assert request.to_dynamodb() == {
+        "TableName": "mytable",
+        "Key": {"PK": {"S": "USER#1"}, "SK": {"N": "2"}},
+    }
+    assert request.instance.rank == 2
+
+
+def test_get_item_many():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+
+        id = Attribute(String, primary_key=True, prefix="FOO#")
+
+    requests = GetItem.many(Foo, ["1", "2"])
+
+    assert [request.to_dynamodb()["Key"] for request in requests] == [
+        {"PK": {"S": "FOO#1"}},
+        {"PK": {"S": "FOO#2"}},
+    ]
+    assert [request.ref for request in requests] == [
+        ("Foo", "1", None),
+        ("Foo", "2", None),
+    ]
+    assert Foo.dynamodb_keys(["3"]) == [
+        (("Foo", "3", None), {"PK": {"S": "FOO#3"}})
+    ]
+
+    with pytest.raises(ValueError):
+        GetItem(Foo).where(id="")
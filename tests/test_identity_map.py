@@ -0,0 +1,167 @@
+import gc
+from typing import Any
+
+from pynamo import Attribute, GetItem, Model, PrimaryIndex, Table
+from pynamo.fields import String
+from pynamo.identity_map import IdentityMap
+from pynamo.session import Session
+
+
+def test_identity_map_lru():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    identity_map = IdentityMap(max_size=2)
+
+    first, second, third = User(id="1"), User(id="2"), User(id="3")
+    identity_map[first.ref] = first
+    identity_map[second.ref] = second
+
+    assert identity_map[first.ref] is first
+
+    identity_map[third.ref] = third
+
+    assert second.ref not in identity_map
+    assert set(identity_map) == {first.ref, third.ref}
+    assert identity_map.get(second.ref) is None
+    assert identity_map.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+        "size": 2,
+    }
+
+
+def test_identity_map_ttl():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    now = 0.0
+    fresh, pinned = User(id="fresh"), User(id="pinned")
+
+    identity_map = IdentityMap(ttl=10, clock=lambda: now)
+    identity_map["fresh"] = fresh
+    identity_map["pinned"] = pinned
+    identity_map.pinned = lambda obj: obj is pinned
+
+    now = 5.0
+    assert identity_map["fresh"] is fresh
+
+    now = 10.0
+    assert "fresh" not in identity_map
+    assert identity_map["pinned"] is pinned
+    assert identity_map.evictions == 1
+
+
+def test_identity_map_pinned_objects_are_not_evicted():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+        name = Attribute(String)
+
+    class TestClient:
+        def get_item(self, **kwargs: Any):
+            return {"Item": {**kwargs["Key"], "name": {"S": "name"}}}
+
+    session = Session(
+        client=TestClient(),
+        identity_map_factory=lambda: IdentityMap(max_size=2),
+    )
+
+    pending = User(id="pending")
+    session.add(pending)
+
+    dirty = session.execute(GetItem(User).where(id="dirty"))
+    dirty.name = "changed"
+
+    for i in range(5):
+        session.execute(GetItem(User).where(id=str(i)))
+
+    registry = session.object_registry
+    assert registry[pending.ref] is pending
+    assert registry[dirty.ref] is dirty
+    assert len(registry) == 3
+    assert registry.evictions == 4
+
+    session.clear()
+    assert len(registry) == 0
+
+
+def test_identity_map_keeps_evicted_objects_in_use():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+        name = Attribute(String)
+
+    class TestClient:
+        def get_item(self, **kwargs: Any):
+            return {"Item": {**kwargs["Key"], "name": {"S": "name"}}}
+
+    session = Session(
+        client=TestClient(),
+        identity_map_factory=lambda: IdentityMap(max_size=1),
+    )
+
+    held = session.execute(GetItem(User).where(id="held"))
+    dropped = session.execute(GetItem(User).where(id="dropped"))
+    session.execute(GetItem(User).where(id="last"))
+
+    registry = session.object_registry
+    assert held.ref not in registry
+    assert registry.evictions == 2
+
+    del dropped
+    gc.collect()
+    assert [obj.id for obj in registry.objects()] == ["last", "held"]
+
+    # Modified after its eviction, the object is still saved.
+    held.name = "changed"
+    writes = session._pending_writes()  # type: ignore
+    assert [(obj.id, op.__class__.__name__) for obj, op in writes] == [
+        ("held", "UpdateItem")
+    ]
+
+    # A deleted item is not updated through an evicted object.
+    registry.discard(held.ref)
+    assert held not in registry.objects()
+
+
+def test_identity_map_pins_assigned_objects():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+        name = Attribute(String)
+
+    user = User.from_dynamodb_item({"PK": {"S": "1"}, "name": {"S": "a"}})
+    assert not user.maybe_modified
+
+    user.name = "b"
+    assert user.maybe_modified
+    assert not User(id="2").maybe_modified
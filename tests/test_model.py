@@ -1,5 +1,10 @@
+import decimal
+
+import pytest
+
 from pynamo import Attribute, Model, PrimaryIndex, Table
-from pynamo.fields import String
+from pynamo.constants import NOT_LOADED
+from pynamo.fields import DateTime, Decimal, Integer, String
 
 
 def test_model():
@@ -87,6 +92,76 @@ def test_model_to_dynamodb_item():
     }
 
 
+def test_model_to_dynamodb_item_mapped_columns():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String), Attribute("SK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+
+        id = Attribute(String, primary_key=True, prefix="FOO#")
+        name = Attribute("full_name", String)
+        nickname = Attribute(String, nullable=True)
+
+    foo = Foo(id="123", name="silly name")
+    assert foo.to_dynamodb_item() == {
+        "PK": {"S": "FOO#123"},
+        "SK": {"S": "FOO#123"},
+        "full_name": {"S": "silly name"},
+        "nickname": {"NULL": True},
+    }
+
+    with pytest.raises(TypeError):
+        Foo(id="123").to_dynamodb_item()
+
+
+def test_model_from_dynamodb_item():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    calls: list[int] = []
+
+    def default_name() -> str:
+        calls.append(1)
+        return "default"
+
+    class Foo(Model):
+        __table__ = mytable
+
+        id = Attribute(String, primary_key=True, prefix="FOO#")
+        name = Attribute("full_name", String, default=default_name)
+        age = Attribute(Integer, nullable=True)
+        nickname = Attribute(String, nullable=True)
+
+    foo = Foo.from_dynamodb_item(
+        {
+            "PK": {"S": "FOO#123"},
+            "full_name": {"S": "silly name"},
+            "age": {"N": "42"},
+            "unmapped": {"S": "ignored"},
+        }
+    )
+
+    assert foo.id == "123"
+    assert foo.name == "silly name"
+    assert foo.age == 42
+    assert foo.nickname is None
+    assert foo.modified_attributes() == {}
+
+    foo.age = 43  # type: ignore
+
+    assert foo.modified_attributes() == {"age": 43}
+
+    foos = Foo.from_dynamodb_items([{"PK": {"S": "FOO#1"}}] * 3)
+
+    assert [foo.name for foo in foos] == [None, None, None]
+    assert calls == []
+
+
 def test_model_primary_key():
     mytable = Table(
         "mytable",
@@ -178,6 +253,52 @@ def test_model_ref():
     assert foo.ref == ("Foo", "123", None)
 
 
+def test_model_renamed_key_attributes():
+    from pynamo import DeleteItem, GetItem
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(
+            Attribute("PK", String),
+            Attribute("SK", String),
+        ),
+    )
+
+    class Membership(Model):
+        __table__ = mytable
+
+        id = Attribute("user_id", String, partition_key=True)
+        group = Attribute("group_id", String, sort_key=True, prefix="GROUP#")
+
+    membership = Membership(id="1", group="2")
+
+    key = {"PK": {"S": "1"}, "SK": {"S": "GROUP#2"}}
+
+    assert membership.ref == ("Membership", "1", "2")
+    assert membership.primary_key == key
+    assert Membership.key_values(("1", "2")) == {"id": "1", "group": "2"}
+    assert Membership.dynamodb_key({"id": "1", "group": "2"}) == (
+        ("Membership", "1", "2"),
+        key,
+    )
+    assert GetItem(Membership).where(id="1", group="2").key == key
+    assert DeleteItem.many(Membership, [("1", "2")])[0].key == key
+
+    get = GetItem(Membership).where(
+        Membership.id == "1", Membership.group == "2"
+    )
+    assert (get.ref, get.key) == (("Membership", "1", "2"), key)
+    assert get.instance.group == "2"
+
+    delete = DeleteItem.where(Membership.id == "1", Membership.group == "2")
+    assert (delete.ref, delete.key) == (("Membership", "1", "2"), key)
+
+    hydrated = Membership.from_dynamodb_item(
+        {"PK": {"S": "1"}, "SK": {"S": "GROUP#2"}}
+    )
+    assert hydrated.ref == ("Membership", "1", "2")
+
+
 def test_model_index_name_default():
     mytable = Table(
         "mytable",
@@ -207,3 +328,207 @@ def test_model_index_name_specified():
         name = Attribute(String)
 
     assert Foo.__index_name__ == "GSI1"
+
+
+def test_model_compact():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+        __compact__ = True
+
+        id = Attribute(String, primary_key=True)
+        name = Attribute(String)
+        age = Attribute(Integer, nullable=True)
+
+    foo = Foo(id="123", name="silly name")
+
+    assert not hasattr(foo, "__dict__")
+    assert foo.id == "123"
+    assert foo.age is None
+
+    foo.name = "not silly name"  # type: ignore
+
+    assert foo.modified_attributes() == {"name": "not silly name"}
+    assert foo.to_dynamodb_item() == {
+        "PK": {"S": "123"},
+        "name": {"S": "not silly name"},
+        "age": {"NULL": True},
+    }
+
+    with pytest.raises(AttributeError):
+        foo.random = "random"
+
+    foo = Foo.from_dynamodb_item(
+        {"PK": {"S": "123"}, "name": {"S": "silly name"}, "age": {"N": "4"}}
+    )
+
+    assert not hasattr(foo, "__dict__")
+    assert (foo.id, foo.name, foo.age) == ("123", "silly name", 4)
+    assert foo.modified_attributes() == {}
+
+
+def test_model_lazy():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+        __lazy__ = True
+
+        id = Attribute(String, primary_key=True, prefix="FOO#")
+        name = Attribute(String)
+        age = Attribute(Integer)
+
+    item = {"PK": {"S": "FOO#123"}, "name": {"S": "silly"}, "age": {"N": "4"}}
+
+    foo = Foo.from_dynamodb_item(item)
+
+    assert foo._raw_item is item
+    assert foo.__dict__["id"] is NOT_LOADED
+    assert foo.id == "123"
+    assert foo.__dict__["id"] == "123"
+    assert foo.__dict__["age"] is NOT_LOADED
+
+    foo.age = 4  # type: ignore
+
+    assert foo.modified_attributes() == {}
+
+    foo.name = "not silly"  # type: ignore
+
+    assert foo.modified_attributes() == {"name": "not silly"}
+    assert foo.to_dynamodb_item() == {
+        "PK": {"S": "FOO#123"},
+        "name": {"S": "not silly"},
+        "age": {"N": "4"},
+    }
+
+    foo = Foo.from_dynamodb_item(item, lazy=False)
+
+    assert foo.__dict__["age"] == 4
+
+
+def test_model_mark_written():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+        __lazy__ = True
+
+        id = Attribute(String, primary_key=True)
+        name = Attribute(String)
+        age = Attribute(Integer)
+
+    foo = Foo.from_dynamodb_item(
+        {"PK": {"S": "123"}, "name": {"S": "a"}, "age": {"N": "4"}}
+    )
+
+    foo.name = "b"  # type: ignore
+    foo.mark_written()
+
+    assert foo.modified_attributes() == {}
+    assert not foo.maybe_modified
+    assert foo.__dict__["age"] is NOT_LOADED
+    assert foo.age == 4
+    assert foo.modified_attributes() == {}
+
+    foo.name = "c"  # type: ignore
+    foo.age = 5  # type: ignore
+    foo.mark_written({"name"})
+
+    assert foo.modified_attributes() == {"age": 5}
+    assert foo.maybe_modified
+
+
+def test_model_lazy_compact():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+        __compact__ = True
+        __lazy__ = True
+
+        id = Attribute(String, primary_key=True)
+        age = Attribute(Integer, nullable=True)
+
+    foo = Foo.from_dynamodb_item({"PK": {"S": "123"}})
+
+    assert foo.age is None
+
+    foo.age = 5  # type: ignore
+
+    assert foo.modified_attributes() == {"age": 5}
+
+
+def test_model_readonly():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+
+        id = Attribute(String, primary_key=True)
+        name = Attribute(String)
+
+    foo = Foo.from_dynamodb_item(
+        {"PK": {"S": "123"}, "name": {"S": "silly"}}, readonly=True
+    )
+
+    assert foo.is_readonly
+    assert foo.name == "silly"
+    assert foo.modified_attributes() == {}
+
+    with pytest.raises(AttributeError):
+        foo.name = "not silly"  # type: ignore
+
+    foo.track()
+    foo.name = "not silly"  # type: ignore
+
+    assert not foo.is_readonly
+    assert foo.modified_attributes() == {"name": "not silly"}
+
+
+def test_model_track_changes_at_flush():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+
+        id = Attribute(String, primary_key=True)
+        created_at = Attribute(DateTime)
+        price = Attribute(Decimal)
+
+    foo = Foo.from_dynamodb_item(
+        {
+            "PK": {"S": "123"},
+            "created_at": {"S": "2025-01-01T00:00:00Z"},
+            "price": {"N": "1.50"},
+        }
+    )
+
+    assert foo.modified_attributes() == {}
+
+    foo.price += 1  # type: ignore
+
+    assert foo.modified_attributes() == {"price": decimal.Decimal("2.50")}
+
+    foo.price = "2.50"  # type: ignore
+    foo.price = "1.50"  # type: ignore
+
+    assert foo.modified_attributes() == {}
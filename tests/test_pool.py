@@ -0,0 +1,142 @@
+import asyncio
+import threading
+
+import pytest
+
+from pynamo.pool import ClientPool
+from pynamo.session import AsyncSessionMaker, SessionMaker
+
+
+def test_pool_reuses_clients():
+    created = []
+
+    def factory():
+        client = object()
+        created.append(client)
+        return client
+
+    pool = ClientPool(factory, size=2)
+
+    clients = [pool.get() for _ in range(6)]
+
+    assert len(created) == 2
+    assert len(pool) == 2
+    assert clients == created * 3
+
+
+def test_pool_is_bounded_across_threads():
+    created = []
+    lock = threading.Lock()
+
+    def factory():
+        with lock:
+            created.append(object())
+            return created[-1]
+
+    pool = ClientPool(factory, size=3)
+
+    threads = [
+        threading.Thread(target=lambda: [pool.get() for _ in range(50)])
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 3
+
+
+def test_pool_size_must_be_positive():
+    with pytest.raises(ValueError):
+        ClientPool(object, size=0)
+
+
+def test_pool_warm_up():
+    pinged = []
+
+    pool = ClientPool(object, size=3, ping=pinged.append)
+
+    pool.warm_up()
+
+    assert len(pool) == 3
+    assert len(pinged) == 3
+    assert {pool.get() for _ in range(3)} == set(pinged)
+
+
+def test_pool_rebuilds_clients_after_fork():
+    pool = ClientPool(object, size=1)
+
+    parent_client = pool.get()
+    assert pool.get() is parent_client
+
+    # What a forked child sees: clients created by another process.
+    pool._pid = -1
+
+    child_client = pool.get()
+    assert child_client is not parent_client
+    assert pool.get() is child_client
+
+
+def test_session_maker_pools_clients():
+    class TestClient:
+        pass
+
+    maker = SessionMaker(TestClient, pool_size=2)
+
+    clients = {id(maker().client) for _ in range(10)}
+
+    assert len(clients) == 2
+
+
+def test_session_maker_without_pool():
+    class TestClient:
+        pass
+
+    maker = SessionMaker(TestClient, pool_size=None)
+
+    assert maker().client is not maker().client
+
+
+def test_session_maker_warm_up():
+    pinged = []
+
+    maker = SessionMaker(object, pool_size=2, warm_up=pinged.append)
+
+    assert len(pinged) == 2
+    assert maker().client in pinged
+
+
+def test_async_session_maker_passes_kwargs():
+    class TestClient:
+        pass
+
+    client = TestClient()
+    maker = AsyncSessionMaker(client=client, batch_window=0, readonly=True)
+
+    session = maker()
+
+    assert session.client is client
+    assert session.batch_window == 0
+    assert session.readonly is True
+
+
+def test_async_session_maker_warm_up():
+    class TestClient:
+        def __init__(self):
+            self.warmed = False
+
+        async def describe_limits(self):
+            self.warmed = True
+
+    maker = AsyncSessionMaker(
+        client_factory=TestClient,
+        pool_size=2,
+        warm_up=lambda client: client.describe_limits(),
+    )
+
+    asyncio.run(maker.warm_up())
+
+    clients = {maker().client for _ in range(4)}
+    assert len(clients) == 2
+    assert all(client.warmed for client in clients)
@@ -1,8 +1,11 @@
+import pytest
+
 from pynamo import (
     Attribute,
     Model,
     PrimaryIndex,
     Table,
+    bindparam,
 )
 from pynamo.fields import DateTime, String
 from pynamo.op import Query
@@ -50,3 +53,94 @@ def test_query():
     )
     assert req["ExpressionAttributeValues"][":ATTR0"] == {"S": "123"}
     assert req["ExpressionAttributeValues"][":ATTR1"] == {"S": "2025-01-01"}
+
+
+def test_query_limit():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String), Attribute("SK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+
+        id = Attribute(String, partition_key=True)
+        date = Attribute(DateTime, sort_key=True)
+
+    q = Query(Foo, limit=10).where(Foo.id == "123")
+
+    assert q.to_dynamodb()["Limit"] == 10
+    assert q.to_dynamodb(limit=3)["Limit"] == 3
+    assert "Limit" not in Query(Foo).where(Foo.id == "123").to_dynamodb()
+
+
+def test_query_shares_compiled_key_condition():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String), Attribute("SK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+
+        id = Attribute(String, partition_key=True)
+        date = Attribute(DateTime, sort_key=True)
+
+    first = Query(Foo).where(Foo.id == "1", Foo.date == "2025-01-01")
+    second = Query(Foo).where(Foo.id == "2", Foo.date == "2025-01-02")
+
+    first_req = first.to_dynamodb()
+    second_req = second.to_dynamodb()
+
+    assert (
+        first_req["KeyConditionExpression"]
+        is second_req["KeyConditionExpression"]
+    )
+    assert second_req["ExpressionAttributeValues"] == {
+        ":ATTR0": {"S": "2"},
+        ":ATTR1": {"S": "2025-01-02"},
+    }
+
+    assert list(Foo.__templates__) == [
+        ("query", (("id", "=", "S"), ("date", "=", "S")))
+    ]
+
+    first_req["ExpressionAttributeNames"]["#ATTR0"] = "changed"
+    assert second.to_dynamodb()["ExpressionAttributeNames"] == {
+        "#ATTR0": "PK",
+        "#ATTR1": "SK",
+    }
+
+
+def test_query_bindparam():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String), Attribute("SK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+
+        id = Attribute(String, partition_key=True)
+        date = Attribute(DateTime, sort_key=True)
+
+    find_foo = Query(Foo).where(
+        Foo.id == bindparam("id"),
+        Foo.date == "2025-01-01",
+    )
+
+    req = find_foo.params(id="123").to_dynamodb()
+    assert (
+        req["KeyConditionExpression"] == "#ATTR0 = :ATTR0 AND #ATTR1 = :ATTR1"
+    )
+    assert req["ExpressionAttributeValues"] == {
+        ":ATTR0": {"S": "123"},
+        ":ATTR1": {"S": "2025-01-01"},
+    }
+
+    assert find_foo.params(id="456").to_dynamodb()["ExpressionAttributeValues"][
+        ":ATTR0"
+    ] == {"S": "456"}
+
+    with pytest.raises(ValueError):
+        find_foo.to_dynamodb()
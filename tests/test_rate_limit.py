@@ -0,0 +1,232 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from pynamo import Attribute, GetItem, Model, PrimaryIndex, PutItem, Table
+from pynamo.fields import String
+from pynamo.rate_limit import RateLimiter, TokenBucket, is_throttling_error
+from pynamo.session import AsyncSession, Session, SessionMaker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_take():
+    clock = FakeClock()
+    bucket = TokenBucket(10, clock=clock)
+
+    assert bucket.take(10) == 0.0
+    assert bucket.take(5) == pytest.approx(0.5)
+
+    clock.now = 1.5
+    assert bucket.take(10) == 0.0
+
+
+def test_token_bucket_settle():
+    clock = FakeClock()
+    bucket = TokenBucket(10, clock=clock)
+
+    bucket.take(1)
+    bucket.settle(19)
+
+    assert bucket.take(1) == pytest.approx(1.1)
+
+    bucket.settle(-100)
+    assert bucket.tokens == bucket.capacity
+
+
+def test_token_bucket_throttled():
+    clock = FakeClock()
+    bucket = TokenBucket(10, clock=clock)
+
+    bucket.throttled()
+    assert bucket.rate == 5
+
+    clock.now = 5
+    bucket.take(0)
+    assert bucket.rate == pytest.approx(7.5)
+
+    clock.now = 100
+    bucket.take(0)
+    assert bucket.rate == 10
+
+
+def test_rate_limiter_target_utilization():
+    limiter = RateLimiter(
+        {"mytable": (100, None), ("mytable", "gsi1"): (None, 50)},
+        target_utilization=0.3,
+    )
+
+    assert limiter.buckets[("mytable", None, "read")].rate == 30
+    assert limiter.buckets[("mytable", "gsi1", "write")].rate == 15
+    assert ("mytable", None, "write") not in limiter.buckets
+
+    with pytest.raises(ValueError):
+        RateLimiter({"mytable": (100, 100)}, target_utilization=0)
+
+
+def test_rate_limiter_reserve_and_record():
+    clock = FakeClock()
+    limiter = RateLimiter(
+        {"mytable": (10, 10), ("mytable", "gsi1"): (10, 10)},
+        clock=clock,
+    )
+
+    assert limiter.reserve("put_item", {"TableName": "other"}) == (None, 0)
+    assert limiter.reserve("describe_limits", {}) == (None, 0)
+
+    reservation, delay = limiter.reserve("put_item", {"TableName": "mytable"})
+    assert reservation == ("put_item", [(("mytable", None, "write"), 1.0)])
+    assert delay == 0
+
+    limiter.record(
+        reservation,
+        {
+            "ConsumedCapacity": {
+                "TableName": "mytable",
+                "CapacityUnits": 9.0,
+                "Table": {"CapacityUnits": 5.0},
+                "GlobalSecondaryIndexes": {"gsi1": {"CapacityUnits": 4.0}},
+            }
+        },
+    )
+
+    assert limiter.buckets[("mytable", None, "write")].tokens == 5
+    assert limiter.buckets[("mytable", "gsi1", "write")].tokens == 6
+    assert limiter.buckets[("mytable", None, "read")].tokens == 10
+
+    # The next put is estimated from the capacity the last one consumed.
+    reservation, _ = limiter.reserve("put_item", {"TableName": "mytable"})
+    assert reservation[1][0][1] == pytest.approx(1.8)
+
+    reservation, _ = limiter.reserve(
+        "query", {"TableName": "mytable", "IndexName": "gsi1"}
+    )
+    assert reservation[1][0][0] == ("mytable", "gsi1", "read")
+
+
+def test_rate_limiter_throttles_on_unprocessed_items():
+    limiter = RateLimiter({"mytable": (10, 10)})
+
+    request = {"RequestItems": {"mytable": [], "other": []}}
+    reservation, _ = limiter.reserve("batch_write_item", request)
+    limiter.record(reservation, {"UnprocessedItems": {"mytable": [{}]}})
+
+    assert limiter.buckets[("mytable", None, "write")].rate == 5
+
+
+def test_is_throttling_error():
+    class ClientError(Exception):
+        def __init__(self, code: str):
+            self.response = {"Error": {"Code": code}}
+
+    assert is_throttling_error(
+        ClientError("ProvisionedThroughputExceededException")
+    )
+    assert not is_throttling_error(ClientError("ValidationException"))
+    assert not is_throttling_error(ValueError())
+
+
+def test_session_rate_limiter(monkeypatch: Any):
+    slept: list[float] = []
+    monkeypatch.setattr("pynamo.session.time.sleep", slept.append)
+
+    calls: list[Any] = []
+
+    class TestClient:
+        def put_item(self, **kwargs: Any):
+            calls.append(kwargs)
+            return {
+                "ConsumedCapacity": {
+                    "TableName": "mytable",
+                    "CapacityUnits": 2.0,
+                }
+            }
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    clock = FakeClock()
+    maker = SessionMaker(
+        TestClient,
+        rate_limiter=RateLimiter({"mytable": (None, 4)}, clock=clock),
+    )
+
+    for i in range(3):
+        maker().execute(PutItem(User(id=str(i))))
+
+    assert all(call["ReturnConsumedCapacity"] == "INDEXES" for call in calls)
+    # The first two puts consume the 4 units, the third waits for its
+    # estimated cost: 1 * 0.64 + 2 * 0.36 units.
+    assert slept == [pytest.approx(0.34)]
+
+
+def test_session_rate_limiter_throttling_error():
+    class ClientError(Exception):
+        response = {"Error": {"Code": "ThrottlingException"}}
+
+    class TestClient:
+        def put_item(self, **kwargs: Any):
+            raise ClientError()
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    limiter = RateLimiter({"mytable": (None, 10)})
+    session = Session(client=TestClient(), rate_limiter=limiter)
+
+    with pytest.raises(ClientError):
+        session.execute(PutItem(User(id="1")))
+
+    assert limiter.buckets[("mytable", None, "write")].rate == 5
+
+
+def test_async_session_rate_limiter():
+    calls: list[Any] = []
+
+    class TestClient:
+        async def get_item(self, **kwargs: Any):
+            calls.append(kwargs)
+            return {
+                "Item": kwargs["Key"],
+                "ConsumedCapacity": {
+                    "TableName": "mytable",
+                    "CapacityUnits": 0.5,
+                },
+            }
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    limiter = RateLimiter({"mytable": (100, None)}, clock=FakeClock())
+    session = AsyncSession(client=TestClient(), rate_limiter=limiter)
+
+    user = asyncio.run(session.get_item(GetItem(User).where(id="1")))
+
+    assert user.id == "1"  # type: ignore
+    assert calls[0]["ReturnConsumedCapacity"] == "INDEXES"
+    assert limiter.buckets[("mytable", None, "read")].tokens == 99.5
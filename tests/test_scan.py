@@ -0,0 +1,44 @@
+import pytest
+
+from pynamo import Attribute, Model, PrimaryIndex, Scan, Table
+from pynamo.fields import String
+
+
+def test_scan():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    assert Scan(Foo).to_dynamodb() == {"TableName": "mytable"}
+
+
+def test_scan_segment():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    scan = Scan(Foo, total_segments=4, page_size=10)
+
+    assert scan.to_dynamodb(segment=2, start_key={"PK": {"S": "1"}}) == {
+        "TableName": "mytable",
+        "Segment": 2,
+        "TotalSegments": 4,
+        "ExclusiveStartKey": {"PK": {"S": "1"}},
+        "Limit": 10,
+    }
+
+    with pytest.raises(ValueError):
+        scan.to_dynamodb(segment=4)
+
+    with pytest.raises(ValueError):
+        Scan(Foo, total_segments=0)
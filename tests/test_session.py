@@ -1,7 +1,10 @@
+import threading
 from typing import Any
 
 from pynamo import Attribute, GetItem, Model, PrimaryIndex, PutItem, Table
+from pynamo.exceptions import FlushError
 from pynamo.fields import String
+from pynamo.identity_map import IdentityMap
 from pynamo.session import ScopedSession, Session, SessionMaker
 from pynamo.session import AsyncScopedSession, AsyncSession, AsyncSessionMaker
 import pytest
@@ -99,3 +102,779 @@ def test_session_put_item():
 
     res = session.execute(op)
     assert res == user
+
+
+def test_session_get_many():
+    calls: list[Any] = []
+
+    class TestClient:
+        @classmethod
+        def batch_get_item(cls, **kwargs: Any):
+            calls.append(kwargs)
+            keys = kwargs["RequestItems"]["mytable"]["Keys"]
+            if len(calls) == 1:
+                return {
+                    "Responses": {"mytable": [keys[0]]},
+                    "UnprocessedKeys": {"mytable": {"Keys": keys[1:]}},
+                }
+            return {"Responses": {"mytable": keys}}
+
+    session = Session(client=TestClient())
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    users = session.get_many(
+        [GetItem(User).where(id="1"), GetItem(User).where(id="2")]
+    )
+
+    assert [user.id for user in users] == ["1", "2"]  # type: ignore
+    assert len(calls) == 2
+    assert calls[1]["RequestItems"] == {
+        "mytable": {"Keys": [{"PK": {"S": "2"}}]},
+    }
+
+    users = session.get_many([GetItem(User).where(id="2")])
+
+    assert users[0].id == "2"  # type: ignore
+    assert len(calls) == 2
+
+
+def test_session_get_many_missing_item():
+    class TestClient:
+        @classmethod
+        def batch_get_item(cls, **kwargs: Any):
+            return {"Responses": {"mytable": []}}
+
+    session = Session(client=TestClient())
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    assert session.get_many([GetItem(User).where(id="1")]) == [None]
+
+
+def test_session_get_many_unprocessed_keys():
+    from pynamo.exceptions import UnprocessedItemsError
+
+    class TestClient:
+        @classmethod
+        def batch_get_item(cls, **kwargs: Any):
+            return {"UnprocessedKeys": kwargs["RequestItems"]}
+
+    session = Session(client=TestClient(), max_batch_retries=0)
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    with pytest.raises(UnprocessedItemsError):
+        session.get_many([GetItem(User).where(id="1")])
+
+
+def test_session_batch_write_item():
+    from pynamo.op import BatchWriteItem, DeleteItem
+
+    calls: list[Any] = []
+
+    class TestClient:
+        @classmethod
+        def batch_write_item(cls, **kwargs: Any):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                return {"UnprocessedItems": kwargs["RequestItems"]}
+            return {"UnprocessedItems": {}}
+
+    session = Session(client=TestClient())
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    user = User(id="1")
+
+    session.execute(BatchWriteItem(PutItem(user), DeleteItem(User(id="2"))))
+
+    assert len(calls) == 2
+    assert calls[0] == calls[1]
+    assert session.object_registry[user.ref] is user
+
+
+def test_session_query():
+    from pynamo.op import Query
+
+    calls: list[Any] = []
+
+    class TestClient:
+        @classmethod
+        def query(cls, **kwargs: Any):
+            calls.append(kwargs)
+            page = len(calls)
+            res: dict[str, Any] = {
+                "Items": [
+                    {"PK": {"S": "123"}, "SK": {"S": f"{page}-{i}"}}
+                    for i in range(2)
+                ],
+            }
+            if page < 3:
+                res["LastEvaluatedKey"] = res["Items"][-1]
+            return res
+
+    session = Session(client=TestClient())
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String), Attribute("SK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+        id = Attribute(String, partition_key=True)
+        name = Attribute(String, sort_key=True)
+
+    results = session.execute(Query(Foo).where(Foo.id == "123"))
+
+    assert calls == []
+
+    assert next(results).name == "1-0"
+    assert len(calls) == 1
+
+    assert [foo.name for foo in results] == ["1-1", "2-0", "2-1", "3-0", "3-1"]
+    assert len(calls) == 3
+    assert calls[1]["ExclusiveStartKey"] == {
+        "PK": {"S": "123"},
+        "SK": {"S": "1-1"},
+    }
+
+
+def test_session_query_limit():
+    from pynamo.op import Query
+
+    calls: list[Any] = []
+
+    class TestClient:
+        @classmethod
+        def query(cls, **kwargs: Any):
+            calls.append(kwargs)
+            return {
+                "Items": [
+                    {"PK": {"S": "123"}, "SK": {"S": f"{len(calls)}-{i}"}}
+                    for i in range(kwargs["Limit"])
+                ],
+                "LastEvaluatedKey": {"PK": {"S": "123"}, "SK": {"S": "x"}},
+            }
+
+    session = Session(client=TestClient())
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String), Attribute("SK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+        id = Attribute(String, partition_key=True)
+        name = Attribute(String, sort_key=True)
+
+    results = list(session.execute(Query(Foo, limit=3).where(Foo.id == "123")))
+
+    assert len(results) == 3
+    assert len(calls) == 1
+    assert calls[0]["Limit"] == 3
+
+
+def _scan_client(calls: list[Any]) -> Any:
+    class TestClient:
+        @classmethod
+        def scan(cls, **kwargs: Any):
+            calls.append(kwargs)
+            segment = kwargs.get("Segment", 0)
+            start_key = kwargs.get("ExclusiveStartKey", {"n": {"N": 0}})
+            page = int(start_key["n"]["N"])
+            res: dict[str, Any] = {
+                "Items": [{"PK": {"S": f"{segment}-{page}"}}],
+            }
+            if page < 2:
+                res["LastEvaluatedKey"] = {"n": {"N": page + 1}}
+            return res
+
+    return TestClient()
+
+
+def test_session_scan():
+    from pynamo.op import Scan
+
+    calls: list[Any] = []
+
+    session = Session(client=_scan_client(calls))
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    results = session.execute(Scan(Foo, total_segments=3))
+
+    assert sorted(foo.id for foo in results) == [
+        f"{segment}-{page}" for segment in range(3) for page in range(3)
+    ]
+    assert len(calls) == 9
+
+
+def test_session_scan_segments():
+    from pynamo.op import Scan
+
+    calls: list[Any] = []
+
+    session = Session(client=_scan_client(calls))
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    segments = session.scan_segments(Scan(Foo, total_segments=2))
+
+    assert [foo.id for foo in segments[1]] == ["1-0", "1-1", "1-2"]
+    assert [foo.id for foo in segments[0]] == ["0-0", "0-1", "0-2"]
+
+
+def test_session_scan_early_exit():
+    from pynamo.op import Scan
+
+    calls: list[Any] = []
+
+    session = Session(client=_scan_client(calls))
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    results = session.execute(Scan(Foo, total_segments=4))
+
+    next(results)
+    results.close()
+
+    assert len(calls) < 12
+
+
+def test_session_scan_holds_items_weakly():
+    import gc
+
+    from pynamo.op import Scan
+
+    calls: list[Any] = []
+
+    session = Session(client=_scan_client(calls))
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+        name = Attribute(String, nullable=True)
+
+    kept = [foo for foo in session.execute(Scan(Foo)) if foo.id == "0-1"]
+    gc.collect()
+
+    (foo,) = kept
+    registry = session.object_registry
+    assert len(registry) == 0
+    assert registry.get(foo.ref) is foo
+    assert registry.objects() == [foo]
+
+    foo.name = "changed"
+    writes = session._pending_writes()  # type: ignore
+    assert [(obj.id, op.__class__.__name__) for obj, op in writes] == [
+        ("0-1", "UpdateItem")
+    ]
+
+
+def test_session_saves_streamed_items_modified_then_dropped():
+    import gc
+
+    from pynamo.op import Query
+
+    requests: list[Any] = []
+
+    class TestClient:
+        @classmethod
+        def query(cls, **kwargs: Any):
+            return {
+                "Items": [
+                    {"PK": {"S": "1"}, "SK": {"S": str(i)}, "name": {"S": "a"}}
+                    for i in range(3)
+                ]
+            }
+
+        @classmethod
+        def transact_write_items(cls, **kwargs: Any):
+            requests.append(kwargs)
+            return {}
+
+    session = Session(client=TestClient())
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String), Attribute("SK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+        id = Attribute(String, partition_key=True)
+        sort = Attribute(String, sort_key=True)
+        name = Attribute(String)
+
+    for foo in session.execute(Query(Foo).where(Foo.id == "1")):
+        if foo.sort != "1":
+            foo.name = "b"  # type: ignore
+
+    foos = list(session.execute(Query(Foo).where(Foo.id == "1")))
+    foos[1].name = "c"  # type: ignore
+
+    del foo, foos
+    gc.collect()
+
+    session.save()
+
+    (request,) = requests
+    assert sorted(
+        (
+            item["Update"]["Key"]["SK"]["S"],
+            item["Update"]["ExpressionAttributeValues"][":ATTR0"]["S"],
+        )
+        for item in request["TransactItems"]
+    ) == [("0", "b"), ("1", "c"), ("2", "b")]
+
+
+def test_session_readonly_query():
+    from pynamo.op import Query
+
+    class TestClient:
+        @classmethod
+        def query(cls, **kwargs: Any):
+            return {"Items": [{"PK": {"S": "123"}}]}
+
+    session = Session(client=TestClient())
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    (foo,) = session.execute(Query(Foo, readonly=True).where(Foo.id == "123"))
+
+    assert foo.is_readonly
+    assert session.object_registry == {}
+
+    with pytest.raises(TypeError):
+        session.add(foo)
+
+    session.add(foo.track())
+
+    assert session.object_registry == {foo.ref: foo}
+
+
+def test_session_readonly():
+    class TestClient:
+        @classmethod
+        def get_item(cls, **kwargs: Any):
+            return {"Item": {"PK": {"S": "123"}}}
+
+    session = Session(client=TestClient(), readonly=True)
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    foo = session.execute(GetItem(Foo).where(id="123"))
+
+    assert foo.is_readonly
+    assert session.object_registry == {}
+
+
+def test_session_save_chunked():
+    requests: list[Any] = []
+
+    class TestClient:
+        def transact_write_items(self, **kwargs: Any):
+            requests.append(kwargs)
+            return {}
+
+    session = Session(client=TestClient())
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    users = [User(id=str(i)) for i in range(250)]
+    for user in users:
+        session.add(user)
+
+    session.atomic(*users[:10])
+
+    responses = session.save(chunked=True)
+
+    assert len(responses) == len(requests) == 4
+    assert sorted(len(r["TransactItems"]) for r in requests) == [
+        10,
+        40,
+        100,
+        100,
+    ]
+
+    atomic = next(r for r in requests if len(r["TransactItems"]) == 10)
+    assert {
+        item["Put"]["Item"]["PK"]["S"] for item in atomic["TransactItems"]
+    } == {str(i) for i in range(10)}
+
+
+def test_session_save_releases_pending():
+    requests: list[Any] = []
+
+    class TestClient:
+        def transact_write_items(self, **kwargs: Any):
+            keys = {
+                item["Put"]["Item"]["PK"]["S"]
+                for item in kwargs["TransactItems"]
+            }
+            if "0" in keys:
+                raise RuntimeError("throttled")
+            requests.append(kwargs)
+            return {}
+
+        def batch_write_item(self, **kwargs: Any):
+            requests.append(kwargs)
+            return {}
+
+    session = Session(client=TestClient())
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    for i in range(1, 6):
+        session.add(User(id=str(i)))
+
+    session.save()
+    assert session.pending == {}
+
+    session.save()
+    assert [len(r["TransactItems"]) for r in requests] == [5, 0]
+
+    requests.clear()
+    for i in range(250):
+        session.add(User(id=str(i)))
+
+    with pytest.raises(RuntimeError):
+        session.save(chunked=True)
+
+    # Only the request holding "0" failed: its writes are still pending.
+    assert len(requests) == 2
+    assert len(session.pending) == 100
+    assert "0" in {obj.id for obj in session.objects_to_add}
+
+    session.save(flush_strategy="batch", raise_on_errors=False)
+    assert len(session.pending) == 0
+
+    requests.clear()
+    report = session.save(flush_strategy="batch")
+    assert len(report) == 0
+    assert requests == []
+
+
+def test_session_save_unpins_written_objects():
+    requests: list[Any] = []
+
+    class TestClient:
+        def transact_write_items(self, **kwargs: Any):
+            requests.append(kwargs)
+            return {}
+
+    session = Session(
+        client=TestClient(),
+        identity_map_factory=lambda: IdentityMap(max_size=2),
+    )
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+        name = Attribute(String)
+
+    users = [User(id=str(i), name="a") for i in range(5)]
+    for user in users:
+        session.add(user)
+    users[0].name = "b"  # type: ignore
+
+    loaded = User.from_dynamodb_item({"PK": {"S": "5"}, "name": {"S": "a"}})
+    session.object_registry[loaded.ref] = loaded
+    loaded.name = "b"  # type: ignore
+
+    assert len(session.object_registry) == 6
+
+    session.save()
+
+    assert session.pending == {}
+    assert len(session.object_registry) == 2
+    assert not any(user.maybe_modified for user in [*users, loaded])
+
+    session.save()
+    assert [len(r["TransactItems"]) for r in requests] == [6, 0]
+
+    loaded.name = "c"  # type: ignore
+    session.save()
+    assert requests[-1]["TransactItems"][0]["Update"][
+        "ExpressionAttributeValues"
+    ] == {":ATTR0": {"S": "c"}}
+
+
+def test_session_save_batch():
+    calls: list[Any] = []
+
+    class TestClient:
+        def transact_write_items(self, **kwargs: Any):
+            calls.append(("transact_write_items", kwargs))
+            return {}
+
+        def batch_write_item(self, **kwargs: Any):
+            calls.append(("batch_write_item", kwargs))
+            return {}
+
+        def update_item(self, **kwargs: Any):
+            calls.append(("update_item", kwargs))
+            return {}
+
+    maker = SessionMaker(lambda: TestClient(), flush_strategy="batch")
+    session = maker()
+    assert session.flush_strategy == "batch"
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+        name = Attribute(String)
+
+    existing = User.from_dynamodb_item({"PK": {"S": "1"}, "name": {"S": "a"}})
+    session.object_registry[existing.ref] = existing
+    existing.name = "b"  # type: ignore
+
+    order = User(id="2", name="order")
+    invoice = User(id="3", name="invoice")
+    session.add(order)
+    session.add(invoice)
+    session.atomic(order, invoice)
+
+    session.add(User(id="4", name="new"))
+    session.delete(User(id="5"))
+
+    report = session.save()
+
+    assert report.ok
+    assert len(report) == 5
+
+    requests = dict(calls)
+    assert len(requests) == 3
+    assert len(requests["transact_write_items"]["TransactItems"]) == 2
+    assert requests["batch_write_item"]["RequestItems"]["mytable"] == [
+        {"PutRequest": {"Item": {"PK": {"S": "4"}, "name": {"S": "new"}}}},
+        {"DeleteRequest": {"Key": {"PK": {"S": "5"}}}},
+    ]
+    update = requests["update_item"]
+    assert update["Key"] == {"PK": {"S": "1"}}
+    assert update["ExpressionAttributeValues"] == {":ATTR0": {"S": "b"}}
+    assert update["ReturnValues"] == "NONE"
+
+    with pytest.raises(ValueError):
+        Session(client=TestClient(), flush_strategy="other")  # type: ignore
+
+
+def test_session_save_batch_concurrent():
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    barrier = threading.Barrier(3)
+
+    class TestClient:
+        def update_item(self, **kwargs: Any):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            try:
+                barrier.wait(timeout=0.1)
+            except threading.BrokenBarrierError:
+                pass
+            with lock:
+                active -= 1
+            return {}
+
+    session = Session(
+        client=TestClient(), flush_strategy="batch", max_concurrency=3
+    )
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+        name = Attribute(String)
+
+    for i in range(9):
+        user = User.from_dynamodb_item({"PK": {"S": str(i)}})
+        session.object_registry[user.ref] = user
+        user.name = "changed"  # type: ignore
+
+    report = session.save()
+
+    assert report.ok
+    assert len(report) == 9
+    assert peak == 3
+
+
+def test_session_save_batch_errors():
+    class TestClient:
+        def batch_write_item(self, **kwargs: Any):
+            raise RuntimeError("throttled")
+
+    session = Session(client=TestClient(), flush_strategy="batch")
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    class Admin(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    session.add(User(id="1"))
+    # Another model on the same key: BatchWriteItem only keeps this put.
+    session.add(Admin(id="1"))
+
+    with pytest.raises(FlushError) as excinfo:
+        session.save()
+
+    report = excinfo.value.report
+    assert len(report) == 2
+    assert [result.op.instance.__class__ for result in report.errors] == [Admin]
+    superseded = [result for result in report.results if result.superseded]
+    assert [result.op.instance.__class__ for result in superseded] == [User]
+
+    report = session.save(raise_on_errors=False)
+    assert not report.ok
+
+
+def test_session_coalesces_writes():
+    session = Session(client=None)
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+        name = Attribute(String)
+
+    added = User(id="1", name="a")
+    session.add(added)
+    added.name = "b"  # type: ignore
+    session.add(added)
+
+    discarded = User(id="2")
+    session.add(discarded)
+    session.delete(discarded)
+
+    loaded = User.from_dynamodb_item({"PK": {"S": "3"}, "name": {"S": "a"}})
+    session.object_registry[loaded.ref] = loaded
+    loaded.name = "changed"  # type: ignore
+    session.delete(loaded)
+    replacement = User(id="3", name="new")
+    session.add(replacement)
+
+    removed = User.from_dynamodb_item({"PK": {"S": "4"}})
+    session.object_registry[removed.ref] = removed
+    session.add(User(id="4"))
+    session.delete(removed)
+
+    items = session.as_transaction().to_dynamodb()["TransactItems"]
+
+    assert [list(item) for item in items] == [["Put"], ["Put"], ["Delete"]]
+    assert items[0]["Put"]["Item"] == {"PK": {"S": "1"}, "name": {"S": "b"}}
+    assert items[1]["Put"]["Item"] == {"PK": {"S": "3"}, "name": {"S": "new"}}
+    assert items[2]["Delete"]["Key"] == {"PK": {"S": "4"}}
+    assert session.object_registry.get(discarded.ref) is None
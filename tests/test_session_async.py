@@ -1,6 +1,9 @@
+import asyncio
 from typing import Any
 
 from pynamo import Attribute, GetItem, Model, PrimaryIndex, PutItem, Table
+from pynamo.cache import ReadCache
+from pynamo.exceptions import FlushError
 from pynamo.fields import String
 
 from pynamo.session import ScopedSession, AsyncSession, AsyncSessionMaker
@@ -19,3 +22,673 @@ def test_async_scoped_session():
     session2 = scoped()
 
     assert session1 == session2
+
+
+def test_async_session_get_many():
+    class TestClient:
+        async def batch_get_item(self, **kwargs: Any):
+            keys = kwargs["RequestItems"]["mytable"]["Keys"]
+            return {"Responses": {"mytable": keys}}
+
+    session = AsyncSession(client=TestClient())
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    users = asyncio.run(
+        session.get_many([GetItem(User).where(id=str(i)) for i in range(250)])
+    )
+
+    assert len(users) == 250
+    assert users[249].id == "249"  # type: ignore
+
+
+def test_async_session_stream():
+    from pynamo.op import Query
+
+    calls: list[Any] = []
+
+    class TestClient:
+        async def query(self, **kwargs: Any):
+            calls.append(kwargs)
+            page = len(calls)
+            await asyncio.sleep(0)
+            res: dict[str, Any] = {
+                "Items": [
+                    {"PK": {"S": "123"}, "SK": {"S": f"{page}-{i}"}}
+                    for i in range(2)
+                ],
+            }
+            if page < 3:
+                res["LastEvaluatedKey"] = res["Items"][-1]
+            return res
+
+    session = AsyncSession(client=TestClient())
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String), Attribute("SK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+        id = Attribute(String, partition_key=True)
+        name = Attribute(String, sort_key=True)
+
+    async def consume() -> list[Any]:
+        names: list[Any] = []
+        fetched: list[int] = []
+        async for foo in session.stream(Query(Foo).where(Foo.id == "123")):
+            await asyncio.sleep(0)
+            names.append(foo.name)
+            fetched.append(len(calls))
+        return [names, fetched]
+
+    names, fetched = asyncio.run(consume())
+
+    assert names == ["1-0", "1-1", "2-0", "2-1", "3-0", "3-1"]
+    assert fetched[0] == 2
+    assert len(calls) == 3
+
+
+def test_async_session_stream_error():
+    from pynamo.op import Query
+
+    class TestClient:
+        async def query(self, **kwargs: Any):
+            raise RuntimeError("boom")
+
+    session = AsyncSession(client=TestClient())
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    async def consume() -> None:
+        async for _ in session.stream(Query(Foo).where(Foo.id == "123")):
+            pass
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(consume())
+
+
+def test_async_session_scan():
+    from pynamo.op import Scan
+
+    class TestClient:
+        async def scan(self, **kwargs: Any):
+            segment = kwargs["Segment"]
+            page = kwargs.get("ExclusiveStartKey", {"n": 0})["n"]
+            await asyncio.sleep(0)
+            res: dict[str, Any] = {
+                "Items": [{"PK": {"S": f"{segment}-{page}"}}],
+            }
+            if page < 2:
+                res["LastEvaluatedKey"] = {"n": page + 1}
+            return res
+
+    session = AsyncSession(client=TestClient())
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    async def consume() -> list[Any]:
+        return [
+            foo.id async for foo in session.stream(Scan(Foo, total_segments=3))
+        ]
+
+    ids = asyncio.run(consume())
+
+    assert sorted(ids) == [
+        f"{segment}-{page}" for segment in range(3) for page in range(3)
+    ]
+
+
+def test_async_session_save_chunked():
+    requests: list[Any] = []
+
+    class TestClient:
+        async def transact_write_items(self, **kwargs: Any):
+            requests.append(kwargs)
+            return {}
+
+    session = AsyncSession(client=TestClient(), max_concurrency=2)
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    for i in range(250):
+        session.add(User(id=str(i)))
+
+    responses = asyncio.run(session.save(chunked=True))
+
+    assert len(responses) == 3
+    assert [len(r["TransactItems"]) for r in requests] == [100, 100, 50]
+    assert session.pending == {}
+
+
+def test_async_session_save_releases_pending():
+    requests: list[Any] = []
+
+    class TestClient:
+        async def transact_write_items(self, **kwargs: Any):
+            keys = {
+                item["Put"]["Item"]["PK"]["S"]
+                for item in kwargs["TransactItems"]
+            }
+            if "0" in keys:
+                raise RuntimeError("throttled")
+            requests.append(kwargs)
+            return {}
+
+    session = AsyncSession(client=TestClient())
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    for i in range(1, 6):
+        session.add(User(id=str(i)))
+
+    asyncio.run(session.save())
+    asyncio.run(session.save())
+    assert [len(r["TransactItems"]) for r in requests] == [5, 0]
+
+    for i in range(250):
+        session.add(User(id=str(i)))
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(session.save(chunked=True))
+
+    assert len(session.pending) == 100
+    assert "0" in {obj.id for obj in session.objects_to_add}
+
+
+def test_async_session_save_batch():
+    calls: list[Any] = []
+
+    class TestClient:
+        async def batch_write_item(self, **kwargs: Any):
+            calls.append(("batch_write_item", kwargs))
+            return {}
+
+        async def update_item(self, **kwargs: Any):
+            calls.append(("update_item", kwargs))
+            return {}
+
+    session = AsyncSession(client=TestClient())
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+        name = Attribute(String)
+
+    existing = User.from_dynamodb_item({"PK": {"S": "1"}, "name": {"S": "a"}})
+    session.object_registry[existing.ref] = existing
+    existing.name = "b"  # type: ignore
+
+    session.add(User(id="2", name="new"))
+
+    report = asyncio.run(session.save(flush_strategy="batch"))
+
+    assert report.ok
+    assert sorted(name for name, _ in calls) == [
+        "batch_write_item",
+        "update_item",
+    ]
+
+
+def test_async_session_save_batch_report():
+    class TestClient:
+        async def update_item(self, **kwargs: Any):
+            if kwargs["Key"] == {"PK": {"S": "3"}}:
+                raise RuntimeError("throttled")
+            await asyncio.sleep(0)
+            return {"Attributes": {}}
+
+    session = AsyncSession(client=TestClient(), max_concurrency=4)
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+        name = Attribute(String)
+
+    for i in range(10):
+        user = User.from_dynamodb_item({"PK": {"S": str(i)}})
+        session.object_registry[user.ref] = user
+        user.name = "changed"  # type: ignore
+
+    with pytest.raises(FlushError) as excinfo:
+        asyncio.run(session.save(flush_strategy="batch"))
+
+    report = excinfo.value.report
+    assert len(report) == 10
+    assert [result.op.obj.id for result in report.errors] == ["3"]
+    assert isinstance(report.errors[0].error, RuntimeError)
+
+    report = asyncio.run(
+        session.save(flush_strategy="batch", raise_on_errors=False)
+    )
+
+    assert [result.op.obj.id for result in report.errors] == ["3"]
+
+    with pytest.raises(FlushError):
+        report.raise_for_errors()
+
+
+def test_async_session_get_item_single_flight():
+    calls = 0
+
+    class TestClient:
+        async def get_item(self, **kwargs: Any):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"Item": {**kwargs["Key"], "name": {"S": "hot"}}}
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+        name = Attribute(String)
+
+    session = AsyncSession(client=TestClient())
+
+    async def read_all() -> list[Any]:
+        return await asyncio.gather(
+            *[
+                session.get_item(GetItem(User).where(id="hot"))
+                for _ in range(200)
+            ]
+        )
+
+    users = asyncio.run(read_all())
+
+    assert calls == 1
+    assert all(user is users[0] for user in users)
+
+    cache = ReadCache()
+    sessions = [
+        AsyncSession(client=TestClient(), cache=cache) for _ in range(5)
+    ]
+
+    async def read_from_sessions() -> list[Any]:
+        return await asyncio.gather(
+            *[
+                sessions[i % 5].get_item(GetItem(User).where(id="shared"))
+                for i in range(50)
+            ]
+        )
+
+    users = asyncio.run(read_from_sessions())
+
+    assert calls == 2
+    assert len({id(user) for user in users}) == 5
+    assert cache.in_flight == {}
+
+
+def test_async_session_get_item_single_flight_error():
+    calls = 0
+
+    class TestClient:
+        async def get_item(self, **kwargs: Any):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("throttled")
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    session = AsyncSession(client=TestClient())
+
+    async def read_all() -> list[Any]:
+        return await asyncio.gather(
+            *[session.get_item(GetItem(User).where(id="1")) for _ in range(3)],
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(read_all())
+
+    assert calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_async_session_get_item_single_flight_cancel():
+    calls = 0
+
+    class TestClient:
+        async def get_item(self, **kwargs: Any):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"Item": {**kwargs["Key"], "name": {"S": "hot"}}}
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+        name = Attribute(String)
+
+    session = AsyncSession(client=TestClient())
+
+    async def read_all() -> list[Any]:
+        leader = asyncio.ensure_future(
+            session.get_item(GetItem(User).where(id="1"))
+        )
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.ensure_future(session.get_item(GetItem(User).where(id="1")))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        return await asyncio.gather(leader, *waiters, return_exceptions=True)
+
+    leader, *users = asyncio.run(read_all())
+
+    assert calls == 1
+    assert isinstance(leader, asyncio.CancelledError)
+    assert [user.name for user in users] == ["hot"] * 3
+    assert session._in_flight == {}  # type: ignore
+
+
+def test_async_session_batches_point_reads():
+    requests: list[Any] = []
+
+    class TestClient:
+        async def batch_get_item(self, **kwargs: Any):
+            requests.append(kwargs)
+            return {
+                "Responses": {
+                    "mytable": [
+                        {**key, "name": {"S": "batched"}}
+                        for key in kwargs["RequestItems"]["mytable"]["Keys"]
+                        if key["PK"]["S"] != "missing"
+                    ]
+                }
+            }
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+        name = Attribute(String)
+
+    session = AsyncSession(client=TestClient(), batch_window=0)
+
+    async def resolve() -> list[Any]:
+        return await asyncio.gather(
+            *[
+                session.get_item(GetItem(User).where(id=str(i % 150)))
+                for i in range(300)
+            ],
+            session.get_item(GetItem(User).where(id="missing")),
+        )
+
+    users = asyncio.run(resolve())
+
+    assert [len(r["RequestItems"]["mytable"]["Keys"]) for r in requests] == [
+        100,
+        51,
+    ]
+    assert users[-1] is None
+    assert [user.id for user in users[:150]] == [str(i) for i in range(150)]
+    assert users[0] is users[150]
+
+    requests.clear()
+    session = AsyncSession(client=TestClient(), batch_window=0.05)
+
+    async def read_later(id: str, delay: float) -> Any:
+        await asyncio.sleep(delay)
+        return await session.get_item(GetItem(User).where(id=id))
+
+    async def resolve_over_window() -> list[Any]:
+        return await asyncio.gather(read_later("1", 0), read_later("2", 0.001))
+
+    users = asyncio.run(resolve_over_window())
+
+    assert len(requests) == 1
+    assert [user.name for user in users] == ["batched", "batched"]
+
+
+def test_async_session_execute_ops():
+    from pynamo.op import (
+        BatchGetItem,
+        DeleteItem,
+        Query,
+        Scan,
+        TransactWriteItems,
+        UpdateItem,
+    )
+
+    calls: list[Any] = []
+
+    class TestClient:
+        def __getattr__(self, method: str):
+            async def call(**kwargs: Any):
+                calls.append(method)
+                if method == "query" or method == "scan":
+                    return {"Items": [{"PK": {"S": "1"}}]}
+                if method == "batch_get_item":
+                    keys = kwargs["RequestItems"]["mytable"]["Keys"]
+                    return {"Responses": {"mytable": keys}}
+                return {}
+
+            return call
+
+    session = AsyncSession(client=TestClient())
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+        name = Attribute(String, nullable=True)
+
+    async def run() -> list[Any]:
+        user = User(id="1", name="a")
+        put = await session.execute(PutItem(user))
+        user.name = "b"
+        updated = await session.execute(UpdateItem(user))
+        queried = await session.execute(Query(User).where(User.id == "1"))
+        scanned = await session.execute(Scan(User))
+        await session.execute(DeleteItem(user))
+        fetched = await session.execute(
+            BatchGetItem(GetItem(User).where(id="2"))
+        )
+        await session.execute(TransactWriteItems(PutItem(User(id="3"))))
+        return [put, updated, queried, scanned, fetched]
+
+    put, updated, queried, scanned, fetched = asyncio.run(run())
+
+    assert calls == [
+        "put_item",
+        "update_item",
+        "query",
+        "scan",
+        "delete_item",
+        "batch_get_item",
+        "transact_write_items",
+    ]
+    assert put is updated
+    assert [user.id for user in queried] == ["1"]
+    assert [user.id for user in scanned] == ["1"]
+    assert [user.id for user in fetched] == ["2"]
+    assert ("User", "1", None) not in session.object_registry
+    assert ("User", "3", None) in session.object_registry
+
+
+def test_async_session_update_item_where():
+    from pynamo.op import UpdateItem
+
+    calls: list[Any] = []
+
+    class TestClient:
+        async def update_item(self, **kwargs: Any):
+            calls.append(("update_item", kwargs))
+            if kwargs["Key"] == {"PK": {"S": "2"}}:
+                return {}
+            return {
+                "Attributes": {
+                    "PK": {"S": "1"},
+                    "name": {"S": "b"},
+                    "email": {"S": "a@example.com"},
+                }
+            }
+
+        async def get_item(self, **kwargs: Any):
+            calls.append(("get_item", kwargs))
+            return {"Item": {"PK": kwargs["Key"]["PK"], "name": {"S": "c"}}}
+
+        async def transact_write_items(self, **kwargs: Any):
+            calls.append(("transact_write_items", kwargs))
+            return {}
+
+    session = AsyncSession(client=TestClient())
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+        name = Attribute(String)
+        email = Attribute(String, nullable=True)
+
+    async def run() -> list[Any]:
+        updated = await session.execute(
+            UpdateItem.where(User.id == "1", User.name == "b")
+        )
+        fetched = await session.get_item(GetItem(User).where(id="1"))
+
+        await session.execute(
+            UpdateItem.where(User.id == "2", User.name == "c")
+        )
+        other = await session.get_item(GetItem(User).where(id="2"))
+
+        await session.save()
+        return [updated, fetched, other]
+
+    updated, fetched, other = asyncio.run(run())
+
+    assert fetched is updated
+    assert (fetched.name, fetched.email) == ("b", "a@example.com")
+    assert other.name == "c"
+    assert [name for name, _ in calls] == [
+        "update_item",
+        "update_item",
+        "get_item",
+        "transact_write_items",
+    ]
+    assert calls[-1][1]["TransactItems"] == []
+
+
+def test_async_session_max_in_flight():
+    in_flight = 0
+    peak = 0
+
+    class TestClient:
+        async def get_item(self, **kwargs: Any):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return {"Item": kwargs["Key"]}
+
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    async def run(sessions: list[AsyncSession]) -> None:
+        await asyncio.gather(
+            *[
+                sessions[i % len(sessions)].get_item(
+                    GetItem(User).where(id=str(i))
+                )
+                for i in range(50)
+            ]
+        )
+
+    asyncio.run(run([AsyncSession(client=TestClient(), max_in_flight=4)]))
+    assert peak == 4
+
+    peak = 0
+    maker = AsyncSessionMaker(
+        client=TestClient(), max_in_flight=6, max_in_flight_per_session=5
+    )
+    sessions = [maker() for _ in range(5)]
+    # The semaphores are created inside the loop the sessions run on.
+    assert maker._limiter is None  # type: ignore
+    assert sessions[0]._semaphore is None  # type: ignore
+
+    asyncio.run(run(sessions))
+    assert peak == 6
@@ -0,0 +1,67 @@
+import pytest
+
+from pynamo import Attribute, Model, PrimaryIndex, PutItem, Table
+from pynamo.exceptions import RequestLimitError
+from pynamo.fields import String
+from pynamo.limits import check_transact_write_items, request_size
+from pynamo.op import DeleteItem, TransactWriteItems
+
+
+def test_transact_write_items():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+
+    request = TransactWriteItems(
+        PutItem(User(id="1")),
+        DeleteItem(User(id="2")),
+    )
+
+    assert request.to_dynamodb() == {
+        "TransactItems": [
+            {
+                "Put": {
+                    "TableName": "mytable",
+                    "Item": {"PK": {"S": "1"}},
+                    "ReturnValues": "NONE",
+                }
+            },
+            {"Delete": {"TableName": "mytable", "Key": {"PK": {"S": "2"}}}},
+        ]
+    }
+
+
+def test_transact_write_items_chunks():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class User(Model):
+        __table__ = mytable
+        id = Attribute(String, primary_key=True)
+        email = Attribute(String)
+
+    request = TransactWriteItems(
+        *[PutItem(User(id=str(i), email="a" * 100)) for i in range(250)],
+    )
+
+    chunks = request.chunks()
+    assert [len(c["TransactItems"]) for c in chunks] == [100, 100, 50]
+    for chunk in chunks:
+        check_transact_write_items(chunk)
+
+    chunks = request.chunks(max_bytes=2000)
+    assert all(request_size(chunk) <= 2000 for chunk in chunks)
+    assert sum(len(c["TransactItems"]) for c in chunks) == 250
+
+    with pytest.raises(RequestLimitError):
+        request.chunks(max_bytes=100)
+
+    with pytest.raises(RequestLimitError):
+        check_transact_write_items(request.to_dynamodb())
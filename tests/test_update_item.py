@@ -34,3 +34,81 @@ def test_update_item():
     assert req["UpdateExpression"] == "SET #ATTR0 = :ATTR0"
     assert req["ExpressionAttributeValues"][":ATTR0"] == {"S": "ChangedName"}
     assert req["ReturnValues"] == "ALL_NEW"
+
+
+def test_update_item_where():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String), Attribute("SK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+
+        id = Attribute("foo_id", String, partition_key=True)
+        sort = Attribute(String, sort_key=True, prefix="SORT#")
+        name = Attribute(String)
+
+    req = UpdateItem.where(
+        Foo.id == "1", Foo.sort == "2", Foo.name == "changed"
+    ).to_dynamodb()
+
+    assert req["Key"] == {"PK": {"S": "1"}, "SK": {"S": "SORT#2"}}
+    assert req["UpdateExpression"] == "SET #ATTR0 = :ATTR0"
+    assert req["ExpressionAttributeNames"] == {"#ATTR0": "name"}
+    assert req["ExpressionAttributeValues"] == {":ATTR0": {"S": "changed"}}
+
+    # The first assignments of a constructed instance are not changes, and
+    # the key of an item is never updated.
+    foo = Foo()
+    foo.id = "1"  # type: ignore
+    foo.name = "name"  # type: ignore
+    assert foo.modified_attrs == set()
+    assert not foo.maybe_modified
+
+    foo.id = "2"  # type: ignore
+    foo.name = "changed"  # type: ignore
+    assert foo.modified_attrs == {"name"}
+
+
+def test_update_item_template_cache():
+    mytable = Table(
+        "mytable",
+        PrimaryIndex(Attribute("PK", String)),
+    )
+
+    class Foo(Model):
+        __table__ = mytable
+
+        id = Attribute(String, primary_key=True)
+        status = Attribute(String)
+        name = Attribute(String)
+
+    first = Foo(id="1", status="new", name="first")
+    second = Foo(id="2", status="new", name="second")
+
+    first.status = "done"  # type: ignore
+    first.name = "First"  # type: ignore
+    second.name = "Second"  # type: ignore
+    second.status = "failed"  # type: ignore
+
+    first_req = UpdateItem(first).to_dynamodb()
+    second_req = UpdateItem(second).to_dynamodb()
+
+    assert first_req["UpdateExpression"] is second_req["UpdateExpression"]
+    assert list(Foo.__templates__) == [("update", {"name", "status"})]
+    assert second_req["UpdateExpression"] == (
+        "SET #ATTR0 = :ATTR0, #ATTR1 = :ATTR1"
+    )
+    assert second_req["ExpressionAttributeNames"] == {
+        "#ATTR0": "name",
+        "#ATTR1": "status",
+    }
+    assert second_req["ExpressionAttributeValues"] == {
+        ":ATTR0": {"S": "Second"},
+        ":ATTR1": {"S": "failed"},
+    }
+    assert first_req["ExpressionAttributeValues"] == {
+        ":ATTR0": {"S": "First"},
+        ":ATTR1": {"S": "done"},
+    }